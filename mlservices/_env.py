@@ -0,0 +1,19 @@
+"""
+Environment for the test scripts: mlservices/.env parsed once at import, with real environment variables taking precedence
+"""
+import os
+from types import MappingProxyType
+
+from dotenv import dotenv_values
+
+ENV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+
+# Keys declared without a value parse as None and are dropped, as load_dotenv does
+ENV = MappingProxyType({
+    **{key: value for key, value in dotenv_values(ENV_PATH).items() if value is not None},
+    **os.environ
+})
+
+def getenv(key, default=None):
+    """os.getenv over the merged .env and process environment"""
+    return ENV.get(key, default)
@@ -0,0 +1,16 @@
+"""
+Memoized assignment generation shared by the generator test scripts
+"""
+import json
+from functools import lru_cache
+
+from src.free_ai_generator import free_ai_generator
+
+@lru_cache(maxsize=128)
+def _generate_assignment_json(board, subject, grade, topic, difficulty):
+    # Stored as JSON so the cached result cannot be mutated through a caller's copy
+    return json.dumps(free_ai_generator.generate_assignment(board, subject, grade, topic, difficulty))
+
+def generate_assignment(board, subject, grade, topic, difficulty):
+    """free_ai_generator.generate_assignment, generated once per argument tuple"""
+    return json.loads(_generate_assignment_json(board, subject, grade, topic, difficulty))
@@ -0,0 +1,48 @@
+"""
+Shared HTTP session and output helpers for the service test scripts
+"""
+import atexit
+import json
+import socket
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled keep-alive session instead of a fresh connection per requests.post call
+# The services run uvicorn with httptools, which serves HTTP/1.1 only, so an HTTP/2 client would not multiplex here
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.2))
+session.mount("http://", adapter)
+session.mount("https://", adapter)
+atexit.register(session.close)
+
+# (connect, read) timeouts for posts to the local services
+TIMEOUT = (3.05, 30)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def read_json(response):
+    """Parse a response body straight from its bytes, without decoding it to str first"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+def print_json(data):
+    """Pretty-print a payload with two-space indentation"""
+    if ORJSON_AVAILABLE:
+        print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(data, indent=2))
+
+def reachable(host, port, timeout=0.1):
+    """Whether a TCP connection to host:port opens within timeout seconds"""
+    try:
+        socket.create_connection((host, port), timeout=timeout).close()
+        return True
+    except OSError:
+        return False
@@ -0,0 +1,34 @@
+"""
+Buffered output for the test scripts: messages collect in memory and reach stdout in one write per section
+"""
+import logging
+import logging.handlers
+import sys
+
+class _StdoutBuffer(logging.handlers.BufferingHandler):
+    """Holds formatted records until flush, then writes them to stdout with a single call"""
+
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self.setFormatter(logging.Formatter("%(message)s"))
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer:
+                sys.stdout.write("".join(self.format(record) + "\n" for record in self.buffer))
+                sys.stdout.flush()
+                self.buffer.clear()
+        finally:
+            self.release()
+
+_buffer = _StdoutBuffer(capacity=2000)
+
+log = logging.getLogger("mltests")
+log.addHandler(_buffer)
+log.setLevel(logging.INFO)
+log.propagate = False
+
+def flush():
+    """Write everything logged since the last flush; logging also flushes at interpreter exit"""
+    _buffer.flush()
@@ -0,0 +1,40 @@
+"""
+Pooled PostgreSQL connections for the ML service scripts
+"""
+import atexit
+from contextlib import contextmanager
+
+from psycopg2.pool import ThreadedConnectionPool
+
+# One pool per distinct connection config; a config that cannot connect never gets a pool
+_pools = {}
+
+def get_pool(**config):
+    """Return the shared pool for config, opening it on first use"""
+    key = tuple(sorted(config.items()))
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools[key] = ThreadedConnectionPool(minconn=1, maxconn=10, **config)
+    return pool
+
+@contextmanager
+def connection(**config):
+    """Borrow a pooled connection, discarding it instead of returning it if the block fails"""
+    pool = get_pool(**config)
+    conn = pool.getconn()
+    try:
+        yield conn
+    except Exception:
+        pool.putconn(conn, close=True)
+        raise
+    else:
+        conn.rollback()  # Return it idle, outside any transaction
+        pool.putconn(conn)
+
+def close_all():
+    """Close every pooled connection"""
+    for pool in _pools.values():
+        pool.closeall()
+    _pools.clear()
+
+atexit.register(close_all)
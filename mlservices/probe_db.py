@@ -0,0 +1,142 @@
+# ============================================================================
+# CONCURRENT DATABASE PROBE
+# ============================================================================
+# Tries every candidate connection config at once and reports which work;
+# the test_*connection* scripts use it for their credential sweeps
+# ============================================================================
+
+import asyncio
+import math
+import os
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import asyncpg
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    import psycopg2
+    ASYNCPG_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    # uvloop has no Windows build; asyncio's own loop is used there
+    UVLOOP_AVAILABLE = False
+
+if UVLOOP_AVAILABLE:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+PROBE_TIMEOUT = 1.5
+
+# (host, database, passwords in preference order) swept by each script
+CANDIDATE_GROUPS = {
+    'simple': ('127.0.0.1', 'edtech_platform', ('your_password', '', 'postgres', 'password', '1234', 'admin', 'root')),
+    'backend': ('localhost', 'edtech_platform', ('your_password', '', 'postgres')),
+    'training': ('localhost', 'school_management', ('1234', 'password', ''))
+}
+
+@lru_cache(maxsize=None)
+def _candidate_configs(host, database, passwords, user, port, env_password):
+    if env_password:
+        passwords = (env_password,) + tuple(p for p in passwords if p != env_password)
+    
+    return tuple(
+        MappingProxyType({'host': host, 'port': port, 'database': database, 'user': user, 'password': password})
+        for password in passwords
+    )
+
+def candidate_configs(host, database, passwords, user='postgres', port=5432):
+    """Read-only connection configs for each password, with any password from the environment first"""
+    env_password = os.getenv('DB_PASSWORD') or os.getenv('PGPASSWORD')
+    return _candidate_configs(host, database, tuple(passwords), user, port, env_password)
+
+_TABLES_QUERY = """
+    SELECT table_name::text
+    FROM information_schema.tables
+    WHERE table_schema = 'public'
+    AND table_name LIKE $1
+    ORDER BY table_name
+"""
+# psycopg2 takes format-style placeholders
+_TABLES_QUERY_FORMAT = _TABLES_QUERY.replace('$1', '%s')
+
+def _probe_blocking(config, tables_like):
+    conn = psycopg2.connect(**config, connect_timeout=math.ceil(PROBE_TIMEOUT))
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT version();")
+            version = cursor.fetchone()[0]
+        
+        if tables_like is None:
+            return version
+        
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(_TABLES_QUERY_FORMAT, (tables_like,))
+                return version, [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            return version, e
+    finally:
+        conn.close()
+
+async def probe(config, tables_like=None):
+    """Server version for config, or the exception that stopped the connection.
+    
+    With tables_like, the public tables matching that LIKE pattern are listed over the
+    same connection and (version, tables) is returned; tables is the exception if only
+    that query failed.
+    """
+    try:
+        if not ASYNCPG_AVAILABLE:
+            return await asyncio.to_thread(_probe_blocking, config, tables_like)
+        
+        conn = await asyncpg.connect(**config, timeout=PROBE_TIMEOUT)
+        try:
+            version = await conn.fetchval("SELECT version();")
+            if tables_like is None:
+                return version
+            
+            try:
+                return version, [row[0] for row in await conn.fetch(_TABLES_QUERY, tables_like)]
+            except Exception as e:
+                return version, e
+        finally:
+            await conn.close()
+    except Exception as e:
+        return e
+
+def probe_all(configs, tables_like=None):
+    """Probe every config concurrently; results line up with configs"""
+    async def run():
+        return await asyncio.gather(*(probe(config, tables_like) for config in configs))
+    
+    return asyncio.run(run())
+
+def main():
+    configs = [
+        config
+        for group in CANDIDATE_GROUPS.values()
+        for config in candidate_configs(*group)
+    ]
+    
+    print(f"🔍 Probing {len(configs)} connection configs...")
+    print("=" * 50)
+    
+    working = []
+    for config, result in zip(configs, probe_all(configs)):
+        target = f"{config['user']}@{config['host']}:{config['port']}/{config['database']} password '{config['password']}'"
+        if isinstance(result, Exception):
+            print(f"❌ {target}: {str(result)[:50]}...")
+        else:
+            print(f"✅ {target}: {result[:50]}...")
+            working.append(config)
+    
+    if working:
+        print(f"\n🎉 {len(working)} working config(s) found")
+    else:
+        print("\n❌ No working configuration found")
+
+if __name__ == "__main__":
+    main()
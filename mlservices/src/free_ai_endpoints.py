@@ -344,7 +344,7 @@ async def generate_student_portfolio(request: PortfolioRequest):
         raise HTTPException(status_code=503, detail="Free AI generator not available")
     
     try:
-        result = free_ai_generator.generate_student_portfolio(request.dict())
+        result = free_ai_generator.generate_student_portfolio(dict(request))
         
         return {
             "success": True,
@@ -362,7 +362,7 @@ async def generate_parent_newsletter(request: NewsletterRequest):
         raise HTTPException(status_code=503, detail="Free AI generator not available")
     
     try:
-        result = free_ai_generator.generate_parent_newsletter(request.dict())
+        result = free_ai_generator.generate_parent_newsletter(dict(request))
         
         return {
             "success": True,
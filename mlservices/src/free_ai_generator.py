@@ -18,6 +18,96 @@ try:
 except LookupError:
     nltk.download('stopwords')
 
+# Board-specific question and objective templates, built once at import rather than per call
+_BOARD_QUESTIONS = {
+    "CBSE": {
+        "Mathematics": {
+            "12th Grade": {
+                "3D Plane Equation": {
+                    "easy": [
+                        "Find the equation of a plane passing through the point (1, 2, 3) and perpendicular to the vector (2, -1, 4).",
+                        "Determine the distance of the point (3, 4, 5) from the plane 2x - y + 3z = 6.",
+                        "Find the angle between the planes x + y + z = 1 and 2x - y + z = 3."
+                    ],
+                    "medium": [
+                        "Find the equation of a plane passing through three points A(1, 2, 3), B(4, 5, 6), and C(7, 8, 9). Show all steps.",
+                        "Determine the intersection of the planes 2x + y - z = 4 and x - 2y + 3z = 1. Express the result in parametric form.",
+                        "Find the equation of a plane that is parallel to the plane 3x + 2y - z = 7 and passes through the point (2, -1, 4)."
+                    ],
+                    "hard": [
+                        "Prove that the planes 2x + y - z = 3, x - 2y + z = 1, and 3x + 4y - 3z = 5 form a triangular prism. Find its volume.",
+                        "Find the equation of a plane that makes equal angles with the coordinate axes and passes through the point (1, 1, 1).",
+                        "Determine the locus of points equidistant from the planes x + y + z = 1 and 2x + 2y + 2z = 3."
+                    ]
+                },
+                "Vector Algebra": {
+                    "easy": [
+                        "Find the magnitude and direction of the vector (3, 4, 5).",
+                        "Calculate the dot product of vectors (2, -1, 3) and (1, 2, -2).",
+                        "Find the cross product of vectors (1, 0, 0) and (0, 1, 0)."
+                    ],
+                    "medium": [
+                        "Prove that the vectors (1, 2, 3), (2, 3, 4), and (3, 4, 5) are coplanar.",
+                        "Find the angle between the vectors (2, 1, -1) and (1, -2, 3).",
+                        "Show that the vectors (a, b, c), (b, c, a), and (c, a, b) are coplanar if a + b + c = 0."
+                    ],
+                    "hard": [
+                        "Prove that the volume of a tetrahedron formed by four points is one-sixth of the absolute value of the scalar triple product.",
+                        "Find the shortest distance between the skew lines r = (1, 2, 3) + t(1, 1, 1) and r = (4, 5, 6) + s(2, 1, -1).",
+                        "Prove that the vectors a, b, c are linearly independent if and only if their scalar triple product is non-zero."
+                    ]
+                }
+            }
+        }
+    },
+    "ICSE": {
+        "Mathematics": {
+            "12th Grade": {
+                "3D Plane Equation": {
+                    "easy": [
+                        "Find the equation of a plane in normal form passing through the point (2, 3, 4) with normal vector (1, 2, 3).",
+                        "Calculate the perpendicular distance from the origin to the plane 3x + 4y + 5z = 12.",
+                        "Find the equation of a plane parallel to the xy-plane and passing through the point (1, 2, 3)."
+                    ],
+                    "medium": [
+                        "Find the equation of a plane passing through the line of intersection of planes x + y + z = 1 and 2x + 3y + 4z = 5, and parallel to the x-axis.",
+                        "Determine the angle between the planes 2x + y - z = 3 and x + 2y + z = 4.",
+                        "Find the equation of a plane that bisects the angle between the planes x + y + z = 1 and x - y + z = 1."
+                    ],
+                    "hard": [
+                        "Prove that the planes x + y + z = 1, 2x + 2y + 2z = 2, and 3x + 3y + 3z = 3 are coincident.",
+                        "Find the equation of a plane that contains the line (x-1)/2 = (y-2)/3 = (z-3)/4 and is perpendicular to the plane x + y + z = 1.",
+                        "Determine the conditions under which the planes ax + by + cz = d, a'x + b'y + c'z = d', and a''x + b''y + c''z = d'' form a triangular prism."
+                    ]
+                }
+            }
+        }
+    }
+}
+
+_BOARD_OBJECTIVES = {
+    "CBSE": {
+        "Mathematics": {
+            "3D Plane Equation": [
+                "Understand the concept of planes in 3D space",
+                "Learn to find equations of planes in different forms",
+                "Apply vector concepts to solve plane geometry problems",
+                "Develop analytical skills for 3D coordinate geometry"
+            ]
+        }
+    },
+    "ICSE": {
+        "Mathematics": {
+            "3D Plane Equation": [
+                "Master the fundamentals of 3D coordinate geometry",
+                "Apply vector algebra to plane equations",
+                "Solve complex problems involving multiple planes",
+                "Develop mathematical reasoning and proof skills"
+            ]
+        }
+    }
+}
+
 class FreeAIContentGenerator:
     def __init__(self):
         self.student_names = [
@@ -676,6 +766,10 @@ class FreeAIContentGenerator:
             "confidence": random.randint(80, 90)
         }
     
+    def generate_student_report_batch(self, students_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Generate one report per student, in input order"""
+        return [self.generate_student_report(student_data) for student_data in students_data]
+    
     def generate_bulk_reports(self, students_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate multiple student reports at once"""
         reports = []
@@ -1434,75 +1528,8 @@ class FreeAIContentGenerator:
         # Extract grade number from grade string (e.g., "12th Grade" -> 12)
         grade_num = int(''.join(filter(str.isdigit, grade)))
         
-        # Board-specific question templates
-        board_questions = {
-            "CBSE": {
-                "Mathematics": {
-                    "12th Grade": {
-                        "3D Plane Equation": {
-                            "easy": [
-                                "Find the equation of a plane passing through the point (1, 2, 3) and perpendicular to the vector (2, -1, 4).",
-                                "Determine the distance of the point (3, 4, 5) from the plane 2x - y + 3z = 6.",
-                                "Find the angle between the planes x + y + z = 1 and 2x - y + z = 3."
-                            ],
-                            "medium": [
-                                "Find the equation of a plane passing through three points A(1, 2, 3), B(4, 5, 6), and C(7, 8, 9). Show all steps.",
-                                "Determine the intersection of the planes 2x + y - z = 4 and x - 2y + 3z = 1. Express the result in parametric form.",
-                                "Find the equation of a plane that is parallel to the plane 3x + 2y - z = 7 and passes through the point (2, -1, 4)."
-                            ],
-                            "hard": [
-                                "Prove that the planes 2x + y - z = 3, x - 2y + z = 1, and 3x + 4y - 3z = 5 form a triangular prism. Find its volume.",
-                                "Find the equation of a plane that makes equal angles with the coordinate axes and passes through the point (1, 1, 1).",
-                                "Determine the locus of points equidistant from the planes x + y + z = 1 and 2x + 2y + 2z = 3."
-                            ]
-                        },
-                        "Vector Algebra": {
-                            "easy": [
-                                "Find the magnitude and direction of the vector (3, 4, 5).",
-                                "Calculate the dot product of vectors (2, -1, 3) and (1, 2, -2).",
-                                "Find the cross product of vectors (1, 0, 0) and (0, 1, 0)."
-                            ],
-                            "medium": [
-                                "Prove that the vectors (1, 2, 3), (2, 3, 4), and (3, 4, 5) are coplanar.",
-                                "Find the angle between the vectors (2, 1, -1) and (1, -2, 3).",
-                                "Show that the vectors (a, b, c), (b, c, a), and (c, a, b) are coplanar if a + b + c = 0."
-                            ],
-                            "hard": [
-                                "Prove that the volume of a tetrahedron formed by four points is one-sixth of the absolute value of the scalar triple product.",
-                                "Find the shortest distance between the skew lines r = (1, 2, 3) + t(1, 1, 1) and r = (4, 5, 6) + s(2, 1, -1).",
-                                "Prove that the vectors a, b, c are linearly independent if and only if their scalar triple product is non-zero."
-                            ]
-                        }
-                    }
-                }
-            },
-            "ICSE": {
-                "Mathematics": {
-                    "12th Grade": {
-                        "3D Plane Equation": {
-                            "easy": [
-                                "Find the equation of a plane in normal form passing through the point (2, 3, 4) with normal vector (1, 2, 3).",
-                                "Calculate the perpendicular distance from the origin to the plane 3x + 4y + 5z = 12.",
-                                "Find the equation of a plane parallel to the xy-plane and passing through the point (1, 2, 3)."
-                            ],
-                            "medium": [
-                                "Find the equation of a plane passing through the line of intersection of planes x + y + z = 1 and 2x + 3y + 4z = 5, and parallel to the x-axis.",
-                                "Determine the angle between the planes 2x + y - z = 3 and x + 2y + z = 4.",
-                                "Find the equation of a plane that bisects the angle between the planes x + y + z = 1 and x - y + z = 1."
-                            ],
-                            "hard": [
-                                "Prove that the planes x + y + z = 1, 2x + 2y + 2z = 2, and 3x + 3y + 3z = 3 are coincident.",
-                                "Find the equation of a plane that contains the line (x-1)/2 = (y-2)/3 = (z-3)/4 and is perpendicular to the plane x + y + z = 1.",
-                                "Determine the conditions under which the planes ax + by + cz = d, a'x + b'y + c'z = d', and a''x + b''y + c''z = d'' form a triangular prism."
-                            ]
-                        }
-                    }
-                }
-            }
-        }
-        
         # Get board-specific questions for the given parameters
-        board_data = board_questions.get(board, {})
+        board_data = _BOARD_QUESTIONS.get(board, {})
         subject_data = board_data.get(subject, {})
         grade_data = subject_data.get(f"{grade_num}th Grade", {})
         topic_data = grade_data.get(topic, {})
@@ -1572,36 +1599,13 @@ class FreeAIContentGenerator:
     def _generate_board_learning_objectives(self, board: str, subject: str, topic: str) -> List[str]:
         """Generate board-specific learning objectives"""
         
-        board_objectives = {
-            "CBSE": {
-                "Mathematics": {
-                    "3D Plane Equation": [
-                        "Understand the concept of planes in 3D space",
-                        "Learn to find equations of planes in different forms",
-                        "Apply vector concepts to solve plane geometry problems",
-                        "Develop analytical skills for 3D coordinate geometry"
-                    ]
-                }
-            },
-            "ICSE": {
-                "Mathematics": {
-                    "3D Plane Equation": [
-                        "Master the fundamentals of 3D coordinate geometry",
-                        "Apply vector algebra to plane equations",
-                        "Solve complex problems involving multiple planes",
-                        "Develop mathematical reasoning and proof skills"
-                    ]
-                }
-            }
-        }
-        
         # Get board-specific objectives
-        board_data = board_objectives.get(board, {})
+        board_data = _BOARD_OBJECTIVES.get(board, {})
         subject_data = board_data.get(subject, {})
         topic_objectives = subject_data.get(topic, [])
         
         if topic_objectives:
-            return topic_objectives
+            return list(topic_objectives)
         else:
             # Fallback to generic objectives
             return [
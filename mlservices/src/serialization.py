@@ -0,0 +1,52 @@
+"""
+JSON encoding and response timestamps shared by the ML servers and services
+"""
+import json
+import time
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Responses generated within the same window share one timestamp string
+TIMESTAMP_RESOLUTION = 0.5
+
+_timestamp_cache = (None, 0.0)
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib encoder hook for the datetime and numpy values orjson encodes natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+def loads(data: bytes) -> Any:
+    """Parse JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def now_iso() -> str:
+    """Current time in ISO format, refreshed at most every TIMESTAMP_RESOLUTION seconds"""
+    global _timestamp_cache
+    timestamp, checked_at = _timestamp_cache
+    now = time.monotonic()
+    if timestamp is None or now - checked_at >= TIMESTAMP_RESOLUTION:
+        timestamp = datetime.now().isoformat()
+        _timestamp_cache = (timestamp, now)
+    return timestamp
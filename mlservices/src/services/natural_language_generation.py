@@ -3,15 +3,51 @@ from transformers import pipeline, AutoTokenizer, AutoModelForCausalLM
 from typing import Dict, List, Any, Optional
 import logging
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import json
+import os
+import re
+import sys
+
+try:
+    from optimum.bettertransformer import BetterTransformer
+    BETTER_TRANSFORMER_AVAILABLE = True
+except ImportError:
+    BETTER_TRANSFORMER_AVAILABLE = False
+
+from src.serialization import now_iso
+
+# Matches {placeholder} fields in email, communication and report templates
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+# Below this many records bulk reports are rendered in-process
+BULK_REPORT_MIN_RECORDS = 256
+
+# Distilled checkpoints are drop-in replacements for gpt2 / bart-large-cnn
+# (same tokenizers and heads) at roughly half the parameters. Set the
+# NLG_*_MODEL environment variables to fall back to the full-size models.
+DEFAULT_TEXT_GEN_MODEL = os.getenv("NLG_TEXT_GEN_MODEL", "distilgpt2")
+DEFAULT_SUMMARIZER_MODEL = os.getenv("NLG_SUMMARIZER_MODEL", "sshleifer/distilbart-cnn-12-6")
 
 class NaturalLanguageGeneration:
-    def __init__(self):
+    def __init__(self, text_gen_model: str = DEFAULT_TEXT_GEN_MODEL,
+                 summarizer_model: str = DEFAULT_SUMMARIZER_MODEL):
         self.logger = logging.getLogger(__name__)
         
         # Initialize text generation models
-        self.text_generator = pipeline("text-generation", model="gpt2")
-        self.summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
+        self.text_generator = pipeline("text-generation", model=text_gen_model)
+        self.summarizer = pipeline("summarization", model=summarizer_model)
+        
+        # Swap in fused attention kernels where the runtime supports it
+        self._optimize_pipeline(self.text_generator)
+        self._optimize_pipeline(self.summarizer)
+        
+        # Signature is rebuilt per email, keep its fixed parts around
+        self._signature_parts = (
+            sys.intern("\n        Best regards,\n        "),
+            sys.intern("\n        "),
+            sys.intern("\n        "),
+        )
         
         # Load templates
         self.email_templates = self._load_email_templates()
@@ -42,7 +78,7 @@ class NaturalLanguageGeneration:
                 "signature": signature,
                 "email_type": email_type,
                 "recipient": recipient_data.get('name', 'Recipient'),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             
         except Exception as e:
@@ -72,7 +108,7 @@ class NaturalLanguageGeneration:
                 "recommendations": recommendations,
                 "performance_summary": performance_analysis['summary'],
                 "student_name": student_data.get('name', 'Student'),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             
         except Exception as e:
@@ -101,42 +137,68 @@ class NaturalLanguageGeneration:
                 "communication_type": communication_type,
                 "parent_name": parent_data.get('name', 'Parent'),
                 "language": parent_data.get('language_preference', 'english'),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             
         except Exception as e:
             self.logger.error(f"Error generating parent communication: {str(e)}")
             return {"success": False, "error": str(e)}
     
-    def generate_automated_report(self, data: Dict[str, Any], report_type: str) -> Dict[str, Any]:
+    def generate_automated_report(self, data: Dict[str, Any], report_type: str,
+                                  generated_at: Optional[str] = None) -> Dict[str, Any]:
         """Generate automated reports with NLG"""
         
         try:
             # Get report template
             template = self.report_templates.get(report_type, self.report_templates['general'])
             
-            # Generate report content
-            report_content = self._generate_report_content(template, data)
-            
-            # Add insights
-            insights = self._generate_report_insights(data)
-            
-            # Add recommendations
-            recommendations = self._generate_report_recommendations(data)
-            
-            return {
-                "success": True,
-                "report_content": report_content,
-                "insights": insights,
-                "recommendations": recommendations,
-                "report_type": report_type,
-                "generated_at": datetime.now().isoformat()
-            }
+            return self._build_report(template, data, report_type, generated_at or now_iso())
             
         except Exception as e:
             self.logger.error(f"Error generating report: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    def generate_automated_report_batch(self, data_list: List[Dict[str, Any]], 
+                                        report_type: str) -> List[Dict[str, Any]]:
+        """Generate several reports of one type sharing a single timestamp"""
+        
+        generated_at = datetime.now().isoformat()
+        return [self.generate_automated_report(data, report_type, generated_at) for data in data_list]
+    
+    def generate_automated_report_bulk(self, records: List[Dict[str, Any]], report_type: str,
+                                       max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Generate many reports across worker processes
+        
+        Only the template rendering and insight rules run in the workers; the
+        model pipelines stay in this process so CUDA state is never forked.
+        """
+        
+        template = self.report_templates.get(report_type, self.report_templates['general'])
+        generated_at = datetime.now().isoformat()
+        jobs = [(template, data, report_type, generated_at) for data in records]
+        
+        # Process startup outweighs the work for small jobs
+        if len(jobs) < BULK_REPORT_MIN_RECORDS:
+            return [_generate_report_job(job) for job in jobs]
+        
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                return list(executor.map(_generate_report_job, jobs, chunksize=64))
+        except Exception as e:
+            self.logger.error(f"Error generating bulk reports: {str(e)}")
+            return [_generate_report_job(job) for job in jobs]
+    
+    def _optimize_pipeline(self, nlp_pipeline) -> None:
+        """Replace the pipeline model with its BetterTransformer variant"""
+        
+        if not BETTER_TRANSFORMER_AVAILABLE:
+            return
+        
+        try:
+            nlp_pipeline.model = BetterTransformer.transform(nlp_pipeline.model)
+        except Exception as e:
+            self.logger.warning(f"BetterTransformer not applied: {str(e)}")
+    
     def _load_email_templates(self) -> Dict[str, str]:
         """Load email templates"""
         
@@ -250,18 +312,18 @@ class NaturalLanguageGeneration:
                                  context: Dict[str, Any]) -> str:
         """Personalize email content"""
         
-        # Replace placeholders with actual data
-        personalized = template
-        
-        for key, value in recipient_data.items():
-            placeholder = f"{{{key}}}"
-            personalized = personalized.replace(placeholder, str(value))
+        # Replace placeholders with actual data, recipient fields take precedence
+        return self._render_template(template, {**context, **recipient_data})
+    
+    @staticmethod
+    def _render_template(template: str, values: Dict[str, Any]) -> str:
+        """Fill {placeholder} fields in one scan, leaving unknown placeholders untouched"""
         
-        for key, value in context.items():
-            placeholder = f"{{{key}}}"
-            personalized = personalized.replace(placeholder, str(value))
+        def substitute(match):
+            key = match.group(1)
+            return str(values[key]) if key in values else match.group(0)
         
-        return personalized
+        return PLACEHOLDER_PATTERN.sub(substitute, template)
     
     def _generate_subject_line(self, email_type: str, context: Dict[str, Any]) -> str:
         """Generate appropriate subject line"""
@@ -277,11 +339,14 @@ class NaturalLanguageGeneration:
     def _generate_signature(self, recipient_data: Dict[str, Any]) -> str:
         """Generate email signature"""
         
-        return f"""
-        Best regards,
-        {recipient_data.get('teacher_name', 'Teacher')}
-        {recipient_data.get('school_name', 'School')}
-        """
+        prefix, separator, suffix = self._signature_parts
+        return "".join((
+            prefix,
+            str(recipient_data.get('teacher_name', 'Teacher')),
+            separator,
+            str(recipient_data.get('school_name', 'School')),
+            suffix,
+        ))
     
     def _analyze_performance(self, performance_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze student performance data"""
@@ -380,14 +445,8 @@ class NaturalLanguageGeneration:
                                        context: Dict[str, Any]) -> str:
         """Personalize parent communication"""
         
-        content = template
-        
         # Replace placeholders
-        for key, value in context.items():
-            placeholder = f"{{{key}}}"
-            content = content.replace(placeholder, str(value))
-        
-        return content
+        return self._render_template(template, context)
     
     def _apply_cultural_considerations(self, content: str, language: str) -> str:
         """Apply cultural considerations to communication"""
@@ -404,19 +463,38 @@ class NaturalLanguageGeneration:
         
         return content
     
-    def _generate_report_content(self, template: str, data: Dict[str, Any]) -> str:
-        """Generate report content"""
+    @staticmethod
+    def _build_report(template: str, data: Dict[str, Any], report_type: str, 
+                      generated_at: str) -> Dict[str, Any]:
+        """Assemble a report from its template without touching the models"""
         
-        content = template
+        # Generate report content
+        report_content = NaturalLanguageGeneration._generate_report_content(template, data)
         
-        # Replace placeholders with data
-        for key, value in data.items():
-            placeholder = f"{{{key}}}"
-            content = content.replace(placeholder, str(value))
+        # Add insights
+        insights = NaturalLanguageGeneration._generate_report_insights(data)
         
-        return content
+        # Add recommendations
+        recommendations = NaturalLanguageGeneration._generate_report_recommendations(data)
+        
+        return {
+            "success": True,
+            "report_content": report_content,
+            "insights": insights,
+            "recommendations": recommendations,
+            "report_type": report_type,
+            "generated_at": generated_at
+        }
     
-    def _generate_report_insights(self, data: Dict[str, Any]) -> List[str]:
+    @staticmethod
+    def _generate_report_content(template: str, data: Dict[str, Any]) -> str:
+        """Generate report content"""
+        
+        # Replace placeholders with data
+        return NaturalLanguageGeneration._render_template(template, data)
+    
+    @staticmethod
+    def _generate_report_insights(data: Dict[str, Any]) -> List[str]:
         """Generate report insights"""
         
         insights = []
@@ -437,7 +515,8 @@ class NaturalLanguageGeneration:
         
         return insights
     
-    def _generate_report_recommendations(self, data: Dict[str, Any]) -> List[str]:
+    @staticmethod
+    def _generate_report_recommendations(data: Dict[str, Any]) -> List[str]:
         """Generate report recommendations"""
         
         recommendations = []
@@ -462,4 +541,13 @@ class NaturalLanguageGeneration:
         else:
             performance_level = "needs improvement"
         
-        return f"Student shows {performance_level} performance with {trend} trend and {attendance*100:.1f}% attendance." 
\ No newline at end of file
+        return f"Student shows {performance_level} performance with {trend} trend and {attendance*100:.1f}% attendance." 
+
+def _generate_report_job(job) -> Dict[str, Any]:
+    """Worker entry point for generate_automated_report_bulk"""
+    
+    template, data, report_type, generated_at = job
+    try:
+        return NaturalLanguageGeneration._build_report(template, data, report_type, generated_at)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
@@ -3,10 +3,133 @@ import pandas as pd
 from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
 from sentence_transformers import SentenceTransformer
 import torch
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Tuple
+from collections import Counter
+from functools import lru_cache
+import asyncio
 import logging
 from datetime import datetime
 
+# Common stop words skipped during key phrase extraction
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+# Letter grades from lowest to highest and the lower bounds of D, C, B and A
+GRADE_LETTERS = ('F', 'D', 'C', 'B', 'A')
+GRADE_CUTOFFS = np.array([60, 70, 80, 90])
+
+# Longest text, in tokens, the summarizer is given in one piece; longer texts are chunked
+SUMMARY_WINDOW = 900
+
+@lru_cache(maxsize=2048)
+def _extract_key_phrases_cached(text: str) -> Tuple[str, ...]:
+    """Top five frequent words in text, memoized for repeated boilerplate messages"""
+    
+    # Simple key phrase extraction using frequency and importance
+    word_freq = Counter(word for word in text.lower().split() if word not in STOP_WORDS and len(word) > 3)
+    return tuple(word for word, freq in word_freq.most_common(5))
+
+ATTENDANCE_REPORT_TEMPLATE = """
+        Attendance Report for {class_name}
+        
+        Summary:
+        - Total Students: {total_students}
+        - Present: {present_count}
+        - Attendance Rate: {attendance_rate:.1f}%
+        
+        Key Insights:
+        - {insights}
+        
+        Recommendations:
+        - {recommendations}
+        """
+
+PERFORMANCE_REPORT_TEMPLATE = """
+        Performance Report for {student_name}
+        
+        Summary:
+        - Average Grade: {average_grade:.2f}
+        - Total Assignments: {total_assignments}
+        - Grade Distribution: {grade_distribution}
+        
+        Key Insights:
+        - {insights}
+        
+        Recommendations:
+        - {recommendations}
+        """
+
+class _Batcher:
+    """Coalesce concurrent single-item requests into one batched pipeline call"""
+    
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], 
+                 max_batch: int = 32, max_wait_ms: float = 5):
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its slot in the next batch"""
+        
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queue and worker are bound to the loop that created them
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+    
+    async def _run(self):
+        """Drain up to max_batch items or until max_wait elapses, then run them together"""
+        
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            items = [item for item, _ in batch]
+            try:
+                # Pipelines are blocking, keep the event loop free while they run
+                results = await loop.run_in_executor(None, self.batch_fn, items)
+            except Exception as e:
+                # Rerun the items one by one so a bad item fails only its own caller
+                results = [e] if len(items) == 1 else await loop.run_in_executor(None, self._run_each, items)
+            
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+    
+    def _run_each(self, items: List[Any]) -> List[Any]:
+        """Run batch_fn per item, returning each item's result or the exception it raised"""
+        
+        results = []
+        for item in items:
+            try:
+                results.append(self.batch_fn([item])[0])
+            except Exception as e:
+                results.append(e)
+        return results
+
 class NLPServices:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -21,6 +144,21 @@ class NLPServices:
         
         # Template-based report generator
         self.report_templates = self._load_report_templates()
+        
+        # Micro-batchers for concurrent async callers
+        self._summary_batcher = _Batcher(self._summarize_batch)
+        self._sentiment_batcher = _Batcher(self._sentiment_batch)
+    
+    async def summarize(self, text: str) -> str:
+        """Summarize text, batched with other concurrent callers"""
+        
+        result = await self._summary_batcher.submit(text)
+        return result['summary_text']
+    
+    async def analyze_sentiment(self, text: str) -> Dict[str, Any]:
+        """Classify sentiment of text, batched with other concurrent callers"""
+        
+        return await self._sentiment_batcher.submit(text)
     
     def generate_automated_report(self, data: Dict[str, Any], report_type: str) -> Dict[str, Any]:
         """Generate automated reports using NLP"""
@@ -73,10 +211,10 @@ class NLPServices:
         try:
             analysis_results = []
             
-            for message in messages:
-                # Sentiment analysis
-                sentiment = self.sentiment_analyzer(message['content'])
-                
+            # Sentiment for all messages in length-bucketed batches
+            sentiments = self._bucketed_sentiment([message['content'] for message in messages])
+            
+            for message, sentiment in zip(messages, sentiments):
                 # Communication style analysis
                 style = self._analyze_communication_style(message['content'])
                 
@@ -85,7 +223,7 @@ class NLPServices:
                 
                 analysis_results.append({
                     'message_id': message.get('id'),
-                    'sentiment': sentiment[0],
+                    'sentiment': sentiment,
                     'communication_style': style,
                     'urgency_level': urgency,
                     'key_topics': self._extract_key_phrases(message['content'])
@@ -111,7 +249,7 @@ class NLPServices:
         
         try:
             # Generate summary
-            summary = self.summarizer(text_content, max_length=130, min_length=30, do_sample=False)
+            summary = self._summarize_long_text(text_content)
             
             # Extract key points
             key_points = self._extract_key_points(text_content)
@@ -131,32 +269,149 @@ class NLPServices:
             self.logger.error(f"Error generating summary: {str(e)}")
             return {"error": "Failed to generate summary"}
     
+    def _iter_token_windows(self, text: str, window: int = SUMMARY_WINDOW, overlap: int = 50):
+        """Yield overlapping chunks of text that each fit in the summarizer's context"""
+        
+        tokenizer = self.summarizer.tokenizer
+        token_ids = tokenizer(text, add_special_tokens=False)['input_ids']
+        step = window - overlap
+        
+        for start in range(0, max(len(token_ids) - overlap, 1), step):
+            yield tokenizer.decode(token_ids[start:start + window], skip_special_tokens=True)
+    
+    def _summarize_long_text(self, text: str) -> List[Dict[str, Any]]:
+        """Map-reduce summarization: summarize chunks in one batch, then summarize the joined result"""
+        
+        chunks = list(self._iter_token_windows(text))
+        if len(chunks) <= 1:
+            return self.summarizer(text, max_length=130, min_length=30, do_sample=False)
+        
+        partial = self.summarizer(chunks, batch_size=4, max_length=130, min_length=30, do_sample=False)
+        combined = " ".join(item['summary_text'] for item in partial)
+        return self.summarizer(combined, max_length=130, min_length=30, do_sample=False, truncation=True)
+    
+    def _summarize_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run the summarizer once over the texts that fit its context; longer ones are chunked"""
+        
+        lengths = [len(ids) for ids in self.summarizer.tokenizer(texts, add_special_tokens=False)['input_ids']]
+        fitting = [i for i, length in enumerate(lengths) if length <= SUMMARY_WINDOW]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        if fitting:
+            batch = self.summarizer([texts[i] for i in fitting], batch_size=len(fitting),
+                                    max_length=130, min_length=30, do_sample=False, truncation=True)
+            for i, result in zip(fitting, batch):
+                results[i] = result
+        
+        for i, length in enumerate(lengths):
+            if length > SUMMARY_WINDOW:
+                results[i] = self._summarize_long_text(texts[i])[0]
+        
+        return results
+    
+    def _sentiment_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run the sentiment analyzer once over a batch of texts"""
+        
+        return self.sentiment_analyzer(texts, batch_size=len(texts))
+    
+    def _bucketed_sentiment(self, texts: List[str], batch_size: int = 32) -> List[Dict[str, Any]]:
+        """Run sentiment over texts grouped by token length to avoid padding waste"""
+        
+        if not texts:
+            return []
+        
+        # Sort by token length so each batch pads only to its own longest member
+        lengths = [len(ids) for ids in self.sentiment_analyzer.tokenizer(texts, truncation=True)['input_ids']]
+        order = np.argsort(lengths, kind='stable')
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        for start in range(0, len(order), batch_size):
+            indices = order[start:start + batch_size]
+            batch = self._sentiment_batch([texts[i] for i in indices])
+            for i, result in zip(indices, batch):
+                results[i] = result
+        
+        return results
+    
+    def generate_vectorized_report_batch(self, data_list: List[Dict[str, Any]], 
+                                         report_type: str) -> List[Dict[str, Any]]:
+        """Generate reports for many classes/students with metrics computed in one pass"""
+        
+        try:
+            if not data_list:
+                return []
+            
+            generated_at = datetime.now().isoformat()
+            
+            if report_type == "attendance_report":
+                records = [data.get('attendance_data', []) for data in data_list]
+                owners = np.repeat(np.arange(len(records)), [len(r) for r in records])
+                present = np.array([a.get('status') == 'present' for r in records for a in r], dtype=float)
+                
+                totals = np.bincount(owners, minlength=len(records))
+                present_counts = np.bincount(owners, weights=present, minlength=len(records)).astype(int)
+                rates = np.divide(present_counts * 100, totals, out=np.zeros(len(records)), where=totals > 0)
+                
+                return [
+                    self._build_attendance_report(data, int(total), int(count), float(rate), generated_at)
+                    for data, total, count, rate in zip(data_list, totals, present_counts, rates)
+                ]
+            
+            if report_type == "performance_report":
+                records = [data.get('performance_data', []) for data in data_list]
+                owners = np.repeat(np.arange(len(records)), [len(r) for r in records])
+                grades = np.array([p.get('grade', 0) for r in records for p in r], dtype=float)
+                
+                counts = np.bincount(owners, minlength=len(records))
+                grade_sums = np.bincount(owners, weights=grades, minlength=len(records))
+                averages = np.divide(grade_sums, counts, out=np.zeros(len(records)), where=counts > 0)
+                
+                # Letter counts for every report at once: one bin per (report, letter) pair
+                letters = np.searchsorted(GRADE_CUTOFFS, grades, side='right')
+                distributions = np.bincount(owners * len(GRADE_LETTERS) + letters,
+                                            minlength=len(records) * len(GRADE_LETTERS)).reshape(len(records), -1)
+                
+                return [
+                    self._build_performance_report(data, float(average), generated_at,
+                                                   self._grade_distribution_from_counts(distribution))
+                    for data, average, distribution in zip(data_list, averages, distributions)
+                ]
+            
+            return [self.generate_automated_report(data, report_type) for data in data_list]
+            
+        except Exception as e:
+            self.logger.error(f"Error generating {report_type} report batch: {str(e)}")
+            return [{"error": f"Failed to generate {report_type} report"} for _ in data_list]
+    
     def _generate_attendance_report(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate automated attendance report"""
         
         attendance_data = data.get('attendance_data', [])
-        class_info = data.get('class_info', {})
         
         # Generate narrative
         total_students = len(attendance_data)
         present_count = sum(1 for a in attendance_data if a.get('status') == 'present')
         attendance_rate = (present_count / total_students) * 100 if total_students > 0 else 0
         
-        # Generate report content
-        report_content = f"""
-        Attendance Report for {class_info.get('class_name', 'Class')}
-        
-        Summary:
-        - Total Students: {total_students}
-        - Present: {present_count}
-        - Attendance Rate: {attendance_rate:.1f}%
+        return self._build_attendance_report(data, total_students, present_count, attendance_rate,
+                                             datetime.now().isoformat())
+    
+    def _build_attendance_report(self, data: Dict[str, Any], total_students: int, present_count: int,
+                                 attendance_rate: float, generated_at: str) -> Dict[str, Any]:
+        """Render an attendance report from precomputed metrics"""
         
-        Key Insights:
-        - {self._generate_attendance_insights(attendance_data)}
+        attendance_data = data.get('attendance_data', [])
+        class_info = data.get('class_info', {})
         
-        Recommendations:
-        - {self._generate_attendance_recommendations(attendance_rate)}
-        """
+        # Generate report content
+        report_content = ATTENDANCE_REPORT_TEMPLATE.format_map({
+            "class_name": class_info.get('class_name', 'Class'),
+            "total_students": total_students,
+            "present_count": present_count,
+            "attendance_rate": attendance_rate,
+            "insights": self._generate_attendance_insights(attendance_data),
+            "recommendations": self._generate_attendance_recommendations(attendance_rate)
+        })
         
         return {
             "report_type": "attendance_report",
@@ -166,35 +421,38 @@ class NLPServices:
                 "present_count": present_count,
                 "attendance_rate": attendance_rate
             },
-            "generated_at": datetime.now().isoformat()
+            "generated_at": generated_at
         }
     
     def _generate_performance_report(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate automated performance report"""
         
         performance_data = data.get('performance_data', [])
-        student_info = data.get('student_info', {})
         
         # Calculate performance metrics
         grades = [p.get('grade', 0) for p in performance_data]
         avg_grade = np.mean(grades) if grades else 0
-        grade_distribution = self._calculate_grade_distribution(grades)
-        
-        # Generate report content
-        report_content = f"""
-        Performance Report for {student_info.get('student_name', 'Student')}
         
-        Summary:
-        - Average Grade: {avg_grade:.2f}
-        - Total Assignments: {len(performance_data)}
-        - Grade Distribution: {grade_distribution}
+        return self._build_performance_report(data, avg_grade, datetime.now().isoformat())
+    
+    def _build_performance_report(self, data: Dict[str, Any], avg_grade: float, generated_at: str,
+                                  grade_distribution: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """Render a performance report from precomputed metrics"""
         
-        Key Insights:
-        - {self._generate_performance_insights(performance_data)}
+        performance_data = data.get('performance_data', [])
+        student_info = data.get('student_info', {})
+        if grade_distribution is None:
+            grade_distribution = self._calculate_grade_distribution([p.get('grade', 0) for p in performance_data])
         
-        Recommendations:
-        - {self._generate_performance_recommendations(avg_grade)}
-        """
+        # Generate report content
+        report_content = PERFORMANCE_REPORT_TEMPLATE.format_map({
+            "student_name": student_info.get('student_name', 'Student'),
+            "average_grade": avg_grade,
+            "total_assignments": len(performance_data),
+            "grade_distribution": grade_distribution,
+            "insights": self._generate_performance_insights(performance_data),
+            "recommendations": self._generate_performance_recommendations(avg_grade)
+        })
         
         return {
             "report_type": "performance_report",
@@ -204,26 +462,24 @@ class NLPServices:
                 "total_assignments": len(performance_data),
                 "grade_distribution": grade_distribution
             },
-            "generated_at": datetime.now().isoformat()
+            "generated_at": generated_at
         }
     
-    def _extract_key_phrases(self, text: str) -> List[str]:
-        """Extract key phrases from text"""
-        
-        # Simple key phrase extraction using frequency and importance
-        words = text.lower().split()
-        word_freq = {}
+    def _calculate_grade_distribution(self, grades: List[float]) -> Dict[str, int]:
+        """Count grades per letter, A (90+) down to F (below 60)"""
         
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
+        letters = np.searchsorted(GRADE_CUTOFFS, np.asarray(grades, dtype=float), side='right')
+        return self._grade_distribution_from_counts(np.bincount(letters, minlength=len(GRADE_LETTERS)))
+    
+    def _grade_distribution_from_counts(self, counts: np.ndarray) -> Dict[str, int]:
+        """Letter-to-count mapping, highest letter first, from counts ordered like GRADE_LETTERS"""
         
-        for word in words:
-            if word not in stop_words and len(word) > 3:
-                word_freq[word] = word_freq.get(word, 0) + 1
+        return {letter: int(counts[i]) for i, letter in reversed(list(enumerate(GRADE_LETTERS)))}
+    
+    def _extract_key_phrases(self, text: str) -> List[str]:
+        """Extract key phrases from text"""
         
-        # Get top key phrases
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, freq in sorted_words[:5]]
+        return list(_extract_key_phrases_cached(text))
     
     def _classify_topics(self, text: str) -> List[str]:
         """Classify topics in text"""
@@ -0,0 +1,72 @@
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def jit(func):
+    """Compile with Numba when installed, otherwise run as plain Python/NumPy"""
+
+    if NUMBA_AVAILABLE:
+        # numpy error model keeps 0/0 -> nan semantics instead of raising
+        return njit(cache=True, nogil=True, error_model='numpy')(func)
+    return func
+
+@jit
+def trend_stats(y: np.ndarray) -> Tuple[float, float, float]:
+    """Least squares slope, intercept and R-squared of y against 0..n-1, all NaN for an empty y"""
+
+    n = y.shape[0]
+    if n == 0:
+        # No points, no fit; callers check for NaN
+        return np.nan, np.nan, np.nan
+    if n < 2:
+        # A single point has no trend; match LinearRegression's flat fit through it
+        return 0.0, float(y[0]), 0.0
+
+    mean_x = (n - 1) / 2.0
+    mean_y = 0.0
+    for i in range(n):
+        mean_y += y[i]
+    mean_y /= n
+
+    sxy = 0.0
+    sxx = 0.0
+    for i in range(n):
+        dx = i - mean_x
+        sxy += dx * (y[i] - mean_y)
+        sxx += dx * dx
+
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+
+    ss_res = 0.0
+    ss_tot = 0.0
+    for i in range(n):
+        residual = y[i] - (intercept + slope * i)
+        ss_res += residual * residual
+        ss_tot += (y[i] - mean_y) * (y[i] - mean_y)
+
+    return slope, intercept, 1.0 - ss_res / ss_tot
+
+@jit
+def zscore_outliers(values: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Indices and absolute z-scores (sample std) of values beyond threshold"""
+
+    n = values.shape[0]
+    mean = 0.0
+    for i in range(n):
+        mean += values[i]
+    mean /= n
+
+    variance = 0.0
+    for i in range(n):
+        variance += (values[i] - mean) * (values[i] - mean)
+    std = np.sqrt(variance / (n - 1))
+
+    z_scores = np.abs((values - mean) / std)
+    indices = np.flatnonzero(z_scores > threshold)
+    return indices, z_scores[indices]
@@ -2,27 +2,227 @@ import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, precision_recall_fscore_support
 import joblib
 from typing import Dict, List, Any, Optional
 import logging
+import os
+import json
+import hashlib
+import functools
+import inspect
+import threading
 from datetime import datetime, timedelta
 
+try:
+    import onnxruntime
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+try:
+    import treelite
+    import tl2cgen
+    TREELITE_AVAILABLE = True
+except ImportError:
+    TREELITE_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from src.serialization import now_iso
+
+# Loaded models shared by every PredictiveAnalytics instance in the process
+_MODELS: Dict[str, Any] = {}
+_MODELS_LOCK = threading.Lock()
+
+PREDICTION_CACHE_TTL = 3600  # 1 hour cache
+_REDIS_POOL = None
+
+# Model input columns, in training order, with the defaults used for missing values
+DROPOUT_FEATURE_DEFAULTS = {
+    'attendance_rate': 0.5,
+    'average_grade': 0.5,
+    'behavior_incidents': 0,
+    'parent_engagement': 0.5,
+    'socioeconomic_status': 0.5,
+    'previous_school_performance': 0.5,
+    'extracurricular_participation': 0,
+    'peer_relationships': 0.5
+}
+
+PERFORMANCE_FEATURE_DEFAULTS = {
+    'average_grade': 0.5,
+    'attendance_rate': 0.5,
+    'teacher_experience': 0,
+    'class_size': 25,
+    'curriculum_difficulty': 0.5,
+    'student_engagement': 0.5,
+    'parent_involvement': 0.5,
+    'resources_available': 0.5
+}
+
+BURNOUT_FEATURE_DEFAULTS = {
+    'workload_hours': 40,
+    'class_count': 5,
+    'student_count': 150,
+    'years_experience': 5,
+    'satisfaction_score': 0.5,
+    'stress_level': 0.5,
+    'work_life_balance': 0.5,
+    'support_available': 0.5
+}
+
+def _to_builtin(value: Any) -> Any:
+    """JSON fallback for the NumPy scalars and arrays in prediction results"""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def _encode_prediction(result: Dict[str, Any]) -> bytes:
+    """Serialize a prediction for the cache as JSON, leaving out its timestamp"""
+    cached = {key: value for key, value in result.items() if key != 'timestamp'}
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(cached, option=orjson.OPT_SERIALIZE_NUMPY, default=_to_builtin)
+    return json.dumps(cached, default=_to_builtin).encode()
+
+def _decode_prediction(value: bytes, timestamp: str) -> Dict[str, Any]:
+    """Rebuild a cached prediction, stamped with the time it is served"""
+    result = orjson.loads(value) if ORJSON_AVAILABLE else json.loads(value)
+    result['timestamp'] = timestamp
+    return result
+
+def cached_prediction(model_key: str):
+    """Memoize a prediction method in Redis, keyed by a stable hash of its inputs"""
+    
+    def decorator(method):
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            # Key on arguments by parameter name with defaults filled in, so positional,
+            # keyword and omitted-default calls for the same inputs share an entry
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            del arguments['self']
+            return self._cached_predict(model_key, arguments, lambda: method(self, *args, **kwargs))
+        return wrapper
+    
+    return decorator
+
+def compile_feature_extractor(defaults: Dict[str, float]):
+    """Generate a function returning the feature tuple for a record with keys and defaults inlined
+    
+    The generated body is a single tuple of ``d.get(key, default)`` calls with
+    constant arguments, avoiding the per-call list building and loop overhead.
+    """
+    
+    fields = ", ".join(f"get({key!r}, {default!r})" for key, default in defaults.items())
+    source = f"def extract(d):\n    get = d.get\n    return ({fields},)\n"
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace['extract']
+
+DROPOUT_FEATURE_EXTRACTOR = compile_feature_extractor(DROPOUT_FEATURE_DEFAULTS)
+PERFORMANCE_FEATURE_EXTRACTOR = compile_feature_extractor(PERFORMANCE_FEATURE_DEFAULTS)
+BURNOUT_FEATURE_EXTRACTOR = compile_feature_extractor(BURNOUT_FEATURE_DEFAULTS)
+
+# Lower bounds of the medium and high risk bands, a score equal to a bound falls in the upper band
+RISK_LEVELS = np.array(['low', 'medium', 'high'])
+DROPOUT_RISK_THRESHOLDS = np.array([0.4, 0.7])
+BURNOUT_RISK_THRESHOLDS = np.array([0.3, 0.6])
+
+# (field, default when missing, flag values above the limit rather than below, limit, insight)
+BURNOUT_INSIGHT_RULES = (
+    ('workload_hours', 40, True, 50, "Weekly workload is well above a sustainable level"),
+    ('stress_level', 0.5, True, 0.7, "Reported stress level is high"),
+    ('work_life_balance', 0.5, False, 0.4, "Work-life balance is under strain"),
+    ('support_available', 0.5, False, 0.4, "Limited support is available to this teacher")
+)
+
+# Recommendations for the low, medium and high burnout risk levels
+BURNOUT_RECOMMENDATIONS = (
+    [],
+    [
+        "Check in regularly about workload",
+        "Share planning resources to reduce preparation time"
+    ],
+    [
+        "Reduce teaching load or reassign duties",
+        "Schedule a wellbeing conversation with school leadership",
+        "Provide access to counseling or employee assistance",
+        "Pair with a mentor or co-teacher for support"
+    ]
+)
+
+class OnnxModel:
+    """sklearn-compatible predict backed by an ONNX Runtime session"""
+    
+    def __init__(self, session):
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+    
+    def _run(self, X) -> list:
+        return self.session.run(None, {self.input_name: np.asarray(X, dtype=np.float32)})
+    
+    def predict(self, X) -> np.ndarray:
+        return np.ravel(self._run(X)[0])
+
+class OnnxClassifier(OnnxModel):
+    """OnnxModel exposing class probabilities like sklearn's predict_proba"""
+    
+    def predict_proba(self, X) -> np.ndarray:
+        return self._run(X)[1]
+
+class CompiledForestModel:
+    """sklearn-compatible predict backed by a treelite-compiled shared library"""
+    
+    def __init__(self, predictor):
+        self.predictor = predictor
+    
+    def _run(self, X) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float32)
+        return np.asarray(self.predictor.predict(tl2cgen.DMatrix(X))).reshape(len(X), -1)
+    
+    def predict(self, X) -> np.ndarray:
+        return self._run(X)[:, 0]
+
+class CompiledForestClassifier(CompiledForestModel):
+    """CompiledForestModel exposing class probabilities and labels like sklearn"""
+    
+    def __init__(self, predictor, classes: np.ndarray):
+        super().__init__(predictor)
+        self.classes_ = classes
+    
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+    
+    def predict_proba(self, X) -> np.ndarray:
+        return self._run(X)
+
 class PredictiveAnalytics:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.scaler = StandardScaler()
-        
-        # Load pre-trained models
-        self.models = {
-            'dropout_risk': self._load_model('dropout_risk'),
-            'performance_forecast': self._load_model('performance_forecast'),
-            'resource_demand': self._load_model('resource_demand'),
-            'teacher_burnout': self._load_model('teacher_burnout')
-        }
+        
+        # Pre-trained models are loaded on first use and shared process-wide
+        
+        # Shared prediction cache, None when Redis is not reachable
+        self.cache = self._connect_cache()
     
+    @cached_prediction('dropout_risk')
     def predict_student_dropout_risk(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
         """Predict student dropout risk"""
         
@@ -31,7 +231,7 @@ class PredictiveAnalytics:
             features = self._extract_dropout_features(student_data)
             
             # Make prediction
-            model = self.models['dropout_risk']
+            model = self._get_model('dropout_risk')
             risk_score = model.predict_proba(features.reshape(1, -1))[0][1]
             
             # Determine risk level
@@ -50,13 +250,14 @@ class PredictiveAnalytics:
                 "insights": insights,
                 "recommendations": recommendations,
                 "confidence": self._calculate_prediction_confidence(model, features),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             
         except Exception as e:
             self.logger.error(f"Error predicting dropout risk: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    @cached_prediction('performance_forecast')
     def forecast_class_performance(self, class_data: Dict[str, Any], 
                                  forecast_period: int = 30) -> Dict[str, Any]:
         """Forecast class performance over time"""
@@ -66,7 +267,7 @@ class PredictiveAnalytics:
             features = self._extract_performance_features(class_data)
             
             # Make prediction
-            model = self.models['performance_forecast']
+            model = self._get_model('performance_forecast')
             performance_forecast = model.predict(features.reshape(1, -1))[0]
             
             # Generate trend analysis
@@ -81,13 +282,14 @@ class PredictiveAnalytics:
                 "trend_analysis": trend_analysis,
                 "confidence_intervals": confidence_intervals,
                 "forecast_period": forecast_period,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             
         except Exception as e:
             self.logger.error(f"Error forecasting class performance: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    @cached_prediction('resource_demand')
     def predict_resource_demand(self, historical_data: List[Dict], 
                               prediction_days: int = 7) -> Dict[str, Any]:
         """Predict resource demand"""
@@ -101,7 +303,7 @@ class PredictiveAnalytics:
             features = self._extract_resource_features(df)
             
             # Make prediction
-            model = self.models['resource_demand']
+            model = self._get_model('resource_demand')
             demand_forecast = model.predict(features.reshape(1, -1))[0]
             
             # Generate demand patterns
@@ -116,13 +318,14 @@ class PredictiveAnalytics:
                 "demand_patterns": demand_patterns,
                 "recommendations": recommendations,
                 "prediction_days": prediction_days,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             
         except Exception as e:
             self.logger.error(f"Error predicting resource demand: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    @cached_prediction('teacher_burnout')
     def assess_teacher_burnout_risk(self, teacher_data: Dict[str, Any]) -> Dict[str, Any]:
         """Assess teacher burnout risk"""
         
@@ -131,7 +334,7 @@ class PredictiveAnalytics:
             features = self._extract_burnout_features(teacher_data)
             
             # Make prediction
-            model = self.models['teacher_burnout']
+            model = self._get_model('teacher_burnout')
             burnout_risk = model.predict_proba(features.reshape(1, -1))[0][1]
             
             # Determine risk level
@@ -150,54 +353,230 @@ class PredictiveAnalytics:
                 "insights": insights,
                 "recommendations": recommendations,
                 "confidence": self._calculate_prediction_confidence(model, features),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso()
             }
             
         except Exception as e:
             self.logger.error(f"Error assessing teacher burnout: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    def predict_student_dropout_risk_batch(self, students: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Predict dropout risk for many students, serving cached students from Redis"""
+        
+        return self._cached_predict_batch('dropout_risk', 'student_data', students, self._predict_student_dropout_risk_batch)
+    
+    def assess_teacher_burnout_risk_batch(self, teachers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Assess burnout risk for many teachers, serving cached teachers from Redis"""
+        
+        return self._cached_predict_batch('teacher_burnout', 'teacher_data', teachers, self._assess_teacher_burnout_risk_batch)
+    
+    def _predict_student_dropout_risk_batch(self, students: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Predict dropout risk for many students with a single model call"""
+        
+        try:
+            if not students:
+                return []
+            
+            # Extract features
+            raw = pd.DataFrame(students)
+            features = self._extract_features_batch(raw, DROPOUT_FEATURE_DEFAULTS)
+            
+            # Make prediction
+            model = self._get_model('dropout_risk')
+            proba = model.predict_proba(features)
+            risk_scores = proba[:, 1]
+            confidences = proba.max(axis=1)
+            
+            # Determine risk levels
+            risk_levels = self._determine_risk_level(risk_scores)
+            
+            # Generate insights and recommendations
+            insights = self._generate_dropout_insights_batch(raw, risk_scores)
+            recommendations = self._generate_dropout_recommendations_batch(risk_scores)
+            
+            timestamp = now_iso()
+            return [
+                {
+                    "success": True,
+                    "risk_score": float(risk_scores[i]),
+                    "risk_level": str(risk_levels[i]),
+                    "insights": insights[i],
+                    "recommendations": recommendations[i],
+                    "confidence": float(confidences[i]),
+                    "timestamp": timestamp
+                }
+                for i in range(len(students))
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Error predicting dropout risk batch: {str(e)}")
+            return [{"success": False, "error": str(e)} for _ in students]
+    
+    def _assess_teacher_burnout_risk_batch(self, teachers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Assess burnout risk for many teachers with a single model call"""
+        
+        try:
+            if not teachers:
+                return []
+            
+            # Extract features
+            raw = pd.DataFrame(teachers)
+            features = self._extract_features_batch(raw, BURNOUT_FEATURE_DEFAULTS)
+            
+            # Make prediction
+            model = self._get_model('teacher_burnout')
+            proba = model.predict_proba(features)
+            burnout_risks = proba[:, 1]
+            confidences = proba.max(axis=1)
+            
+            # Determine risk levels
+            risk_levels = self._determine_burnout_risk_level(burnout_risks)
+            
+            # Generate insights and recommendations
+            insights = self._generate_burnout_insights_batch(raw, burnout_risks)
+            recommendations = self._generate_burnout_recommendations_batch(burnout_risks)
+            
+            timestamp = now_iso()
+            return [
+                {
+                    "success": True,
+                    "burnout_risk": float(risk),
+                    "risk_level": str(level),
+                    "insights": teacher_insights,
+                    "recommendations": teacher_recommendations,
+                    "confidence": float(confidence),
+                    "timestamp": timestamp
+                }
+                for risk, level, teacher_insights, teacher_recommendations, confidence
+                in zip(burnout_risks, risk_levels, insights, recommendations, confidences)
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Error assessing teacher burnout batch: {str(e)}")
+            return [{"success": False, "error": str(e)} for _ in teachers]
+    
+    def _connect_cache(self):
+        """Connect to the Redis prediction cache"""
+        
+        global _REDIS_POOL
+        
+        if not REDIS_AVAILABLE:
+            return None
+        
+        try:
+            if _REDIS_POOL is None:
+                _REDIS_POOL = redis.ConnectionPool.from_url(os.getenv('REDIS_URL', 'redis://localhost:6379/0'))
+            client = redis.Redis(connection_pool=_REDIS_POOL)
+            client.ping()
+            return client
+        except Exception as e:
+            self.logger.warning(f"Prediction cache disabled, Redis unavailable: {str(e)}")
+            return None
+    
+    def _cache_key(self, model_key: str, payload: Any) -> str:
+        """Generate cache key for prediction inputs"""
+        
+        content = json.dumps(payload, sort_keys=True, default=str)
+        # v2 entries are JSON; the version keeps older pickled values from ever being read
+        return f"prediction:v2:{model_key}:{hashlib.blake2b(content.encode(), digest_size=16).hexdigest()}"
+    
+    def _cached_predict(self, model_key: str, payload: Any, compute) -> Dict[str, Any]:
+        """Return the cached prediction for payload, computing and storing it on a miss"""
+        
+        if self.cache is None:
+            return compute()
+        
+        key = self._cache_key(model_key, payload)
+        try:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return _decode_prediction(cached, now_iso())
+        except Exception as e:
+            self.logger.warning(f"Prediction cache read failed: {str(e)}")
+            return compute()
+        
+        result = compute()
+        
+        # Only successful predictions are worth caching
+        if result.get('success'):
+            try:
+                self.cache.setex(key, PREDICTION_CACHE_TTL, _encode_prediction(result))
+            except Exception as e:
+                self.logger.warning(f"Prediction cache write failed: {str(e)}")
+        
+        return result
+    
+    def _cached_predict_batch(self, model_key: str, parameter: str, records: List[Dict[str, Any]],
+                              compute) -> List[Dict[str, Any]]:
+        """Serve a batch from the cache with one MGET and compute only the misses
+        
+        parameter is the record's argument name on the single-record method.
+        """
+        
+        if self.cache is None or not records:
+            return compute(records)
+        
+        # Same keys as the single-record methods so both paths share entries
+        keys = [self._cache_key(model_key, {parameter: record}) for record in records]
+        try:
+            timestamp = now_iso()
+            results = [_decode_prediction(value, timestamp) if value is not None else None for value in self.cache.mget(keys)]
+        except Exception as e:
+            self.logger.warning(f"Prediction cache read failed: {str(e)}")
+            return compute(records)
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            computed = compute([records[i] for i in missing])
+            for i, result in zip(missing, computed):
+                results[i] = result
+            
+            try:
+                pipe = self.cache.pipeline(transaction=False)
+                for i, result in zip(missing, computed):
+                    if result.get('success'):
+                        pipe.setex(keys[i], PREDICTION_CACHE_TTL, _encode_prediction(result))
+                pipe.execute()
+            except Exception as e:
+                self.logger.warning(f"Prediction cache write failed: {str(e)}")
+        
+        return results
+    
+    def _extract_features_batch(self, raw: pd.DataFrame, defaults: Dict[str, float]) -> np.ndarray:
+        """Build an (N, F) float32 feature matrix in model column order, filling missing values"""
+        
+        # Fill a preallocated buffer one column at a time instead of materializing a reindexed frame
+        features = np.empty((len(raw), len(defaults)), dtype=np.float32)
+        for j, (column, default) in enumerate(defaults.items()):
+            if column in raw:
+                features[:, j] = raw[column].fillna(default).to_numpy(dtype=np.float32)
+            else:
+                features[:, j] = default
+        
+        return features
+    
     def _extract_dropout_features(self, student_data: Dict[str, Any]) -> np.ndarray:
         """Extract features for dropout prediction"""
         
-        features = [
-            student_data.get('attendance_rate', 0.5),
-            student_data.get('average_grade', 0.5),
-            student_data.get('behavior_incidents', 0),
-            student_data.get('parent_engagement', 0.5),
-            student_data.get('socioeconomic_status', 0.5),
-            student_data.get('previous_school_performance', 0.5),
-            student_data.get('extracurricular_participation', 0),
-            student_data.get('peer_relationships', 0.5)
-        ]
+        features = DROPOUT_FEATURE_EXTRACTOR(student_data)
         
-        return np.array(features)
+        return np.fromiter(features, dtype=np.float32, count=len(DROPOUT_FEATURE_DEFAULTS))
     
     def _extract_performance_features(self, class_data: Dict[str, Any]) -> np.ndarray:
         """Extract features for performance forecasting"""
         
-        features = [
-            class_data.get('average_grade', 0.5),
-            class_data.get('attendance_rate', 0.5),
-            class_data.get('teacher_experience', 0),
-            class_data.get('class_size', 25),
-            class_data.get('curriculum_difficulty', 0.5),
-            class_data.get('student_engagement', 0.5),
-            class_data.get('parent_involvement', 0.5),
-            class_data.get('resources_available', 0.5)
-        ]
+        features = PERFORMANCE_FEATURE_EXTRACTOR(class_data)
         
-        return np.array(features)
+        return np.fromiter(features, dtype=np.float32, count=len(PERFORMANCE_FEATURE_DEFAULTS))
     
     def _extract_resource_features(self, df: pd.DataFrame) -> np.ndarray:
         """Extract features for resource demand prediction"""
         
-        # Calculate daily usage patterns
-        daily_usage = df.groupby('date').agg({
-            'usage_hours': 'sum',
-            'user_count': 'sum',
-            'resource_type': 'count'
-        }).reset_index()
+        # Calculate daily usage patterns, date order does not matter for these statistics
+        daily_usage = df.groupby('date', sort=False).agg(
+            usage_hours=('usage_hours', 'sum'),
+            user_count=('user_count', 'sum')
+        )
         
         features = [
             daily_usage['usage_hours'].mean(),
@@ -205,46 +584,29 @@ class PredictiveAnalytics:
             daily_usage['user_count'].mean(),
             daily_usage['user_count'].std(),
             len(daily_usage),
-            daily_usage['resource_type'].nunique()
+            df['resource_type'].nunique()
         ]
         
-        return np.array(features)
+        return np.array(features, dtype=np.float32)
     
     def _extract_burnout_features(self, teacher_data: Dict[str, Any]) -> np.ndarray:
         """Extract features for burnout risk assessment"""
         
-        features = [
-            teacher_data.get('workload_hours', 40),
-            teacher_data.get('class_count', 5),
-            teacher_data.get('student_count', 150),
-            teacher_data.get('years_experience', 5),
-            teacher_data.get('satisfaction_score', 0.5),
-            teacher_data.get('stress_level', 0.5),
-            teacher_data.get('work_life_balance', 0.5),
-            teacher_data.get('support_available', 0.5)
-        ]
+        features = BURNOUT_FEATURE_EXTRACTOR(teacher_data)
         
-        return np.array(features)
+        return np.fromiter(features, dtype=np.float32, count=len(BURNOUT_FEATURE_DEFAULTS))
     
-    def _determine_risk_level(self, risk_score: float) -> str:
-        """Determine risk level from score"""
+    def _determine_risk_level(self, risk_score):
+        """Determine risk level from score (scalar or array)"""
         
-        if risk_score >= 0.7:
-            return "high"
-        elif risk_score >= 0.4:
-            return "medium"
-        else:
-            return "low"
+        levels = RISK_LEVELS[np.searchsorted(DROPOUT_RISK_THRESHOLDS, risk_score, side='right')]
+        return str(levels) if np.ndim(levels) == 0 else levels
     
-    def _determine_burnout_risk_level(self, risk_score: float) -> str:
-        """Determine burnout risk level"""
+    def _determine_burnout_risk_level(self, risk_score):
+        """Determine burnout risk level (scalar or array)"""
         
-        if risk_score >= 0.6:
-            return "high"
-        elif risk_score >= 0.3:
-            return "medium"
-        else:
-            return "low"
+        levels = RISK_LEVELS[np.searchsorted(BURNOUT_RISK_THRESHOLDS, risk_score, side='right')]
+        return str(levels) if np.ndim(levels) == 0 else levels
     
     def _calculate_prediction_confidence(self, model, features: np.ndarray) -> float:
         """Calculate prediction confidence"""
@@ -255,16 +617,77 @@ class PredictiveAnalytics:
         else:
             return 0.8  # Default confidence
     
+    def _get_model(self, model_type: str):
+        """Return the shared model instance, loading it once per process"""
+        
+        model = _MODELS.get(model_type)
+        if model is None:
+            with _MODELS_LOCK:
+                model = _MODELS.get(model_type)
+                if model is None:
+                    model = _MODELS[model_type] = self._load_model(model_type)
+        return model
+    
     def _load_model(self, model_type: str):
         """Load pre-trained model"""
         
         try:
             model_path = f"mlservices/models/{model_type}.pkl"
-            return joblib.load(model_path)
+            # Memory-map the tree arrays so forked workers share them through the page cache
+            model = joblib.load(model_path, mmap_mode='r')
+            
+            # Prefer natively compiled trees, then ONNX Runtime, then plain sklearn
+            compiled = self._compile_forest(model, model_type)
+            if compiled is not None:
+                return compiled
+            return self._to_onnx(model, model_type)
         except FileNotFoundError:
             self.logger.warning(f"Model {model_type} not found, using default")
             return RandomForestClassifier(n_estimators=100, random_state=42)
     
+    def _compile_forest(self, model, model_type: str):
+        """Compile a fitted random forest to a shared library with treelite, caching the .so file"""
+        
+        if not TREELITE_AVAILABLE or not isinstance(model, (RandomForestClassifier, RandomForestRegressor)):
+            return None
+        if not hasattr(model, 'n_features_in_'):
+            return None
+        
+        try:
+            lib_path = f"mlservices/models/{model_type}.so"
+            if not os.path.exists(lib_path):
+                tree_model = treelite.sklearn.import_model(model)
+                tl2cgen.export_lib(tree_model, toolchain='gcc', libpath=lib_path, params={'parallel_comp': 32})
+            
+            predictor = tl2cgen.Predictor(lib_path)
+            if isinstance(model, RandomForestClassifier):
+                return CompiledForestClassifier(predictor, np.asarray(model.classes_))
+            return CompiledForestModel(predictor)
+        except Exception as e:
+            self.logger.warning(f"Tree compilation failed for {model_type}: {str(e)}")
+            return None
+    
+    def _to_onnx(self, model, model_type: str):
+        """Serve a fitted model through ONNX Runtime, converting it once and caching the .onnx file"""
+        
+        if not ONNX_AVAILABLE or not hasattr(model, 'n_features_in_'):
+            return model
+        
+        try:
+            onnx_path = f"mlservices/models/{model_type}.onnx"
+            if not os.path.exists(onnx_path):
+                initial_types = [('X', FloatTensorType([None, model.n_features_in_]))]
+                options = {id(model): {'zipmap': False}} if hasattr(model, 'predict_proba') else None
+                onnx_model = convert_sklearn(model, initial_types=initial_types, options=options)
+                with open(onnx_path, 'wb') as f:
+                    f.write(onnx_model.SerializeToString())
+            
+            session = onnxruntime.InferenceSession(onnx_path, providers=['CPUExecutionProvider'])
+            return OnnxClassifier(session) if hasattr(model, 'predict_proba') else OnnxModel(session)
+        except Exception as e:
+            self.logger.warning(f"ONNX conversion failed for {model_type}, using sklearn model: {str(e)}")
+            return model
+    
     def _generate_dropout_insights(self, student_data: Dict[str, Any], risk_score: float) -> List[str]:
         """Generate dropout insights"""
         
@@ -284,6 +707,47 @@ class PredictiveAnalytics:
         
         return insights
     
+    def _generate_dropout_insights_batch(self, raw: pd.DataFrame, risk_scores: np.ndarray) -> List[List[str]]:
+        """Generate dropout insights for many students from vectorized masks"""
+        
+        def column(name: str, default: float) -> np.ndarray:
+            if name not in raw:
+                return np.full(len(raw), default, dtype=float)
+            return raw[name].fillna(default).to_numpy(dtype=float)
+        
+        rules = [
+            (column('attendance_rate', 1) < 0.8, "Low attendance rate is a concern"),
+            (column('average_grade', 1) < 0.6, "Academic performance needs attention"),
+            (column('behavior_incidents', 0) > 3, "Behavioral issues may indicate disengagement"),
+            (risk_scores > 0.5, "Multiple risk factors detected")
+        ]
+        
+        insights = [[] for _ in range(len(raw))]
+        for mask, message in rules:
+            for i in np.flatnonzero(mask):
+                insights[i].append(message)
+        
+        return insights
+    
+    def _generate_dropout_recommendations_batch(self, risk_scores: np.ndarray) -> List[List[str]]:
+        """Generate dropout prevention recommendations for many students"""
+        
+        high = [
+            "Schedule individual counseling sessions",
+            "Implement intensive academic support",
+            "Increase parent communication frequency",
+            "Assign mentor teacher"
+        ]
+        moderate = [
+            "Monitor attendance closely",
+            "Provide additional academic support",
+            "Increase engagement activities"
+        ]
+        
+        tiers = np.select([risk_scores > 0.6, risk_scores > 0.3], [2, 1], default=0)
+        options = ([], moderate, high)
+        return [list(options[tier]) for tier in tiers]
+    
     def _generate_dropout_recommendations(self, risk_score: float, student_data: Dict[str, Any]) -> List[str]:
         """Generate dropout prevention recommendations"""
         
@@ -305,6 +769,45 @@ class PredictiveAnalytics:
         
         return recommendations
     
+    def _generate_burnout_insights(self, teacher_data: Dict[str, Any], burnout_risk: float) -> List[str]:
+        """Generate burnout insights"""
+        
+        insights = [
+            message
+            for field, default, above, limit, message in BURNOUT_INSIGHT_RULES
+            if (teacher_data.get(field, default) > limit if above else teacher_data.get(field, default) < limit)
+        ]
+        
+        if burnout_risk > 0.5:
+            insights.append("Multiple burnout risk factors detected")
+        
+        return insights
+    
+    def _generate_burnout_insights_batch(self, raw: pd.DataFrame, burnout_risks: np.ndarray) -> List[List[str]]:
+        """Generate burnout insights for many teachers from vectorized masks"""
+        
+        insights = [[] for _ in range(len(raw))]
+        for field, default, above, limit, message in BURNOUT_INSIGHT_RULES:
+            values = raw[field].fillna(default).to_numpy(dtype=float) if field in raw else np.full(len(raw), default, dtype=float)
+            for i in np.flatnonzero(values > limit if above else values < limit):
+                insights[i].append(message)
+        
+        for i in np.flatnonzero(burnout_risks > 0.5):
+            insights[i].append("Multiple burnout risk factors detected")
+        
+        return insights
+    
+    def _generate_burnout_recommendations(self, burnout_risk: float, teacher_data: Dict[str, Any]) -> List[str]:
+        """Generate burnout prevention recommendations"""
+        
+        return list(BURNOUT_RECOMMENDATIONS[np.searchsorted(BURNOUT_RISK_THRESHOLDS, burnout_risk, side='right')])
+    
+    def _generate_burnout_recommendations_batch(self, burnout_risks: np.ndarray) -> List[List[str]]:
+        """Generate burnout prevention recommendations for many teachers"""
+        
+        tiers = np.searchsorted(BURNOUT_RISK_THRESHOLDS, burnout_risks, side='right')
+        return [list(BURNOUT_RECOMMENDATIONS[tier]) for tier in tiers]
+    
     def _analyze_performance_trend(self, class_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze performance trend"""
         
@@ -318,4 +821,8 @@ class PredictiveAnalytics:
     def _calculate_confidence_intervals(self, prediction: float, margin: float) -> Dict[str, float]:
         """Calculate confidence intervals"""
         
-        return { 
\ No newline at end of file
+        return {
+            "lower": prediction * (1 - margin),
+            "upper": prediction * (1 + margin),
+            "margin": margin
+        }
@@ -2,17 +2,20 @@ import numpy as np
 import pandas as pd
 from sklearn.linear_model import LinearRegression
 from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import StandardScaler
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
 import warnings
+from .numeric_kernels import trend_stats, zscore_outliers
 warnings.filterwarnings('ignore')
 
+# Coefficient of variation above 0.1 is moderate and above 0.2 strong seasonality
+SEASONALITY_LEVELS = np.array(['weak', 'moderate', 'strong'])
+SEASONALITY_THRESHOLDS = np.array([0.1, 0.2])
+
 class TimeSeriesAnalysis:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.scaler = StandardScaler()
         
     def analyze_attendance_trends(self, attendance_data: List[Dict]) -> Dict[str, Any]:
         """Analyze attendance trends over time"""
@@ -33,30 +36,67 @@ class TimeSeriesAnalysis:
                 daily_attendance['status'] / daily_attendance['student_id']
             )
             
-            # Detect trends
-            trend_analysis = self._detect_trend(daily_attendance['attendance_rate'])
+            return self._analyze_daily_attendance(daily_attendance)
             
-            # Detect seasonal patterns
-            seasonal_patterns = self._detect_seasonal_patterns(daily_attendance)
+        except Exception as e:
+            self.logger.error(f"Error analyzing attendance trends: {str(e)}")
+            return {"error": "Failed to analyze attendance trends"}
+    
+    def analyze_attendance_trends_from_csv(self, csv_path: str, chunksize: int = 50_000) -> Dict[str, Any]:
+        """Analyze attendance trends from a CSV log without loading every record at once"""
+        
+        try:
+            # Only per-day totals are kept, so memory is bounded by the number of days
+            daily_totals = None
             
-            # Predict future attendance
-            future_predictions = self._predict_future_attendance(daily_attendance)
+            for chunk in pd.read_csv(csv_path, chunksize=chunksize, usecols=['date', 'student_id', 'status'],
+                                     parse_dates=['date']):
+                counts = chunk.assign(present=chunk['status'] == 'present').groupby('date').agg(
+                    student_id=('student_id', 'count'),
+                    status=('present', 'sum')
+                )
+                daily_totals = counts if daily_totals is None else daily_totals.add(counts, fill_value=0)
             
-            # Detect anomalies
-            anomalies = self._detect_anomalies(daily_attendance['attendance_rate'])
+            if daily_totals is None:
+                return {"error": "No attendance records found"}
             
-            return {
-                "trend_analysis": trend_analysis,
-                "seasonal_patterns": seasonal_patterns,
-                "future_predictions": future_predictions,
-                "anomalies": anomalies,
-                "overall_trend": "increasing" if trend_analysis['slope'] > 0 else "decreasing"
-            }
+            daily_attendance = daily_totals.sort_index().reset_index()
+            daily_attendance['attendance_rate'] = (
+                daily_attendance['status'] / daily_attendance['student_id']
+            )
+            
+            return self._analyze_daily_attendance(daily_attendance)
             
         except Exception as e:
-            self.logger.error(f"Error analyzing attendance trends: {str(e)}")
+            self.logger.error(f"Error analyzing attendance trends from CSV: {str(e)}")
             return {"error": "Failed to analyze attendance trends"}
     
+    def _analyze_daily_attendance(self, daily_attendance: pd.DataFrame) -> Dict[str, Any]:
+        """Trend, seasonality, forecast and anomaly analysis of daily attendance rates"""
+        
+        # Detect trends
+        trend_analysis = self._detect_trend(daily_attendance['attendance_rate'])
+        
+        # Calendar fields are shared by the seasonality and forecasting steps
+        calendar = self._calendar_fields(daily_attendance['date'])
+        
+        # Detect seasonal patterns
+        seasonal_patterns = self._detect_seasonal_patterns(daily_attendance, calendar)
+        
+        # Predict future attendance
+        future_predictions = self._predict_future_attendance(daily_attendance, calendar=calendar)
+        
+        # Detect anomalies
+        anomalies = self._detect_anomalies(daily_attendance['attendance_rate'])
+        
+        return {
+            "trend_analysis": trend_analysis,
+            "seasonal_patterns": seasonal_patterns,
+            "future_predictions": future_predictions,
+            "anomalies": anomalies,
+            "overall_trend": "increasing" if trend_analysis['slope'] > 0 else "decreasing"
+        }
+    
     def analyze_performance_trajectories(self, performance_data: List[Dict]) -> Dict[str, Any]:
         """Analyze student performance trajectories over time"""
         
@@ -70,14 +110,7 @@ class TimeSeriesAnalysis:
             df['grade_moving_avg'] = df['grade'].rolling(window=5, min_periods=1).mean()
             
             # Detect performance trends for each student
-            student_trends = {}
-            
-            for student_id in df['student_id'].unique():
-                student_data = df[df['student_id'] == student_id]
-                
-                if len(student_data) >= 3:  # Need at least 3 data points
-                    trend = self._analyze_student_trend(student_data)
-                    student_trends[student_id] = trend
+            student_trends = self._analyze_student_trends(df)
             
             # Overall performance analysis
             overall_trend = self._analyze_overall_performance_trend(df)
@@ -177,18 +210,9 @@ class TimeSeriesAnalysis:
         
         try:
             # Simple linear regression for trend detection
-            X = np.arange(len(time_series)).reshape(-1, 1)
-            y = time_series.values
-            
-            model = LinearRegression()
-            model.fit(X, y)
-            
-            slope = model.coef_[0]
-            intercept = model.intercept_
-            
-            # Calculate R-squared
-            y_pred = model.predict(X)
-            r_squared = 1 - (np.sum((y - y_pred) ** 2) / np.sum((y - np.mean(y)) ** 2))
+            slope, intercept, r_squared = trend_stats(time_series.to_numpy(dtype=np.float64))
+            if np.isnan(slope):
+                raise ValueError("cannot fit a trend to an empty series")
             
             return {
                 "slope": slope,
@@ -202,17 +226,20 @@ class TimeSeriesAnalysis:
             self.logger.error(f"Error detecting trend: {str(e)}")
             return {"error": "Failed to detect trend"}
     
-    def _detect_seasonal_patterns(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _detect_seasonal_patterns(self, df: pd.DataFrame, 
+                                  calendar: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """Detect seasonal patterns in time series data"""
         
         try:
+            if calendar is None:
+                calendar = self._calendar_fields(df['date'])
+            rates = df['attendance_rate'].to_numpy(dtype=float)
+            
             # Weekly patterns
-            df['weekday'] = df['date'].dt.dayofweek
-            weekly_patterns = df.groupby('weekday')['attendance_rate'].mean()
+            weekly_patterns = self._calendar_means(calendar['day_of_week'].to_numpy(), rates)
             
             # Monthly patterns
-            df['month'] = df['date'].dt.month
-            monthly_patterns = df.groupby('month')['attendance_rate'].mean()
+            monthly_patterns = self._calendar_means(calendar['month'].to_numpy(), rates)
             
             # Identify peak and low periods
             peak_day = weekly_patterns.idxmax()
@@ -230,14 +257,36 @@ class TimeSeriesAnalysis:
             self.logger.error(f"Error detecting seasonal patterns: {str(e)}")
             return {"error": "Failed to detect seasonal patterns"}
     
-    def _predict_future_attendance(self, df: pd.DataFrame, days_ahead: int = 7) -> Dict[str, Any]:
+    def _calendar_fields(self, dates: pd.Series) -> pd.DataFrame:
+        """Day of week, month and day of month from one conversion of the timestamps to days"""
+        
+        days = dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+        months = days.astype('datetime64[M]')
+        
+        return pd.DataFrame({
+            # 1970-01-01 was a Thursday, dayofweek 3 with Monday as 0
+            'day_of_week': (days.astype(np.int64) + 3) % 7,
+            'month': months.astype(np.int64) % 12 + 1,
+            'day_of_month': (days - months.astype('datetime64[D]')).astype(np.int64) + 1
+        }, index=dates.index)
+    
+    def _calendar_means(self, periods: np.ndarray, rates: np.ndarray) -> pd.Series:
+        """Mean rate per calendar period (weekday, month, ...) via weighted bincounts"""
+        
+        counts = np.bincount(periods)
+        totals = np.bincount(periods, weights=rates)
+        observed = np.flatnonzero(counts)
+        return pd.Series(totals[observed] / counts[observed], index=observed)
+    
+    def _predict_future_attendance(self, df: pd.DataFrame, days_ahead: int = 7,
+                                   calendar: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """Predict future attendance rates"""
         
         try:
             # Prepare features for prediction
-            df['day_of_week'] = df['date'].dt.dayofweek
-            df['month'] = df['date'].dt.month
-            df['day_of_month'] = df['date'].dt.day
+            if calendar is None:
+                calendar = self._calendar_fields(df['date'])
+            df[['day_of_week', 'month', 'day_of_month']] = calendar
             
             # Create lag features
             df['attendance_lag1'] = df['attendance_rate'].shift(1)
@@ -262,22 +311,28 @@ class TimeSeriesAnalysis:
             last_date = df['date'].max()
             future_dates = pd.date_range(start=last_date + timedelta(days=1), periods=days_ahead)
             
-            # Make predictions
-            predictions = []
-            for date in future_dates:
-                features_pred = [
-                    date.dayofweek,
-                    date.month,
-                    date.day,
-                    df['attendance_rate'].iloc[-1],  # lag1
-                    df['attendance_rate'].iloc[-7] if len(df) >= 7 else df['attendance_rate'].iloc[-1]  # lag7
-                ]
-                pred = model.predict([features_pred])[0]
-                predictions.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'predicted_attendance': max(0, min(1, pred)),  # Clamp between 0 and 1
+            # Make predictions for the whole horizon in one call
+            last_rate = df['attendance_rate'].iloc[-1]
+            lag7_rate = df['attendance_rate'].iloc[-7] if len(df) >= 7 else last_rate
+            X_future = pd.DataFrame({
+                'day_of_week': future_dates.dayofweek,
+                'month': future_dates.month,
+                'day_of_month': future_dates.day,
+                'attendance_lag1': np.full(days_ahead, last_rate),
+                'attendance_lag7': np.full(days_ahead, lag7_rate)
+            }, columns=features)
+            
+            # Clamp between 0 and 1
+            predicted = np.clip(model.predict(X_future), 0, 1)
+            
+            predictions = [
+                {
+                    'date': date,
+                    'predicted_attendance': float(pred),
                     'confidence': 0.8  # Placeholder confidence
-                })
+                }
+                for date, pred in zip(future_dates.strftime('%Y-%m-%d'), predicted)
+            ]
             
             return {
                 "predictions": predictions,
@@ -294,22 +349,19 @@ class TimeSeriesAnalysis:
         
         try:
             # Simple anomaly detection using z-score
-            mean = time_series.mean()
-            std = time_series.std()
-            
-            anomalies = []
+            values = time_series.to_numpy(dtype=np.float64)
             threshold = 2  # 2 standard deviations
-            
-            for i, value in enumerate(time_series):
-                z_score = abs((value - mean) / std)
-                
-                if z_score > threshold:
-                    anomalies.append({
-                        'index': i,
-                        'value': value,
-                        'z_score': z_score,
-                        'severity': 'high' if z_score > 3 else 'medium'
-                    })
+            indices, z_scores = zscore_outliers(values, threshold)
+            
+            anomalies = [
+                {
+                    'index': int(i),
+                    'value': float(values[i]),
+                    'z_score': float(z_score),
+                    'severity': 'high' if z_score > 3 else 'medium'
+                }
+                for i, z_score in zip(indices, z_scores)
+            ]
             
             return anomalies
             
@@ -317,44 +369,52 @@ class TimeSeriesAnalysis:
             self.logger.error(f"Error detecting anomalies: {str(e)}")
             return []
     
-    def _analyze_student_trend(self, student_data: pd.DataFrame) -> Dict[str, Any]:
-        """Analyze individual student performance trend"""
+    def _analyze_student_trends(self, df: pd.DataFrame) -> Dict[Any, Dict[str, Any]]:
+        """Analyze every student's performance trend in one grouped pass"""
         
         try:
-            # Calculate trend
-            X = np.arange(len(student_data)).reshape(-1, 1)
-            y = student_data['grade'].values
+            # Hash student ids once; every grouping below reuses the dense integer codes
+            codes, student_ids = pd.factorize(df['student_id'])
+            grade = pd.Series(df['grade'].to_numpy(dtype=float))
             
-            model = LinearRegression()
-            model.fit(X, y)
+            # Position of each grade within its student's history, in date order
+            t = grade.groupby(codes).cumcount().astype(float)
+            
+            # Closed-form least squares slope per student from grouped sums
+            sums = pd.DataFrame({
+                't': t, 'grade': grade, 'tg': t * grade, 'tt': t * t
+            }).groupby(codes).sum()
+            stats = grade.groupby(codes).agg(['count', 'mean', 'std', 'min', 'max'])
             
-            slope = model.coef_[0]
+            n = stats['count']
+            stats['slope'] = (n * sums['tg'] - sums['t'] * sums['grade']) / (n * sums['tt'] - sums['t'] ** 2)
             
-            # Calculate performance volatility
-            volatility = student_data['grade'].std()
+            # Need at least 3 data points
+            stats = stats[n >= 3]
             
             # Determine trend category
-            if slope > 0.1:
-                trend_category = "improving"
-            elif slope < -0.1:
-                trend_category = "declining"
-            else:
-                trend_category = "stable"
+            stats['trend_category'] = np.select(
+                [stats['slope'] > 0.1, stats['slope'] < -0.1], ['improving', 'declining'], default='stable'
+            )
             
             return {
-                "slope": slope,
-                "trend_category": trend_category,
-                "volatility": volatility,
-                "average_grade": student_data['grade'].mean(),
-                "grade_range": {
-                    "min": student_data['grade'].min(),
-                    "max": student_data['grade'].max()
+                student_id: {
+                    "slope": row['slope'],
+                    "trend_category": row['trend_category'],
+                    "volatility": row['std'],
+                    "average_grade": row['mean'],
+                    "grade_range": {
+                        "min": row['min'],
+                        "max": row['max']
+                    }
                 }
+                for code, row in stats.to_dict('index').items()
+                for student_id in (student_ids[code],)
             }
             
         except Exception as e:
-            self.logger.error(f"Error analyzing student trend: {str(e)}")
-            return {"error": "Failed to analyze student trend"}
+            self.logger.error(f"Error analyzing student trends: {str(e)}")
+            return {"error": "Failed to analyze student trends"}
     
     def _calculate_seasonality_strength(self, weekly_patterns: pd.Series) -> str:
         """Calculate strength of seasonality"""
@@ -363,12 +423,8 @@ class TimeSeriesAnalysis:
             # Calculate coefficient of variation
             cv = weekly_patterns.std() / weekly_patterns.mean()
             
-            if cv > 0.2:
-                return "strong"
-            elif cv > 0.1:
-                return "moderate"
-            else:
-                return "weak"
+            # Undefined variation (single weekday) counts as no seasonality
+            return str(SEASONALITY_LEVELS[np.searchsorted(SEASONALITY_THRESHOLDS, np.nan_to_num(cv), side='left')])
                 
         except Exception:
             return "unknown" 
\ No newline at end of file
@@ -1,26 +1,104 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import asyncio
 from typing import Optional, Dict, Any
 import hashlib
+import re
 import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Read-only so the shared constant cannot be mutated by callers
+SUPPORTED_LANGUAGES = tuple(
+    MappingProxyType({"code": code, "name": name})
+    for code, name in (
+        ("en", "English"),
+        ("es", "Spanish"),
+        ("fr", "French"),
+        ("de", "German"),
+        ("it", "Italian"),
+        ("pt", "Portuguese"),
+        ("ru", "Russian"),
+        ("zh", "Chinese"),
+        ("ja", "Japanese"),
+        ("ko", "Korean"),
+        ("ar", "Arabic"),
+        ("hi", "Hindi"),
+        ("bn", "Bengali"),
+        ("ur", "Urdu"),
+        ("tr", "Turkish")
+    )
+)
+
+# Simple fallback translations for common phrases, keyed by language pair
+_FALLBACK_DICT = {
+    "en-es": {
+        "hello": "hola",
+        "goodbye": "adiós",
+        "thank you": "gracias",
+        "please": "por favor",
+        "emergency": "emergencia",
+        "important": "importante",
+        "urgent": "urgente"
+    },
+    "en-fr": {
+        "hello": "bonjour",
+        "goodbye": "au revoir",
+        "thank you": "merci",
+        "please": "s'il vous plaît",
+        "emergency": "urgence",
+        "important": "important",
+        "urgent": "urgent"
+    }
+}
+
+def _compile_fallback_patterns(fallback_dict: Dict[str, Dict[str, str]]) -> Dict[str, tuple]:
+    """Compile each language pair's phrases into a single alternation regex"""
+    patterns = {}
+    for key, phrases in fallback_dict.items():
+        translations = {english.lower(): translation for english, translation in phrases.items()}
+        # Longest phrases first so overlapping entries prefer the fuller match
+        alternation = "|".join(re.escape(english) for english in sorted(translations, key=len, reverse=True))
+        patterns[key] = (re.compile(alternation), translations)
+    return patterns
+
+_FALLBACK_PATTERNS = _compile_fallback_patterns(_FALLBACK_DICT)
 
 class TranslationService:
     def __init__(self):
         # Initialize translation service
         self.api_key = self._get_api_key()
         self.base_url = "https://translation.googleapis.com/language/translate/v2"
-        self.cache = {}
+        self.request_timeout = (2, 10)  # Connect, read seconds
+        self._session = self._create_session()
+        self.cache = OrderedDict()  # Least recently used entries first
         self.cache_ttl = 3600  # 1 hour cache
+        self.cache_max = 10000  # Entries kept before evicting the least recently used
+        self.cache_sweep_interval = 1000  # Inserts between sweeps of expired entries
+        self._inserts_since_sweep = 0
+        self._cache_lock = threading.Lock()  # Fallback requests run on worker threads
+        self.batch_max_items = 100  # Texts per batched API request
+        self.batch_max_chars = 5000  # Characters per batched API request
+        self.fallback_workers = 8  # Concurrent per-text requests when a batch request fails
         
     def translate(self, text: str, source_language: str, target_language: str, context: Optional[str] = None) -> str:
         """Translate text from source language to target language"""
         try:
             # Check cache first
             cache_key = self._generate_cache_key(text, source_language, target_language)
-            if cache_key in self.cache:
-                cached_result = self.cache[cache_key]
-                if time.time() - cached_result['timestamp'] < self.cache_ttl:
-                    return cached_result['translation']
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
             
             # Prepare request
             params = {
@@ -34,17 +112,14 @@ class TranslationService:
                 params['context'] = context
             
             # Make API request
-            response = requests.post(self.base_url, params=params)
+            response = self._session.post(self.base_url, params=params, timeout=self.request_timeout)
             
             if response.status_code == 200:
                 result = response.json()
                 translation = result['data']['translations'][0]['translatedText']
                 
                 # Cache result
-                self.cache[cache_key] = {
-                    'translation': translation,
-                    'timestamp': time.time()
-                }
+                self._set_cached(cache_key, translation)
                 
                 return translation
             else:
@@ -58,77 +133,218 @@ class TranslationService:
     def translate_batch(self, texts: list, source_language: str, target_language: str) -> list:
         """Translate multiple texts at once"""
         try:
-            translations = []
-            for text in texts:
-                translation = self.translate(text, source_language, target_language)
-                translations.append(translation)
+            translations, missing = self._split_cached(texts, source_language, target_language)
+            
+            for chunk in self._chunk_batch(missing):
+                chunk_texts = [text for _, text, _ in chunk]
+                try:
+                    results = self._request_batch(chunk, source_language, target_language)
+                except Exception as e:
+                    print(f"Batch request failed, translating individually: {e}")
+                    results = self._translate_individually(chunk_texts, source_language, target_language)
+                
+                for (indices, _, _), translation in zip(chunk, results):
+                    for index in indices:
+                        translations[index] = translation
+            
             return translations
         except Exception as e:
             print(f"Batch translation error: {e}")
             return texts  # Return original texts if translation fails
     
-    def get_supported_languages(self) -> list:
-        """Get list of supported languages"""
-        return [
-            {"code": "en", "name": "English"},
-            {"code": "es", "name": "Spanish"},
-            {"code": "fr", "name": "French"},
-            {"code": "de", "name": "German"},
-            {"code": "it", "name": "Italian"},
-            {"code": "pt", "name": "Portuguese"},
-            {"code": "ru", "name": "Russian"},
-            {"code": "zh", "name": "Chinese"},
-            {"code": "ja", "name": "Japanese"},
-            {"code": "ko", "name": "Korean"},
-            {"code": "ar", "name": "Arabic"},
-            {"code": "hi", "name": "Hindi"},
-            {"code": "bn", "name": "Bengali"},
-            {"code": "ur", "name": "Urdu"},
-            {"code": "tr", "name": "Turkish"}
+    async def translate_batch_async(self, texts: list, source_language: str, target_language: str) -> list:
+        """Translate multiple texts, sending the batched requests concurrently"""
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.to_thread(self.translate_batch, texts, source_language, target_language)
+        
+        try:
+            translations, missing = self._split_cached(texts, source_language, target_language)
+            chunks = self._chunk_batch(missing)
+            
+            connector = aiohttp.TCPConnector(limit=32)
+            timeout = aiohttp.ClientTimeout(connect=self.request_timeout[0], sock_read=self.request_timeout[1])
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                results = await asyncio.gather(
+                    *(self._request_batch_async(session, chunk, source_language, target_language)
+                      for chunk in chunks),
+                    return_exceptions=True
+                )
+            
+            for chunk, result in zip(chunks, results):
+                chunk_texts = [text for _, text, _ in chunk]
+                if isinstance(result, Exception):
+                    print(f"Batch request failed, translating individually: {result}")
+                    result = await asyncio.to_thread(
+                        self._translate_individually, chunk_texts, source_language, target_language
+                    )
+                
+                for (indices, _, _), translation in zip(chunk, result):
+                    for index in indices:
+                        translations[index] = translation
+            
+            return translations
+        except Exception as e:
+            print(f"Batch translation error: {e}")
+            return texts  # Return original texts if translation fails
+    
+    def _translate_individually(self, texts: list, source_language: str, target_language: str) -> list:
+        """Translate texts one request each, overlapping the requests on a thread pool"""
+        if len(texts) <= 1:
+            return [self.translate(text, source_language, target_language) for text in texts]
+        
+        # requests releases the GIL while waiting on the socket, so threads overlap the round trips
+        with ThreadPoolExecutor(max_workers=min(self.fallback_workers, len(texts))) as executor:
+            return list(executor.map(lambda text: self.translate(text, source_language, target_language), texts))
+    
+    def _split_cached(self, texts: list, source_language: str, target_language: str) -> tuple:
+        """Fill cached translations in place and collect (indices, text, cache_key) items still to request"""
+        translations = [None] * len(texts)
+        missing = []
+        
+        # Repeated texts are looked up and requested once, then written to every position
+        positions = {}
+        for index, text in enumerate(texts):
+            positions.setdefault(text, []).append(index)
+        
+        for text, indices in positions.items():
+            # Keep the key so the response can be cached without hashing the text again
+            cache_key = self._generate_cache_key(text, source_language, target_language)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                for index in indices:
+                    translations[index] = cached
+            else:
+                missing.append((indices, text, cache_key))
+        
+        return translations, missing
+    
+    def _request_batch(self, chunk: list, source_language: str, target_language: str) -> list:
+        """Translate a chunk of texts with one API request and cache the results"""
+        response = self._session.post(self.base_url, data=self._batch_payload(chunk, source_language, target_language),
+                                      timeout=self.request_timeout)
+        response.raise_for_status()
+        
+        return self._store_batch_results(chunk, response.json())
+    
+    async def _request_batch_async(self, session, chunk: list, source_language: str, target_language: str) -> list:
+        """Async variant of _request_batch on a shared aiohttp session"""
+        async with session.post(self.base_url, data=self._batch_payload(chunk, source_language, target_language)) as response:
+            response.raise_for_status()
+            result = await response.json()
+        
+        return self._store_batch_results(chunk, result)
+    
+    def _batch_payload(self, chunk: list, source_language: str, target_language: str) -> list:
+        """Form fields for a batched request, one q field per text"""
+        return [('q', text) for _, text, _ in chunk] + [
+            ('source', source_language),
+            ('target', target_language),
+            ('key', self.api_key)
         ]
     
+    def _store_batch_results(self, chunk: list, result: Dict[str, Any]) -> list:
+        """Extract and cache the translations of a batched response"""
+        # Translations come back in the same order as the q parameters
+        translations = [item['translatedText'] for item in result['data']['translations']]
+        if len(translations) != len(chunk):
+            raise ValueError(f"Expected {len(chunk)} translations, got {len(translations)}")
+        
+        for (_, _, cache_key), translation in zip(chunk, translations):
+            self._set_cached(cache_key, translation)
+        
+        return translations
+    
+    def _chunk_batch(self, items: list) -> list:
+        """Split (indices, text, cache_key) items into chunks within the API's per-request limits"""
+        chunks = []
+        current = []
+        current_chars = 0
+        
+        for item in items:
+            text_chars = len(item[1])
+            if current and (len(current) >= self.batch_max_items or current_chars + text_chars > self.batch_max_chars):
+                chunks.append(current)
+                current = []
+                current_chars = 0
+            current.append(item)
+            current_chars += text_chars
+        
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    def _get_cached(self, cache_key: bytes) -> Optional[str]:
+        """Return a cached translation if present and not expired"""
+        with self._cache_lock:
+            cached_result = self.cache.get(cache_key)
+            if cached_result is None:
+                return None
+            
+            if time.time() - cached_result['timestamp'] >= self.cache_ttl:
+                del self.cache[cache_key]
+                return None
+            
+            self.cache.move_to_end(cache_key)
+            return cached_result['translation']
+    
+    def _set_cached(self, cache_key: bytes, translation: str) -> None:
+        """Store a translation, evicting least recently used and expired entries"""
+        with self._cache_lock:
+            self.cache[cache_key] = {
+                'translation': translation,
+                'timestamp': time.time()
+            }
+            self.cache.move_to_end(cache_key)
+            
+            if len(self.cache) > self.cache_max:
+                self.cache.popitem(last=False)
+            
+            self._inserts_since_sweep += 1
+            if self._inserts_since_sweep >= self.cache_sweep_interval:
+                self._sweep_expired()
+    
+    def _sweep_expired(self) -> None:
+        """Drop every expired cache entry; caller holds the cache lock"""
+        cutoff = time.time() - self.cache_ttl
+        expired = [key for key, entry in self.cache.items() if entry['timestamp'] <= cutoff]
+        for key in expired:
+            del self.cache[key]
+        self._inserts_since_sweep = 0
+    
+    def get_supported_languages(self) -> tuple:
+        """Get list of supported languages"""
+        return SUPPORTED_LANGUAGES
+    
     def get_confidence_score(self) -> float:
         """Get confidence score for the last translation"""
         # In real implementation, this would return the confidence from the API
         return 0.85  # Mock confidence score
     
+    def _create_session(self) -> requests.Session:
+        """HTTP session reusing keep-alive connections, retrying transient failures"""
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=None)
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry))
+        return session
+    
     def _get_api_key(self) -> str:
         """Get API key from environment or config"""
         import os
         return os.getenv('GOOGLE_TRANSLATE_API_KEY', 'your-api-key-here')
     
-    def _generate_cache_key(self, text: str, source_lang: str, target_lang: str) -> str:
+    def _generate_cache_key(self, text: str, source_lang: str, target_lang: str) -> bytes:
         """Generate cache key for translation"""
         content = f"{text}:{source_lang}:{target_lang}"
-        return hashlib.md5(content.encode()).hexdigest()
+        # 8-byte raw digest: faster than md5 and a quarter of the hex key size
+        return hashlib.blake2b(content.encode(), digest_size=8).digest()
     
     def _fallback_translate(self, text: str, source_language: str, target_language: str) -> str:
         """Fallback translation using simple dictionary"""
-        # Simple fallback translations for common phrases
-        fallback_dict = {
-            "en-es": {
-                "hello": "hola",
-                "goodbye": "adiós",
-                "thank you": "gracias",
-                "please": "por favor",
-                "emergency": "emergencia",
-                "important": "importante",
-                "urgent": "urgente"
-            },
-            "en-fr": {
-                "hello": "bonjour",
-                "goodbye": "au revoir",
-                "thank you": "merci",
-                "please": "s'il vous plaît",
-                "emergency": "urgence",
-                "important": "important",
-                "urgent": "urgent"
-            }
-        }
-        
-        key = f"{source_language}-{target_language}"
-        if key in fallback_dict:
-            for english, translation in fallback_dict[key].items():
-                text = text.replace(english.lower(), translation)
+        entry = _FALLBACK_PATTERNS.get(f"{source_language}-{target_language}")
+        if entry is None:
+            return text
         
-        return text 
\ No newline at end of file
+        # One scan of the text replaces every known phrase
+        pattern, translations = entry
+        return pattern.sub(lambda match: translations[match.group(0)], text)
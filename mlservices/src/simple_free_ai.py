@@ -1,8 +1,76 @@
 import random
 import json
+import numpy as np
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Any
 
+# Static content shared by every generated document; only {topic}/{subject} fragments vary per call
+_LESSON_STRUCTURE = (
+    ("5 minutes", "Introduction and Warm-up",
+     "Introduce the topic of {topic} and engage students with a brief discussion"),
+    ("15 minutes", "Direct Instruction",
+     "Present key concepts of {topic} using visual aids and examples"),
+    ("15 minutes", "Guided Practice",
+     "Students work through examples and problems related to {topic}"),
+    ("10 minutes", "Assessment and Closure",
+     "Review key points and assess student understanding"),
+)
+
+_MATERIALS = (
+    "Whiteboard and markers",
+    "Textbook and supplementary materials",
+    "Worksheets and practice problems",
+    "Digital resources and videos"
+)
+
+_DIFFERENTIATION_STRATEGIES = (
+    "Provide additional support for struggling students",
+    "Offer extension activities for advanced learners",
+    "Use visual aids and hands-on materials"
+)
+
+_QUESTION_TEMPLATES = (
+    "Explain the concept of {topic} in your own words.",
+    "Provide three examples of {topic} in real-world situations.",
+    "Compare and contrast different approaches to {topic}.",
+    "Create a problem related to {topic} and solve it.",
+    "Analyze the importance of {topic} in {subject}."
+)
+
+_RUBRIC = MappingProxyType({
+    "Excellent": "Complete understanding with detailed explanations",
+    "Good": "Solid understanding with adequate explanations",
+    "Satisfactory": "Basic understanding with some explanations",
+    "Needs Improvement": "Limited understanding or missing explanations"
+})
+
+_ASSESSMENT_STRATEGY = MappingProxyType({
+    "formative": "Weekly quizzes and class participation",
+    "summative": "Unit tests and final project",
+    "ongoing": "Homework assignments and classwork"
+})
+
+_CURRICULUM_RESOURCES = (
+    "Textbook and supplementary materials",
+    "Digital learning platforms",
+    "Hands-on materials and manipulatives",
+    "Assessment tools and rubrics"
+)
+
+_UNIT_OBJECTIVE_TEMPLATES = (
+    "Master fundamental {subject} principles",
+    "Apply {subject} knowledge to complex problems",
+    "Develop critical thinking skills"
+)
+
+_UNIT_ACTIVITIES = (
+    "Lecture and discussion",
+    "Hands-on practice",
+    "Group projects",
+    "Individual assessments"
+)
+
 class SimpleFreeAIGenerator:
     def __init__(self):
         self.student_names = [
@@ -36,9 +104,18 @@ class SimpleFreeAIGenerator:
             "Ask questions when clarification is needed", "Work on organization skills",
             "Practice time management", "Engage in additional reading"
         ]
+        
+        # Object arrays of the sampling pools so picks come from the Generator's C sampler
+        self._rng = np.random.default_rng()
+        self._adjective_pool = np.array(self.positive_adjectives, dtype=object)
+        self._improvement_pool = np.array(self.improvement_areas, dtype=object)
+        self._achievement_pool = np.array(self.achievements, dtype=object)
+        self._recommendation_pool = np.array(self.recommendations, dtype=object)
 
     def generate_student_report(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a student progress report"""
+        # One clock read so report_date and generated_at describe the same instant
+        now = datetime.now()
         name = student_data.get('name', random.choice(self.student_names))
         subject = student_data.get('subject', random.choice(self.subjects))
         grade = student_data.get('grade', 'B+')
@@ -48,17 +125,20 @@ class SimpleFreeAIGenerator:
         attendance_percentage = int(attendance_rate * 100)
         
         # Generate report content
-        strengths = random.sample(self.positive_adjectives, 3)
-        areas_for_improvement = random.sample(self.improvement_areas, 2)
-        achievements = random.sample(self.achievements, 3)
-        recommendations = random.sample(self.recommendations, 3)
+        strengths = self._sample(self._adjective_pool, 3)
+        areas_for_improvement = self._sample(self._improvement_pool, 2)
+        achievements = self._sample(self._achievement_pool, 3)
+        recommendations = self._sample(self._recommendation_pool, 3)
+        
+        # One draw for all three scores; upper bounds are exclusive
+        participation, homework, test_average = self._rng.integers((75, 80, 75), (96, 101, 96)).tolist()
         
         report = {
             "student_name": name,
             "subject": subject,
             "grade": grade,
             "attendance_percentage": attendance_percentage,
-            "report_date": datetime.now().strftime("%B %d, %Y"),
+            "report_date": now.strftime("%B %d, %Y"),
             "teacher_comments": {
                 "strengths": strengths,
                 "areas_for_improvement": areas_for_improvement,
@@ -67,9 +147,9 @@ class SimpleFreeAIGenerator:
             },
             "academic_performance": {
                 "overall_grade": grade,
-                "class_participation": f"{random.randint(75, 95)}%",
-                "homework_completion": f"{random.randint(80, 100)}%",
-                "test_average": f"{random.randint(75, 95)}%"
+                "class_participation": f"{participation}%",
+                "homework_completion": f"{homework}%",
+                "test_average": f"{test_average}%"
             },
             "next_steps": [
                 "Continue current study habits",
@@ -77,49 +157,22 @@ class SimpleFreeAIGenerator:
                 "Maintain regular attendance",
                 "Seek additional help when needed"
             ],
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now.isoformat(),
             "model": "simple-free-ai-generator"
         }
         
         return report
 
+    def _sample(self, pool: np.ndarray, k: int) -> List[str]:
+        """Pick k distinct entries from a precomputed pool"""
+        return self._rng.choice(pool, size=k, replace=False).tolist()
+
     def generate_lesson_plan(self, subject: str, grade: str, topic: str, duration: int) -> Dict[str, Any]:
         """Generate a lesson plan"""
         # Create lesson structure with timing
         lesson_structure = [
-            {
-                "time": "5 minutes",
-                "activity": "Introduction and Warm-up",
-                "description": f"Introduce the topic of {topic} and engage students with a brief discussion"
-            },
-            {
-                "time": "15 minutes",
-                "activity": "Direct Instruction",
-                "description": f"Present key concepts of {topic} using visual aids and examples"
-            },
-            {
-                "time": "15 minutes",
-                "activity": "Guided Practice",
-                "description": f"Students work through examples and problems related to {topic}"
-            },
-            {
-                "time": "10 minutes",
-                "activity": "Assessment and Closure",
-                "description": f"Review key points and assess student understanding"
-            }
-        ]
-        
-        materials = [
-            "Whiteboard and markers",
-            "Textbook and supplementary materials",
-            "Worksheets and practice problems",
-            "Digital resources and videos"
-        ]
-        
-        differentiation_strategies = [
-            "Provide additional support for struggling students",
-            "Offer extension activities for advanced learners",
-            "Use visual aids and hands-on materials"
+            {"time": time, "activity": activity, "description": description.format(topic=topic)}
+            for time, activity, description in _LESSON_STRUCTURE
         ]
         
         lesson_plan = {
@@ -129,9 +182,9 @@ class SimpleFreeAIGenerator:
             "topic": topic,
             "duration": duration,
             "objective": f"Students will understand the fundamental concepts of {topic} and be able to apply this knowledge to solve problems and analyze different contexts.",
-            "materials": materials,
+            "materials": list(_MATERIALS),
             "lesson_structure": lesson_structure,
-            "differentiation_strategies": differentiation_strategies,
+            "differentiation_strategies": list(_DIFFERENTIATION_STRATEGIES),
             "assessment": "Students will be assessed through class participation, worksheet completion, group discussion, and individual practice activities.",
             "homework_assignment": {
                 "title": f"{topic} Practice Assignment",
@@ -149,20 +202,8 @@ class SimpleFreeAIGenerator:
         """Generate an educational assignment"""
         num_questions = 3 if difficulty == "easy" else 4 if difficulty == "medium" else 5
         
-        questions = [
-            f"Explain the concept of {topic} in your own words.",
-            f"Provide three examples of {topic} in real-world situations.",
-            f"Compare and contrast different approaches to {topic}.",
-            f"Create a problem related to {topic} and solve it.",
-            f"Analyze the importance of {topic} in {subject}."
-        ]
-        
-        rubric = {
-            "Excellent": "Complete understanding with detailed explanations",
-            "Good": "Solid understanding with adequate explanations",
-            "Satisfactory": "Basic understanding with some explanations",
-            "Needs Improvement": "Limited understanding or missing explanations"
-        }
+        # Only the questions that are emitted get formatted
+        questions = [_QUESTION_TEMPLATES[i].format(topic=topic, subject=subject) for i in range(num_questions)]
         
         assignment = {
             "subject": subject,
@@ -171,8 +212,8 @@ class SimpleFreeAIGenerator:
             "difficulty": difficulty,
             "due_date": "Next class period",
             "estimated_time": f"{num_questions * 10} minutes",
-            "questions": questions[:num_questions],
-            "rubric": rubric,
+            "questions": questions,
+            "rubric": dict(_RUBRIC),
             "instructions": f"Complete all questions related to {topic}. Show your work and provide detailed explanations.",
             "learning_objectives": [
                 f"Demonstrate understanding of {topic}",
@@ -187,22 +228,15 @@ class SimpleFreeAIGenerator:
 
     def generate_curriculum_plan(self, subject: str, grade: str, duration_weeks: int) -> Dict[str, Any]:
         """Generate a curriculum plan"""
+        # Objectives depend only on the subject, so format them once rather than per week
+        objectives = tuple(t.format(subject=subject) for t in _UNIT_OBJECTIVE_TEMPLATES)
         units = []
         for week in range(1, duration_weeks + 1):
             units.append({
                 "week": week,
                 "topic": f"Unit {week}: Advanced {subject} Concepts",
-                "objectives": [
-                    f"Master fundamental {subject} principles",
-                    f"Apply {subject} knowledge to complex problems",
-                    f"Develop critical thinking skills"
-                ],
-                "activities": [
-                    "Lecture and discussion",
-                    "Hands-on practice",
-                    "Group projects",
-                    "Individual assessments"
-                ]
+                "objectives": list(objectives),
+                "activities": list(_UNIT_ACTIVITIES)
             })
         
         curriculum = {
@@ -210,17 +244,8 @@ class SimpleFreeAIGenerator:
             "grade": grade,
             "duration_weeks": duration_weeks,
             "units": units,
-            "assessment_strategy": {
-                "formative": "Weekly quizzes and class participation",
-                "summative": "Unit tests and final project",
-                "ongoing": "Homework assignments and classwork"
-            },
-            "resources": [
-                "Textbook and supplementary materials",
-                "Digital learning platforms",
-                "Hands-on materials and manipulatives",
-                "Assessment tools and rubrics"
-            ],
+            "assessment_strategy": dict(_ASSESSMENT_STRATEGY),
+            "resources": list(_CURRICULUM_RESOURCES),
             "generated_at": datetime.now().isoformat(),
             "model": "simple-free-ai-generator"
         }
@@ -270,7 +295,7 @@ class SimpleFreeAIGenerator:
                 "Explore advanced topics in favorite subjects",
                 "Develop additional technical skills"
             ],
-            "teacher_recommendations": random.sample(self.recommendations, 3),
+            "teacher_recommendations": self._sample(self._recommendation_pool, 3),
             "generated_at": datetime.now().isoformat(),
             "model": "simple-free-ai-generator"
         }
@@ -279,6 +304,7 @@ class SimpleFreeAIGenerator:
 
     def generate_parent_newsletter(self, school_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a parent newsletter"""
+        now = datetime.now()
         school_name = school_data.get('school_name', 'Excellence Academy')
         contact_info = school_data.get('contact_info', {
             'phone': '(555) 123-4567',
@@ -287,7 +313,7 @@ class SimpleFreeAIGenerator:
         
         newsletter = {
             "school_name": school_name,
-            "newsletter_date": datetime.now().strftime("%B %Y"),
+            "newsletter_date": now.strftime("%B %Y"),
             "principal_message": f"Welcome to another exciting month at {school_name}! We are proud of our students' continued growth and achievements.",
             "upcoming_events": [
                 {"date": "December 15", "event": "Winter Concert"},
@@ -313,7 +339,7 @@ class SimpleFreeAIGenerator:
                 {"date": "January 8", "description": "New semester begins"}
             ],
             "contact_information": contact_info,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now.isoformat(),
             "model": "simple-free-ai-generator"
         }
         
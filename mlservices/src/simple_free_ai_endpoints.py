@@ -1,7 +1,14 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Extra, ValidationError
+from typing import Callable, Dict, Any, Optional, List
+
+from src.serialization import ORJSON_AVAILABLE, dumps, loads, now_iso
 
 # Import free AI generator
 try:
@@ -11,9 +18,156 @@ except ImportError:
     FREE_AI_AVAILABLE = False
     print("⚠️ Free AI generator not available")
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/ml/free-ai", tags=["Free AI Content Generation"])
 
-class StudentReportRequest(BaseModel):
+# Generation routes are only mounted on router when the generator imported, so handlers need no availability check
+generation_router = APIRouter()
+
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """Serialize a handler payload directly, bypassing FastAPI's jsonable_encoder walk"""
+    return Response(content=dumps(payload), media_type="application/json")
+
+# Static payload, serialized once at import instead of on every request
+_CAPABILITIES = {
+    "success": True,
+    "data": {
+        "service_name": "Free AI Content Generation",
+        "description": "Local AI-powered educational content generation",
+        "features": [
+            "Student Reports",
+            "Lesson Plans", 
+            "Assignments",
+            "Curriculum Plans",
+            "Student Portfolios",
+            "Parent Newsletters"
+        ],
+        "technologies_used": [
+            "Custom Templates",
+            "Rule-Based Generation",
+            "Local Content Generation"
+        ],
+        "cost": "100% FREE - No external API charges",
+        "privacy": "100% Private - All processing local",
+        "accuracy": "85-95% for educational content",
+        "languages_supported": ["English"],
+        "subjects_supported": [
+            "Mathematics", "Science", "English", "History", 
+            "Geography", "Art", "Music"
+        ]
+    },
+    "message": "Free AI capabilities information retrieved"
+}
+
+_CAPABILITIES_JSON = dumps(_CAPABILITIES)
+
+BULK_MAX_IN_FLIGHT = 32  # Bulk reports submitted to the executor at once
+
+def init_report_worker() -> None:
+    """Process pool initializer: load the generator once and reseed the forked RNG"""
+    random.seed()
+    from src.free_ai_generator import free_ai_generator  # noqa: F401
+
+def _generate_report_job(student_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Picklable entry point for generating one report in a worker"""
+    return free_ai_generator.generate_student_report(student_data)
+
+class AsyncBatcher:
+    """Coalesce concurrent single-item requests into one batched generator call"""
+    
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], 
+                 max_batch: int = 32, max_latency_ms: float = 5):
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_latency = max_latency_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result from the next batch"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queue and worker are bound to the loop that created them
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+    
+    async def _run(self):
+        """Drain up to max_batch items or until max_latency elapses, then run them together"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_latency
+            
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            items = [item for item, _ in batch]
+            try:
+                results = await asyncio.to_thread(self.batch_fn, items)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+class ResultCache:
+    """LRU cache of generator results keyed by generator and arguments, expiring after ttl seconds"""
+    
+    def __init__(self, maxsize: int = 2048, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # Least recently used entries first
+    
+    def call(self, fn: Callable[..., Any], *args) -> Any:
+        """Return the cached result of fn(*args), generating it on a miss"""
+        # Lists from request bodies become tuples so the key is hashable
+        key = (fn.__name__,) + tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args)
+        now = time.monotonic()
+        
+        entry = self._entries.get(key)
+        if entry is not None and now - entry[0] < self.ttl:
+            self._entries.move_to_end(key)
+            return entry[1]
+        
+        result = fn(*args)
+        self._entries[key] = (now, result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return result
+
+if FREE_AI_AVAILABLE:
+    _report_batcher = AsyncBatcher(free_ai_generator.generate_student_report_batch)
+
+# Lesson plans, syllabi and curricula repeat across classes; student-specific content is not cached
+_result_cache = ResultCache()
+
+class RequestModel(BaseModel):
+    """Base for request bodies: read-only once validated, unknown fields dropped"""
+    class Config:
+        frozen = True
+        extra = Extra.ignore
+
+class StudentReportRequest(RequestModel):
     name: str
     subject: str
     grade: str
@@ -22,355 +176,242 @@ class StudentReportRequest(BaseModel):
     weaknesses: List[str]
     goals: List[str]
 
-class LessonPlanRequest(BaseModel):
+class LessonPlanRequest(RequestModel):
     subject: str
     grade: str
     topic: str
     duration: int
     learning_objectives: List[str]
 
-class AssignmentRequest(BaseModel):
+class AssignmentRequest(RequestModel):
     subject: str
     grade: str
     topic: str
     difficulty: str
+    board: str = "CBSE"
 
-class SyllabusRequest(BaseModel):
-    subject: str
-    grade: str
-    board: str
-    topics: List[str]
-
-class QuestionPaperRequest(BaseModel):
-    subject: str
-    grade: str
-    topic: str
-    difficulty: str
-    question_types: List[str]
-    total_marks: int
-
-class TopicExplanationRequest(BaseModel):
-    subject: str
-    grade: str
-    topic: str
-    complexity: str
-
-class CurriculumRequest(BaseModel):
+class CurriculumRequest(RequestModel):
     subject: str
     grade: str
     duration_weeks: int
 
-class PortfolioRequest(BaseModel):
+class PortfolioRequest(RequestModel):
     student_name: str
     grade: str
     subjects: List[str]
     achievements: List[str]
     activities: List[str]
 
-class NewsletterRequest(BaseModel):
+class NewsletterRequest(RequestModel):
     school_name: str
     month: str
     year: str
     highlights: List[str]
     announcements: List[str]
 
+class BulkStudent(RequestModel):
+    name: str = 'Student'
+    subject: str = 'General'
+    grade: str = '5th Grade'
+    attendance_rate: float = 0.85
+    strengths: List[str] = []
+    weaknesses: List[str] = []
+    goals: List[str] = []
+
+class BulkStudents(BaseModel):
+    """Bulk report body, parsed straight from raw bytes"""
+    __root__: List[BulkStudent]
+    
+    class Config:
+        json_loads = loads
+
 @router.get("/capabilities")
 async def get_capabilities():
     """Get information about Free AI capabilities"""
-    return {
-        "success": True,
-        "data": {
-            "service_name": "Free AI Content Generation",
-            "description": "Local AI-powered educational content generation",
-            "features": [
-                "Student Reports",
-                "Lesson Plans", 
-                "Assignments",
-                "Syllabus",
-                "Question Papers",
-                "Topic Explanations",
-                "Curriculum Plans",
-                "Student Portfolios",
-                "Parent Newsletters"
-            ],
-            "technologies_used": [
-                "Custom Templates",
-                "Rule-Based Generation",
-                "Local Content Generation"
-            ],
-            "cost": "100% FREE - No external API charges",
-            "privacy": "100% Private - All processing local",
-            "accuracy": "85-95% for educational content",
-            "languages_supported": ["English"],
-            "subjects_supported": [
-                "Mathematics", "Science", "English", "History", 
-                "Geography", "Art", "Music"
-            ]
-        },
-        "message": "Free AI capabilities information retrieved"
-    }
-
-@router.post("/reports/generate")
+    return Response(content=_CAPABILITIES_JSON, media_type="application/json")
+
+@generation_router.post("/reports/generate")
 async def generate_student_report(request: StudentReportRequest):
     """Generate comprehensive student report using free AI"""
-    if not FREE_AI_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Free AI generator not available")
+    result = await _report_batcher.submit(dict(request))
     
-    try:
-        result = free_ai_generator.generate_student_report(
-            request.name,
-            request.subject,
-            request.grade,
-            request.attendance_rate,
-            request.strengths,
-            request.weaknesses,
-            request.goals
-        )
-        
-        return {
-            "success": True,
-            "data": result,
-            "message": "Student report generated successfully",
-            "cost": "Free",
-            "generated_at": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating report: {str(e)}")
-
-@router.post("/bulk/generate-reports")
-async def generate_bulk_reports(students: List[Dict[str, Any]]):
+    return _json_response({
+        "success": True,
+        "data": result,
+        "message": "Student report generated successfully",
+        "cost": "Free",
+        "generated_at": now_iso()
+    })
+
+@generation_router.post("/bulk/generate-reports")
+async def generate_bulk_reports(request: Request):
     """Generate multiple student reports at once"""
-    if not FREE_AI_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Free AI generator not available")
-    
+    # Decode and validate the raw body in one pass against the typed schema, defaults included
     try:
-        reports = []
-        for student in students:
-            report = free_ai_generator.generate_student_report(
-                student.get('name', 'Student'),
-                student.get('subject', 'General'),
-                student.get('grade', '5th Grade'),
-                student.get('attendance_rate', 0.85),
-                student.get('strengths', []),
-                student.get('weaknesses', []),
-                student.get('goals', [])
-            )
-            reports.append(report)
-        
-        return {
-            "success": True,
-            "data": {
-                "reports": reports,
-                "total_generated": len(reports),
+        students = BulkStudents.parse_raw(await request.body()).__root__
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors())
+    
+    # Template generation is pure Python, so spread it across the app's worker processes
+    # when one is configured; otherwise use the default thread pool
+    pool = getattr(request.app.state, "process_pool", None)
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(BULK_MAX_IN_FLIGHT)
+    
+    async def generate(index: int, student: BulkStudent) -> tuple:
+        async with semaphore:
+            try:
+                return index, await loop.run_in_executor(pool, _generate_report_job, dict(student))
+            except Exception:
+                # The traceback stays in the server log; the client only learns which student failed
+                logger.exception("Error generating bulk report %d", index)
+                return index, None
+    
+    async def stream():
+        # Same envelope as a buffered response, but each report is written as soon as it finishes
+        tasks = [asyncio.ensure_future(generate(index, student)) for index, student in enumerate(students)]
+        try:
+            yield b'{"success":true,"data":{"reports":['
+            
+            # One bad student should not fail the whole batch
+            generated = 0
+            failed = []
+            for next_done in asyncio.as_completed(tasks):
+                index, report = await next_done
+                if report is None:
+                    failed.append({"index": index, "error": "Report generation failed"})
+                    continue
+                yield (b',' if generated else b'') + dumps(report)
+                generated += 1
+            
+            # Close the reports array, then splice in the remaining keys of data and of the envelope
+            yield b'],' + dumps({
+                "total_generated": generated,
+                "failed": failed,
                 "batch_processing": True
-            },
-            "message": f"Generated {len(reports)} student reports",
-            "cost": "FREE - No API charges"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Bulk generation failed: {str(e)}")
-
-@router.post("/lesson-plans/generate")
+            })[1:] + b',' + dumps({
+                "message": f"Generated {generated} student reports",
+                "cost": "FREE - No API charges"
+            })[1:]
+        finally:
+            # Client went away mid-stream: stop queueing the remaining students
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(stream(), media_type="application/json")
+
+@generation_router.post("/lesson-plans/generate")
 async def generate_lesson_plan(request: LessonPlanRequest):
     """Generate educational lesson plan using free AI"""
-    if not FREE_AI_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Free AI generator not available")
+    result = _result_cache.call(
+        free_ai_generator.generate_lesson_plan,
+        request.subject,
+        request.grade,
+        request.topic,
+        request.duration
+    )
     
-    try:
-        result = free_ai_generator.generate_lesson_plan(
-            request.subject,
-            request.grade,
-            request.topic,
-            request.duration,
-            request.learning_objectives
-        )
-        
-        return {
-            "success": True,
-            "data": result,
-            "message": "Lesson plan generated successfully",
-            "cost": "Free",
-            "generated_at": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating lesson plan: {str(e)}")
-
-@router.post("/assignments/generate")
+    return _json_response({
+        "success": True,
+        "data": result,
+        "message": "Lesson plan generated successfully",
+        "cost": "Free",
+        "generated_at": now_iso()
+    })
+
+@generation_router.post("/assignments/generate")
 async def generate_assignment(request: AssignmentRequest):
     """Generate educational assignment using free AI"""
-    if not FREE_AI_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Free AI generator not available")
+    # The generator reads the class number out of the grade, e.g. "8th Grade" or "Class 8"
+    if not any(char.isdigit() for char in request.grade):
+        raise HTTPException(status_code=400, detail="Error generating assignment: grade must include a class number")
     
-    try:
-        result = free_ai_generator.generate_assignment(
-            request.subject,
-            request.grade,
-            request.topic,
-            request.difficulty
-        )
-        
-        # Extract the assignment data from the nested structure
-        assignment_data = result.get("assignment", {})
-        
-        # Add additional metadata
-        assignment_data.update({
-            "subject": result.get("subject"),
-            "grade": result.get("grade"),
-            "topic": result.get("topic"),
-            "difficulty": result.get("difficulty"),
-            "generated_at": result.get("generated_at"),
-            "model": result.get("model"),
-            "confidence": result.get("confidence")
-        })
-        
-        return {
-            "success": True,
-            "data": assignment_data,
-            "message": "Assignment generated successfully",
-            "cost": "Free",
-            "generated_at": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating assignment: {str(e)}")
-
-@router.post("/syllabus/generate")
-async def generate_syllabus(request: SyllabusRequest):
-    """Generate educational syllabus using free AI"""
-    if not FREE_AI_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Free AI generator not available")
+    result = free_ai_generator.generate_assignment(
+        request.board,
+        request.subject,
+        request.grade,
+        request.topic,
+        request.difficulty
+    )
     
-    try:
-        result = free_ai_generator.generate_syllabus(
-            request.subject,
-            request.grade,
-            request.board,
-            request.topics
-        )
-        
-        return {
-            "success": True,
-            "data": result,
-            "message": "Syllabus generated successfully",
-            "cost": "Free",
-            "generated_at": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating syllabus: {str(e)}")
-
-@router.post("/question-papers/generate")
-async def generate_question_paper(request: QuestionPaperRequest):
-    """Generate educational question paper using free AI"""
-    if not FREE_AI_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Free AI generator not available")
+    # Extract the assignment data from the nested structure
+    assignment_data = result.get("assignment", {})
     
-    try:
-        result = free_ai_generator.generate_question_paper(
-            request.subject,
-            request.grade,
-            request.topic,
-            request.difficulty,
-            request.question_types,
-            request.total_marks
-        )
-        
-        return {
-            "success": True,
-            "data": result,
-            "message": "Question paper generated successfully",
-            "cost": "Free",
-            "generated_at": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating question paper: {str(e)}")
-
-@router.post("/topic-explanations/generate")
-async def generate_topic_explanation(request: TopicExplanationRequest):
-    """Generate educational topic explanation using free AI"""
-    if not FREE_AI_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Free AI generator not available")
+    # Add additional metadata
+    assignment_data.update({
+        "board": result.get("board"),
+        "subject": result.get("subject"),
+        "grade": result.get("grade"),
+        "topic": result.get("topic"),
+        "difficulty": result.get("difficulty"),
+        "generated_at": result.get("generated_at"),
+        "model": result.get("model"),
+        "confidence": result.get("confidence")
+    })
     
-    try:
-        result = free_ai_generator.generate_topic_explanation(
-            request.subject,
-            request.grade,
-            request.topic,
-            request.complexity
-        )
-        
-        return {
-            "success": True,
-            "data": result,
-            "message": "Topic explanation generated successfully",
-            "cost": "Free",
-            "generated_at": datetime.now().isoformat()
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating topic explanation: {str(e)}")
-
-@router.post("/curriculum/generate")
+    return _json_response({
+        "success": True,
+        "data": assignment_data,
+        "message": "Assignment generated successfully",
+        "cost": "Free",
+        "generated_at": now_iso()
+    })
+
+@generation_router.post("/curriculum/generate")
 async def generate_curriculum_plan(request: CurriculumRequest):
     """Generate complete curriculum plan"""
-    if not FREE_AI_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Free AI generator not available")
+    result = _result_cache.call(
+        free_ai_generator.generate_curriculum_plan,
+        request.subject,
+        request.grade,
+        request.duration_weeks
+    )
     
-    try:
-        result = free_ai_generator.generate_curriculum_plan(
-            request.subject,
-            request.grade,
-            request.duration_weeks
-        )
-        
-        return {
-            "success": True,
-            "data": result,
-            "message": "Curriculum plan generated successfully",
-            "cost": "FREE - No API charges"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Curriculum generation failed: {str(e)}")
-
-@router.post("/portfolio/generate")
+    return _json_response({
+        "success": True,
+        "data": result,
+        "message": "Curriculum plan generated successfully",
+        "cost": "FREE - No API charges"
+    })
+
+@generation_router.post("/portfolio/generate")
 async def generate_student_portfolio(request: PortfolioRequest):
     """Generate comprehensive student portfolio"""
-    if not FREE_AI_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Free AI generator not available")
+    result = free_ai_generator.generate_student_portfolio(dict(request))
     
-    try:
-        result = free_ai_generator.generate_student_portfolio(request.dict())
-        
-        return {
-            "success": True,
-            "data": result,
-            "message": "Student portfolio generated successfully",
-            "cost": "FREE - No API charges"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Portfolio generation failed: {str(e)}")
-
-@router.post("/newsletter/generate")
+    return _json_response({
+        "success": True,
+        "data": result,
+        "message": "Student portfolio generated successfully",
+        "cost": "FREE - No API charges"
+    })
+
+@generation_router.post("/newsletter/generate")
 async def generate_parent_newsletter(request: NewsletterRequest):
     """Generate school newsletter for parents"""
-    if not FREE_AI_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Free AI generator not available")
+    result = free_ai_generator.generate_parent_newsletter(dict(request))
     
-    try:
-        result = free_ai_generator.generate_parent_newsletter(request.dict())
-        
-        return {
-            "success": True,
-            "data": result,
-            "message": "Parent newsletter generated successfully",
-            "cost": "FREE - No API charges"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Newsletter generation failed: {str(e)}")
+    return _json_response({
+        "success": True,
+        "data": result,
+        "message": "Parent newsletter generated successfully",
+        "cost": "FREE - No API charges"
+    })
+
+if FREE_AI_AVAILABLE:
+    router.include_router(generation_router)
+else:
+    @router.post("/{path:path}")
+    async def generator_unavailable(path: str):
+        """Answer every generation route while the generator is missing"""
+        raise HTTPException(status_code=503, detail="Free AI generator not available")
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
+    return _json_response({
         "status": "healthy",
         "service": "Free AI Content Generation",
         "available": FREE_AI_AVAILABLE,
-        "timestamp": datetime.now().isoformat()
-    }
+        "timestamp": now_iso()
+    })
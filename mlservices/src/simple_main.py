@@ -1,28 +1,90 @@
-from fastapi import FastAPI
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from starlette.middleware.gzip import GZipMiddleware
 import uvicorn
 
+try:
+    from brotli_asgi import BrotliMiddleware
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 # Import the simple free AI endpoints
-from simple_free_ai_endpoints import router as free_ai_router
+from simple_free_ai_endpoints import router as free_ai_router, init_report_worker, ORJSON_AVAILABLE, FREE_AI_AVAILABLE
+
+if ORJSON_AVAILABLE:
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+else:
+    DefaultResponse = JSONResponse
 
 app = FastAPI(
     title="Simple ML Services",
     description="Simple ML Services for Testing",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultResponse
 )
 
+class OriginOnlyCORSMiddleware(CORSMiddleware):
+    """CORS that steps aside for requests without an Origin header (probes, internal services)"""
+    
+    async def __call__(self, scope, receive, send):
+        # Raw header scan; skips building a Headers object for non-browser traffic
+        if scope["type"] == "http" and not any(name == b"origin" for name, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 # CORS middleware
 app.add_middleware(
-    CORSMiddleware,
+    OriginOnlyCORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger payloads (capabilities, bulk reports); Brotli falls back to gzip for clients without br
+if BROTLI_AVAILABLE:
+    app.add_middleware(BrotliMiddleware, minimum_size=500, quality=5, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Include only the free AI router
 app.include_router(free_ai_router)
 
+@app.exception_handler(Exception)
+async def unhandled_exception(request: Request, exc: Exception):
+    # Handlers only catch bad-input errors; anything else ends up here, and the
+    # traceback goes to the server log rather than the response body
+    return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+# Workers come from a clean forkserver (spawn where it is unavailable) rather than a fork of this threaded server
+WORKER_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+@app.on_event("startup")
+async def configure_executor():
+    # Bulk generation fans out through asyncio.to_thread; size the pool beyond the default
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4))
+    
+    # Large bulk report jobs run across cores instead of contending for one GIL
+    if FREE_AI_AVAILABLE:
+        workers = int(os.getenv("REPORT_PROCESS_WORKERS", os.cpu_count() or 1))
+        app.state.process_pool = ProcessPoolExecutor(max_workers=workers, mp_context=WORKER_CONTEXT,
+                                                     initializer=init_report_worker)
+
+@app.on_event("shutdown")
+async def shutdown_process_pool():
+    pool = getattr(app.state, "process_pool", None)
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
 @app.get("/")
 async def root():
     return {
@@ -50,4 +112,18 @@ if __name__ == "__main__":
     print("🔍 Health check: http://localhost:8000/health")
     print("📊 Free AI Reports: http://localhost:8000/ml/free-ai/reports/generate")
     
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    # Reload only works with a single process; otherwise run one worker per core so
+    # the CPU-bound generators are not serialized behind one GIL
+    debug = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+    workers = 1 if debug else max(2, (os.cpu_count() or 1) - 1)
+    # Split the cores between the server workers' report process pools
+    os.environ.setdefault("REPORT_PROCESS_WORKERS", str(max(1, (os.cpu_count() or 1) // workers)))
+    uvicorn.run(
+        "simple_main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=debug,
+        workers=workers,
+        timeout_keep_alive=30,
+        backlog=2048
+    )
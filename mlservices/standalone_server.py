@@ -1,54 +1,532 @@
 #!/usr/bin/env python3
 """
 Standalone ML Services Server with Free AI Endpoints
+
+Run directly for one worker per core (override with WEB_CONCURRENCY), or under gunicorn:
+    gunicorn standalone_server:app -k uvicorn.workers.UvicornWorker -w $(nproc)
 """
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Extra
+from starlette.middleware.gzip import GZipMiddleware
 import uvicorn
+import anyio.to_thread
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import random
+import multiprocessing
+import os
 import json
-from typing import Dict, List, Any
+import numpy as np
+import sys
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional
 
-# Simple Free AI Generator
-class SimpleFreeAIGenerator:
-    def __init__(self):
-        self.student_names = [
-            "Alex", "Sarah", "Michael", "Emma", "David", "Sophia", "James", "Olivia",
-            "William", "Ava", "Benjamin", "Isabella", "Lucas", "Mia", "Henry", "Charlotte"
-        ]
-        
-        self.subjects = [
-            "Mathematics", "Science", "English", "History", "Geography", "Art", "Music"
-        ]
-        
-        self.positive_adjectives = [
-            "excellent", "outstanding", "remarkable", "impressive", "dedicated", "enthusiastic",
-            "hardworking", "motivated", "creative", "thoughtful", "organized", "reliable"
-        ]
-        
-        self.improvement_areas = [
-            "time management", "organization skills", "class participation", "homework completion",
-            "study habits", "attention to detail", "critical thinking", "communication skills"
-        ]
+from src.serialization import dumps
+
+def _json_default(obj: Any) -> str:
+    """Stdlib encoder hook for the datetimes orjson and msgspec encode natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# orjson encodes straight to bytes, datetimes included; fall back to the stdlib encoder
+# when it is not installed
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    
+    class DefaultResponse(JSONResponse):
+        def render(self, content: Any) -> bytes:
+            return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+# msgspec encodes the fixed-shape generator envelope from a compiled Struct schema
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    from brotli_asgi import BrotliMiddleware
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+def _dumps_line(obj: Any) -> bytes:
+    """Encode one JSON-lines record"""
+    return dumps(obj) + b"\n"
+
+_COST = "FREE - No API charges"
+
+if MSGSPEC_AVAILABLE:
+    class GenerationResult(msgspec.Struct, kw_only=True):
+        """Response envelope shared by the generator endpoints"""
+        success: bool = True
+        data: Any
+        message: str
+        cost: str = _COST
+    
+    _msgspec_encode = msgspec.json.Encoder().encode
+    
+    class MsgspecResponse(JSONResponse):
+        def render(self, content: Any) -> bytes:
+            return _msgspec_encode(content)
+
+def _generation_response(data: Any, message: str) -> JSONResponse:
+    """Wrap generator output in the success envelope, already rendered"""
+    if MSGSPEC_AVAILABLE:
+        return MsgspecResponse(GenerationResult(data=data, message=message))
+    return DefaultResponse({"success": True, "data": data, "message": message, "cost": _COST})
+
+_GENERATED_AT_MARK = "@@generated_at@@"
+
+class RenderedResponseCache:
+    """LRU of rendered generator responses, stored split around their generated_at value"""
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # Least recently used entries first
+        self._lock = threading.Lock()  # Handlers run in the threadpool
+    
+    def respond(self, key: Any, build, message: str, generated_at: str) -> Response:
+        """Response for key stamped with generated_at, calling build() for the data only on a miss"""
+        with self._lock:
+            parts = self._entries.get(key)
+            if parts is not None:
+                self._entries.move_to_end(key)
         
-        self.achievements = [
-            "shows great improvement", "demonstrates strong understanding", "excels in group work",
-            "displays excellent problem-solving skills", "shows creativity in assignments",
-            "maintains consistent effort", "participates actively in discussions"
-        ]
+        if parts is None:
+            data = build()
+            data["generated_at"] = _GENERATED_AT_MARK
+            body = _generation_response(data, message).body
+            # Only constant fields follow generated_at, so the last mark is ours even if input repeats it
+            head, _, tail = body.rpartition(_GENERATED_AT_MARK.encode())
+            parts = (head, tail)
+            with self._lock:
+                self._entries[key] = parts
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
         
-        self.recommendations = [
-            "Continue practicing regularly", "Focus on completing assignments on time",
-            "Participate more in class discussions", "Review material before tests",
-            "Ask questions when clarification is needed", "Work on organization skills",
-            "Practice time management", "Engage in additional reading"
+        return Response(parts[0] + generated_at.encode() + parts[1], media_type="application/json")
+
+# Curricula and newsletters repeat across classes and parents; repeat hits skip building and encoding
+_response_cache = RenderedResponseCache()
+
+# Constant endpoint bodies, encoded once at import
+_ROOT_JSON = dumps({
+    "message": "Standalone ML Services Running",
+    "version": "1.0.0",
+    "endpoints": {
+        "free_ai_reports": "/ml/free-ai/reports/generate",
+        "free_ai_lesson_plans": "/ml/free-ai/lesson-plans/generate",
+        "free_ai_assignments": "/ml/free-ai/assignments/generate",
+        "free_ai_capabilities": "/ml/free-ai/capabilities"
+    }
+})
+
+_CAPABILITIES_JSON = dumps({
+    "success": True,
+    "data": {
+        "available_features": [
+            "Student Progress Reports",
+            "Lesson Plan Generation", 
+            "Assignment Creation",
+            "Curriculum Planning",
+            "Student Portfolios",
+            "Parent Newsletters"
+        ],
+        "technologies_used": [
+            "Custom Templates",
+            "Rule-Based Generation",
+            "Local Content Generation"
+        ],
+        "cost": "100% FREE - No external API charges",
+        "privacy": "100% Private - All processing local",
+        "accuracy": "85-95% for educational content",
+        "languages_supported": ["English"],
+        "subjects_supported": [
+            "Mathematics", "Science", "English", "History", 
+            "Geography", "Art", "Music"
         ]
+    },
+    "message": "Free AI capabilities information retrieved"
+})
+
+# Static content shared by every response. These objects are never mutated, only serialized,
+# so handlers reference them directly instead of rebuilding the literals per request.
+_REPORT_NEXT_STEPS = (
+    "Continue current study habits",
+    "Focus on identified improvement areas",
+    "Maintain regular attendance",
+    "Seek additional help when needed"
+)
+
+_SAMPLE_STUDENTS = (
+    {"student_name": "Alex Johnson", "subject": "Mathematics", "grade": "A", "attendance_rate": 0.95},
+    {"student_name": "Sarah Smith", "subject": "Science", "grade": "B+", "attendance_rate": 0.88},
+    {"student_name": "Michael Brown", "subject": "English", "grade": "A-", "attendance_rate": 0.92}
+)
+
+# String templates rendered with format_map against {"topic": ..., "subject": ...}
+_LESSON_STRUCTURE_TMPLS = (
+    ("5 minutes", "Introduction and Warm-up", "Introduce the topic of {topic} and engage students with a brief discussion"),
+    ("15 minutes", "Direct Instruction", "Present key concepts of {topic} using visual aids and examples"),
+    ("15 minutes", "Guided Practice", "Students work on {topic} problems with teacher guidance"),
+    ("5 minutes", "Closure and Review", "Summarize key points and assign homework related to {topic}")
+)
+
+_LESSON_OBJECTIVE_TMPLS = (
+    "Understand the basic concepts of {topic}",
+    "Apply {topic} knowledge to solve problems",
+    "Demonstrate mastery of {topic} through practice"
+)
+
+_LESSON_HOMEWORK_TMPL = "Complete practice problems related to {topic}"
+
+_LESSON_CONNECTION_TMPLS = (
+    "Connect {topic} to real-world applications",
+    "Integrate with other subjects where applicable"
+)
+
+_QUESTION_TMPLS = (
+    ("Explain the main concept of {topic} in {subject}.", "essay", 10),
+    ("Provide three examples of {topic} in real-world applications.", "short_answer", 15),
+    ("Compare and contrast {topic} with related concepts in {subject}.", "comparison", 20)
+)
+
+_ASSIGNMENT_OBJECTIVE_TMPLS = (
+    "Understand the key concepts of {topic}",
+    "Apply {topic} knowledge to solve problems",
+    "Communicate understanding effectively"
+)
+
+_LESSON_MATERIALS = (
+    "Whiteboard and markers",
+    "Textbook or reference materials",
+    "Practice worksheets",
+    "Visual aids or diagrams"
+)
+
+_LESSON_ASSESSMENT_METHODS = (
+    "Class participation",
+    "Practice problems completion",
+    "Quick quiz on key concepts"
+)
+
+_LESSON_DIFFERENTIATION = (
+    "Provide additional examples for struggling students",
+    "Offer extension activities for advanced students",
+    "Use visual aids for visual learners"
+)
+
+_LESSON_TECHNOLOGY = (
+    "Use interactive whiteboard for demonstrations",
+    "Include online resources for additional practice"
+)
+
+_ASSIGNMENT_RUBRIC = (
+    {
+        "criteria": "Understanding of Concepts",
+        "excellent": "Demonstrates thorough understanding of key concepts",
+        "good": "Shows good understanding with minor gaps",
+        "fair": "Basic understanding with some misconceptions",
+        "poor": "Limited understanding of concepts"
+    },
+    {
+        "criteria": "Application of Knowledge",
+        "excellent": "Successfully applies concepts to new situations",
+        "good": "Applies concepts with some guidance",
+        "fair": "Limited application of concepts",
+        "poor": "Unable to apply concepts"
+    },
+    {
+        "criteria": "Communication",
+        "excellent": "Clear, well-organized, and articulate responses",
+        "good": "Generally clear with minor organizational issues",
+        "fair": "Some clarity issues and organizational problems",
+        "poor": "Unclear and poorly organized responses"
+    }
+)
+
+_ASSIGNMENT_MATERIALS = (
+    "Textbook or reference materials",
+    "Writing materials",
+    "Calculator (if applicable)"
+)
+
+_ASSIGNMENT_GRADING_CRITERIA = {
+    "accuracy": 40,
+    "completeness": 30,
+    "clarity": 20,
+    "originality": 10
+}
+
+_CURRICULUM_RESOURCES = (
+    "Textbook and supplementary materials",
+    "Online resources and videos",
+    "Practice worksheets and exercises",
+    "Assessment tools and rubrics"
+)
+
+_CURRICULUM_TEACHING_STRATEGIES = (
+    "Direct instruction with examples",
+    "Guided practice and group work",
+    "Individual and collaborative projects",
+    "Technology-enhanced learning"
+)
+
+_PORTFOLIO_ACHIEVEMENTS = (
+    {
+        "type": "Academic Excellence",
+        "description": "Maintained A average throughout the year",
+        "date": "2024-2025"
+    },
+    {
+        "type": "Leadership",
+        "description": "Class representative for student council",
+        "date": "2024-2025"
+    },
+    {
+        "type": "Creativity",
+        "description": "Outstanding performance in art and creative writing",
+        "date": "2024-2025"
+    }
+)
+
+_PORTFOLIO_SKILLS = (
+    "Critical thinking and problem solving",
+    "Effective communication",
+    "Collaborative teamwork",
+    "Time management and organization"
+)
+
+_PORTFOLIO_GOALS = (
+    "Continue academic excellence",
+    "Develop leadership skills further",
+    "Explore new subjects and interests",
+    "Participate in more extracurricular activities"
+)
+
+_PORTFOLIO_RECOMMENDATIONS = (
+    "Continue to demonstrate strong academic performance",
+    "Consider advanced placement opportunities",
+    "Maintain positive attitude and work ethic"
+)
+
+_NEWSLETTER_EVENTS = (
+    {
+        "event": "Parent-Teacher Conferences",
+        "date": "Next Month",
+        "description": "Opportunity to discuss your child's progress"
+    },
+    {
+        "event": "Science Fair",
+        "date": "Next Month",
+        "description": "Students showcase their scientific projects"
+    },
+    {
+        "event": "Sports Day",
+        "date": "Next Month",
+        "description": "Annual sports competition and activities"
+    }
+)
+
+_NEWSLETTER_ACHIEVEMENTS = (
+    "Academic excellence awards presented to outstanding students",
+    "Art competition winners announced",
+    "Math Olympiad participants recognized",
+    "Reading challenge completion certificates distributed"
+)
+
+_NEWSLETTER_ACADEMIC_UPDATES = (
+    "New curriculum implementation progressing well",
+    "Technology integration enhancing learning experiences",
+    "Library resources expanded with new books and digital materials",
+    "After-school programs showing positive results"
+)
+
+_NEWSLETTER_PARENT_INVOLVEMENT = (
+    "Volunteer opportunities available in various departments",
+    "Parent workshops on supporting learning at home",
+    "Feedback sessions for school improvement",
+    "Community service projects for families"
+)
+
+_NEWSLETTER_IMPORTANT_DATES = (
+    "Monthly assessment week",
+    "School holiday schedule",
+    "Exam preparation guidelines",
+    "Extracurricular activity registration"
+)
+
+@lru_cache(maxsize=512)
+def _build_lesson_plan(subject: str, grade: str, topic: str, duration: int) -> MappingProxyType:
+    """Lesson plan content, which depends only on its inputs"""
+    ctx = {"topic": topic, "subject": subject}
+    lesson_structure = [
+        {"time": time, "activity": activity, "description": template.format_map(ctx)}
+        for time, activity, template in _LESSON_STRUCTURE_TMPLS
+    ]
+
+    lesson_plan = {
+        "subject": subject,
+        "grade": grade,
+        "topic": topic,
+        "duration_minutes": duration,
+        "lesson_structure": lesson_structure,
+        "learning_objectives": [template.format_map(ctx) for template in _LESSON_OBJECTIVE_TMPLS],
+        "materials_needed": _LESSON_MATERIALS,
+        "assessment_methods": _LESSON_ASSESSMENT_METHODS,
+        "homework_assignment": _LESSON_HOMEWORK_TMPL.format_map(ctx),
+        "differentiation_strategies": _LESSON_DIFFERENTIATION,
+        "technology_integration": _LESSON_TECHNOLOGY,
+        "cross_curricular_connections": [template.format_map(ctx) for template in _LESSON_CONNECTION_TMPLS],
+        "generated_at": None,  # Filled per call
+        "model": "standalone-free-ai-generator"
+    }
+
+    return MappingProxyType(lesson_plan)
+
+@lru_cache(maxsize=512)
+def _build_assignment(subject: str, grade: str, topic: str, difficulty: str) -> MappingProxyType:
+    """Assignment content, which depends only on its inputs"""
+    ctx = {"topic": topic, "subject": subject}
+    questions = [
+        {"question": template.format_map(ctx), "type": kind, "points": points, "difficulty": difficulty}
+        for template, kind, points in _QUESTION_TMPLS
+    ]
+
+    assignment = {
+        "subject": subject,
+        "grade": grade,
+        "topic": topic,
+        "difficulty": difficulty,
+        "total_points": 45,
+        "estimated_time": "30-45 minutes",
+        "questions": questions,
+        "rubric": _ASSIGNMENT_RUBRIC,
+        "instructions": f"Complete all questions related to {topic}. Show your work and provide detailed explanations where required.",
+        "due_date": "One week from assignment date",
+        "learning_objectives": [template.format_map(ctx) for template in _ASSIGNMENT_OBJECTIVE_TMPLS],
+        "materials_needed": _ASSIGNMENT_MATERIALS,
+        "submission_format": "Written responses with clear explanations",
+        "grading_criteria": _ASSIGNMENT_GRADING_CRITERIA,
+        "generated_at": None,  # Filled per call
+        "model": "standalone-free-ai-generator"
+    }
+
+    return MappingProxyType(assignment)
+
+@lru_cache(maxsize=512)
+def _build_curriculum(subject: str, grade: str, duration_weeks: int) -> MappingProxyType:
+    """Curriculum content, which depends only on its inputs"""
+    curriculum = {
+        "subject": subject,
+        "grade": grade,
+        "duration_weeks": duration_weeks,
+        "units": [
+            {
+                "unit_number": 1,
+                "title": f"Introduction to {subject}",
+                "duration_weeks": 2,
+                "topics": ["Basic concepts", "Fundamental principles"],
+                "objectives": ["Understand basic concepts", "Apply fundamental principles"],
+                "assessments": ["Quiz", "Class participation"]
+            },
+            {
+                "unit_number": 2,
+                "title": f"Core {subject} Skills",
+                "duration_weeks": 4,
+                "topics": ["Problem solving", "Critical thinking"],
+                "objectives": ["Develop problem-solving skills", "Enhance critical thinking"],
+                "assessments": ["Tests", "Projects"]
+            },
+            {
+                "unit_number": 3,
+                "title": f"Advanced {subject} Applications",
+                "duration_weeks": 4,
+                "topics": ["Real-world applications", "Complex problems"],
+                "objectives": ["Apply knowledge to real situations", "Solve complex problems"],
+                "assessments": ["Final project", "Comprehensive exam"]
+            },
+            {
+                "unit_number": 4,
+                "title": f"{subject} Review and Assessment",
+                "duration_weeks": 2,
+                "topics": ["Review of all concepts", "Final preparation"],
+                "objectives": ["Review all concepts", "Prepare for final assessment"],
+                "assessments": ["Final exam", "Portfolio review"]
+            }
+        ],
+        "resources": _CURRICULUM_RESOURCES,
+        "teaching_strategies": _CURRICULUM_TEACHING_STRATEGIES,
+        "generated_at": None,  # Filled per call
+        "model": "standalone-free-ai-generator"
+    }
+    
+    return MappingProxyType(curriculum)
+
+# Report vocabulary and the object-array sampling pools drawn from it; module-level so every
+# generator (and every forked worker) shares one copy
+_STUDENT_NAMES = (
+    "Alex", "Sarah", "Michael", "Emma", "David", "Sophia", "James", "Olivia",
+    "William", "Ava", "Benjamin", "Isabella", "Lucas", "Mia", "Henry", "Charlotte"
+)
+
+_SUBJECTS = (
+    "Mathematics", "Science", "English", "History", "Geography", "Art", "Music"
+)
+
+_POSITIVE_ADJECTIVES = (
+    "excellent", "outstanding", "remarkable", "impressive", "dedicated", "enthusiastic",
+    "hardworking", "motivated", "creative", "thoughtful", "organized", "reliable"
+)
+
+_IMPROVEMENT_AREAS = (
+    "time management", "organization skills", "class participation", "homework completion",
+    "study habits", "attention to detail", "critical thinking", "communication skills"
+)
+
+_ACHIEVEMENTS = (
+    "shows great improvement", "demonstrates strong understanding", "excels in group work",
+    "displays excellent problem-solving skills", "shows creativity in assignments",
+    "maintains consistent effort", "participates actively in discussions"
+)
+
+_RECOMMENDATIONS = (
+    "Continue practicing regularly", "Focus on completing assignments on time",
+    "Participate more in class discussions", "Review material before tests",
+    "Ask questions when clarification is needed", "Work on organization skills",
+    "Practice time management", "Engage in additional reading"
+)
+
+_ADJECTIVE_POOL = np.array(_POSITIVE_ADJECTIVES, dtype=object)
+_IMPROVEMENT_POOL = np.array(_IMPROVEMENT_AREAS, dtype=object)
+_ACHIEVEMENT_POOL = np.array(_ACHIEVEMENTS, dtype=object)
+_RECOMMENDATION_POOL = np.array(_RECOMMENDATIONS, dtype=object)
+
+# Simple Free AI Generator
+class SimpleFreeAIGenerator:
+    def __init__(self):
+        # Instance RNG: report generation draws from it directly instead of the module-level functions,
+        # and picks from the object-array pools come from the Generator's C sampler
+        self._rng = np.random.default_rng()
 
     def generate_student_report(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a student progress report"""
-        name = student_data.get('student_name', random.choice(self.student_names))
-        subject = student_data.get('subject', random.choice(self.subjects))
+        # One clock read so report_date and generated_at describe the same instant
+        now = datetime.now()
+        rng = self._rng
+        # Only draw a random default when the field is actually missing
+        name = student_data['student_name'] if 'student_name' in student_data else _STUDENT_NAMES[rng.integers(len(_STUDENT_NAMES))]
+        subject = student_data['subject'] if 'subject' in student_data else _SUBJECTS[rng.integers(len(_SUBJECTS))]
         grade = student_data.get('grade', 'B+')
         attendance_rate = student_data.get('attendance_rate', 0.9)
         
@@ -56,17 +534,20 @@ class SimpleFreeAIGenerator:
         attendance_percentage = int(attendance_rate * 100)
         
         # Generate report content
-        strengths = random.sample(self.positive_adjectives, 3)
-        areas_for_improvement = random.sample(self.improvement_areas, 2)
-        achievements = random.sample(self.achievements, 3)
-        recommendations = random.sample(self.recommendations, 3)
+        strengths = self._sample(_ADJECTIVE_POOL, 3)
+        areas_for_improvement = self._sample(_IMPROVEMENT_POOL, 2)
+        achievements = self._sample(_ACHIEVEMENT_POOL, 3)
+        recommendations = self._sample(_RECOMMENDATION_POOL, 3)
+        
+        # One draw for all three scores; upper bounds are exclusive
+        participation, homework, test_average = rng.integers((75, 80, 75), (96, 101, 96)).tolist()
         
         report = {
             "student_name": name,
             "subject": subject,
             "grade": grade,
             "attendance_percentage": attendance_percentage,
-            "report_date": datetime.now().strftime("%B %d, %Y"),
+            "report_date": now.strftime("%B %d, %Y"),
             "teacher_comments": {
                 "strengths": strengths,
                 "areas_for_improvement": areas_for_improvement,
@@ -75,178 +556,123 @@ class SimpleFreeAIGenerator:
             },
             "academic_performance": {
                 "overall_grade": grade,
-                "class_participation": f"{random.randint(75, 95)}%",
-                "homework_completion": f"{random.randint(80, 100)}%",
-                "test_average": f"{random.randint(75, 95)}%"
+                "class_participation": f"{participation}%",
+                "homework_completion": f"{homework}%",
+                "test_average": f"{test_average}%"
             },
-            "next_steps": [
-                "Continue current study habits",
-                "Focus on identified improvement areas",
-                "Maintain regular attendance",
-                "Seek additional help when needed"
-            ],
-            "generated_at": datetime.now().isoformat(),
+            "next_steps": _REPORT_NEXT_STEPS,
+            "generated_at": now,
             "model": "standalone-free-ai-generator"
         }
         
         return report
 
+    def _sample(self, pool: np.ndarray, k: int) -> List[str]:
+        """Pick k distinct entries from a precomputed pool"""
+        return self._rng.choice(pool, size=k, replace=False).tolist()
+
     def generate_lesson_plan(self, subject: str, grade: str, topic: str, duration: int) -> Dict[str, Any]:
         """Generate a lesson plan"""
-        lesson_structure = [
-            {
-                "time": "5 minutes",
-                "activity": "Introduction and Warm-up",
-                "description": f"Introduce the topic of {topic} and engage students with a brief discussion"
-            },
-            {
-                "time": "15 minutes",
-                "activity": "Direct Instruction",
-                "description": f"Present key concepts of {topic} using visual aids and examples"
-            },
-            {
-                "time": "15 minutes",
-                "activity": "Guided Practice",
-                "description": f"Students work on {topic} problems with teacher guidance"
-            },
-            {
-                "time": "5 minutes",
-                "activity": "Closure and Review",
-                "description": f"Summarize key points and assign homework related to {topic}"
-            }
-        ]
-        
-        lesson_plan = {
-            "subject": subject,
-            "grade": grade,
-            "topic": topic,
-            "duration_minutes": duration,
-            "lesson_structure": lesson_structure,
-            "learning_objectives": [
-                f"Understand the basic concepts of {topic}",
-                f"Apply {topic} knowledge to solve problems",
-                f"Demonstrate mastery of {topic} through practice"
-            ],
-            "materials_needed": [
-                "Whiteboard and markers",
-                "Textbook or reference materials",
-                "Practice worksheets",
-                "Visual aids or diagrams"
-            ],
-            "assessment_methods": [
-                "Class participation",
-                "Practice problems completion",
-                "Quick quiz on key concepts"
-            ],
-            "homework_assignment": f"Complete practice problems related to {topic}",
-            "differentiation_strategies": [
-                "Provide additional examples for struggling students",
-                "Offer extension activities for advanced students",
-                "Use visual aids for visual learners"
-            ],
-            "technology_integration": [
-                "Use interactive whiteboard for demonstrations",
-                "Include online resources for additional practice"
-            ],
-            "cross_curricular_connections": [
-                f"Connect {topic} to real-world applications",
-                "Integrate with other subjects where applicable"
-            ],
-            "generated_at": datetime.now().isoformat(),
-            "model": "standalone-free-ai-generator"
-        }
-        
+        lesson_plan = dict(_build_lesson_plan(subject, grade, topic, duration))
+        lesson_plan["generated_at"] = datetime.now()
         return lesson_plan
 
     def generate_assignment(self, subject: str, grade: str, topic: str, difficulty: str) -> Dict[str, Any]:
         """Generate an educational assignment"""
-        questions = [
-            {
-                "question": f"Explain the main concept of {topic} in {subject}.",
-                "type": "essay",
-                "points": 10,
-                "difficulty": difficulty
-            },
-            {
-                "question": f"Provide three examples of {topic} in real-world applications.",
-                "type": "short_answer",
-                "points": 15,
-                "difficulty": difficulty
-            },
-            {
-                "question": f"Compare and contrast {topic} with related concepts in {subject}.",
-                "type": "comparison",
-                "points": 20,
-                "difficulty": difficulty
-            }
-        ]
-        
-        # Add rubric for grading
-        rubric = [
-            {
-                "criteria": "Understanding of Concepts",
-                "excellent": "Demonstrates thorough understanding of key concepts",
-                "good": "Shows good understanding with minor gaps",
-                "fair": "Basic understanding with some misconceptions",
-                "poor": "Limited understanding of concepts"
-            },
-            {
-                "criteria": "Application of Knowledge",
-                "excellent": "Successfully applies concepts to new situations",
-                "good": "Applies concepts with some guidance",
-                "fair": "Limited application of concepts",
-                "poor": "Unable to apply concepts"
-            },
-            {
-                "criteria": "Communication",
-                "excellent": "Clear, well-organized, and articulate responses",
-                "good": "Generally clear with minor organizational issues",
-                "fair": "Some clarity issues and organizational problems",
-                "poor": "Unclear and poorly organized responses"
-            }
-        ]
-        
-        assignment = {
-            "subject": subject,
-            "grade": grade,
-            "topic": topic,
-            "difficulty": difficulty,
-            "total_points": 45,
-            "estimated_time": "30-45 minutes",
-            "questions": questions,
-            "rubric": rubric,  # Add the missing rubric field
-            "instructions": f"Complete all questions related to {topic}. Show your work and provide detailed explanations where required.",
-            "due_date": "One week from assignment date",
-            "learning_objectives": [
-                f"Understand the key concepts of {topic}",
-                f"Apply {topic} knowledge to solve problems",
-                f"Communicate understanding effectively"
-            ],
-            "materials_needed": [
-                "Textbook or reference materials",
-                "Writing materials",
-                "Calculator (if applicable)"
-            ],
-            "submission_format": "Written responses with clear explanations",
-            "grading_criteria": {
-                "accuracy": 40,
-                "completeness": 30,
-                "clarity": 20,
-                "originality": 10
-            },
-            "generated_at": datetime.now().isoformat(),
-            "model": "standalone-free-ai-generator"
-        }
-        
+        assignment = dict(_build_assignment(subject, grade, topic, difficulty))
+        assignment["generated_at"] = datetime.now()
         return assignment
 
 # Initialize the generator
 generator = SimpleFreeAIGenerator()
 
+def init_report_worker() -> None:
+    """Process pool initializer: reseed the RNG copied from the parent process"""
+    generator._rng = np.random.default_rng()
+
+def _generate_report_job(student_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Picklable entry point for generating one report in a worker"""
+    return generator.generate_student_report(student_data)
+
+# Smaller batches are cheaper to generate in-process than to ship to the pool
+BULK_PROCESS_MIN_STUDENTS = 64
+BULK_PROCESS_CHUNKSIZE = 32
+
+# Request bodies are validated once at parse time; defaults mirror the generator's
+class RequestModel(BaseModel):
+    """Base for request bodies: read-only once validated, unknown fields dropped"""
+    class Config:
+        frozen = True
+        extra = Extra.ignore
+
+class StudentReportRequest(RequestModel):
+    # Left unset, the generator picks a random name and subject
+    student_name: Optional[str] = None
+    subject: Optional[str] = None
+    grade: str = "B+"
+    attendance_rate: float = 0.9
+
+class LessonPlanRequest(RequestModel):
+    subject: str = "Mathematics"
+    grade: str = "5th Grade"
+    topic: str = "Basic Concepts"
+    duration: int = 45
+
+class AssignmentRequest(RequestModel):
+    subject: str = "Mathematics"
+    grade: str = "5th Grade"
+    topic: str = "Basic Concepts"
+    difficulty: str = "medium"
+
+class CurriculumRequest(RequestModel):
+    subject: str = "Mathematics"
+    grade: str = "5th Grade"
+    duration_weeks: int = 12
+
+class PortfolioRequest(RequestModel):
+    name: str = "Student Name"
+    grade: str = "5th Grade"
+    subjects: List[str] = ["Mathematics", "Science", "English"]
+
+class ContactInfo(RequestModel):
+    phone: str = "555-1234"
+    email: str = "info@school.edu"
+    website: str = "www.school.edu"
+
+class NewsletterRequest(RequestModel):
+    school_name: str = "Our School"
+    contact_info: ContactInfo = ContactInfo()
+
+class BulkReportsRequest(RequestModel):
+    students: List[StudentReportRequest] = []
+
+def _build_newsletter(school_name: str, contact_info: ContactInfo, issue_date: str) -> Dict[str, Any]:
+    """Newsletter content; generated_at is stamped by the caller"""
+    return {
+        "school_name": school_name,
+        "newsletter_title": f"{school_name} Monthly Newsletter",
+        "issue_date": issue_date,
+        "principal_message": f"Dear Parents and Guardians, Welcome to another exciting month at {school_name}! We are proud to share the achievements and activities of our students. Thank you for your continued support in your child's education.",
+        "upcoming_events": _NEWSLETTER_EVENTS,
+        "student_achievements": _NEWSLETTER_ACHIEVEMENTS,
+        "academic_updates": _NEWSLETTER_ACADEMIC_UPDATES,
+        "parent_involvement": _NEWSLETTER_PARENT_INVOLVEMENT,
+        "important_dates": _NEWSLETTER_IMPORTANT_DATES,
+        "contact_information": {
+            "school_phone": contact_info.phone,
+            "school_email": contact_info.email,
+            "website": contact_info.website,
+            "office_hours": "8:00 AM - 4:00 PM"
+        },
+        "generated_at": None,
+        "model": "standalone-free-ai-generator"
+    }
+
 app = FastAPI(
     title="Standalone ML Services",
     description="Standalone ML Services with Free AI Endpoints",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultResponse
 )
 
 # CORS middleware
@@ -258,183 +684,104 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the larger payloads (newsletter, curriculum, portfolio, bulk reports);
+# Brotli falls back to gzip for clients without br
+if BROTLI_AVAILABLE:
+    app.add_middleware(BrotliMiddleware, minimum_size=512, quality=5, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+# The generator endpoints are plain functions so FastAPI runs their CPU work in the
+# AnyIO threadpool instead of on the event loop; widen it from the default 40 threads
+THREADPOOL_SIZE = 100
+
+@app.on_event("startup")
+async def configure_threadpool():
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+# Workers come from a clean forkserver (spawn where it is unavailable) rather than a fork of this threaded server
+WORKER_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+@app.on_event("startup")
+async def start_process_pool():
+    # Large bulk report jobs run across cores instead of contending for one GIL
+    workers = int(os.getenv("REPORT_PROCESS_WORKERS", os.cpu_count() or 1))
+    app.state.process_pool = ProcessPoolExecutor(max_workers=workers, mp_context=WORKER_CONTEXT,
+                                                 initializer=init_report_worker)
+
+@app.on_event("shutdown")
+async def shutdown_process_pool():
+    app.state.process_pool.shutdown(cancel_futures=True)
+
 @app.get("/")
 async def root():
-    return {
-        "message": "Standalone ML Services Running",
-        "version": "1.0.0",
-        "endpoints": {
-            "free_ai_reports": "/ml/free-ai/reports/generate",
-            "free_ai_lesson_plans": "/ml/free-ai/lesson-plans/generate",
-            "free_ai_assignments": "/ml/free-ai/assignments/generate",
-            "free_ai_capabilities": "/ml/free-ai/capabilities"
-        }
-    }
+    return Response(_ROOT_JSON, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
-    return {
+    return DefaultResponse({
         "status": "healthy",
         "service": "Standalone ML Services",
-        "timestamp": datetime.now().isoformat()
-    }
+        "timestamp": datetime.now()
+    })
 
 @app.post("/ml/free-ai/reports/generate")
-async def generate_student_report(request: Dict[str, Any]):
+def generate_student_report(request: StudentReportRequest):
     """Generate student progress report using free AI"""
     try:
-        result = generator.generate_student_report(request)
+        result = generator.generate_student_report(request.dict(exclude_none=True))
         
-        return {
-            "success": True,
-            "data": result,
-            "message": "Student report generated successfully",
-            "cost": "FREE - No API charges"
-        }
+        return _generation_response(result, "Student report generated successfully")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Report generation failed: {str(e)}")
 
 @app.post("/ml/free-ai/lesson-plans/generate")
-async def generate_lesson_plan(request: Dict[str, Any]):
+def generate_lesson_plan(request: LessonPlanRequest):
     """Generate lesson plan using free AI"""
     try:
-        result = generator.generate_lesson_plan(
-            request.get('subject', 'Mathematics'),
-            request.get('grade', '5th Grade'),
-            request.get('topic', 'Basic Concepts'),
-            request.get('duration', 45)
-        )
+        result = generator.generate_lesson_plan(request.subject, request.grade, request.topic, request.duration)
         
-        return {
-            "success": True,
-            "data": result,
-            "message": "Lesson plan generated successfully",
-            "cost": "FREE - No API charges"
-        }
+        return _generation_response(result, "Lesson plan generated successfully")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Lesson plan generation failed: {str(e)}")
 
 @app.post("/ml/free-ai/assignments/generate")
-async def generate_assignment(request: Dict[str, Any]):
+def generate_assignment(request: AssignmentRequest):
     """Generate educational assignment using free AI"""
     try:
-        result = generator.generate_assignment(
-            request.get('subject', 'Mathematics'),
-            request.get('grade', '5th Grade'),
-            request.get('topic', 'Basic Concepts'),
-            request.get('difficulty', 'medium')
-        )
+        result = generator.generate_assignment(request.subject, request.grade, request.topic, request.difficulty)
         
-        return {
-            "success": True,
-            "data": result,
-            "message": "Assignment generated successfully",
-            "cost": "FREE - No API charges"
-        }
+        return _generation_response(result, "Assignment generated successfully")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Assignment generation failed: {str(e)}")
 
 @app.post("/ml/free-ai/curriculum/generate")
-async def generate_curriculum(request: Dict[str, Any]):
+def generate_curriculum(request: CurriculumRequest):
     """Generate curriculum plan using free AI"""
     try:
-        subject = request.get('subject', 'Mathematics')
-        grade = request.get('grade', '5th Grade')
-        duration_weeks = request.get('duration_weeks', 12)
-        
-        curriculum = {
-            "subject": subject,
-            "grade": grade,
-            "duration_weeks": duration_weeks,
-            "units": [
-                {
-                    "unit_number": 1,
-                    "title": f"Introduction to {subject}",
-                    "duration_weeks": 2,
-                    "topics": ["Basic concepts", "Fundamental principles"],
-                    "objectives": ["Understand basic concepts", "Apply fundamental principles"],
-                    "assessments": ["Quiz", "Class participation"]
-                },
-                {
-                    "unit_number": 2,
-                    "title": f"Core {subject} Skills",
-                    "duration_weeks": 4,
-                    "topics": ["Problem solving", "Critical thinking"],
-                    "objectives": ["Develop problem-solving skills", "Enhance critical thinking"],
-                    "assessments": ["Tests", "Projects"]
-                },
-                {
-                    "unit_number": 3,
-                    "title": f"Advanced {subject} Applications",
-                    "duration_weeks": 4,
-                    "topics": ["Real-world applications", "Complex problems"],
-                    "objectives": ["Apply knowledge to real situations", "Solve complex problems"],
-                    "assessments": ["Final project", "Comprehensive exam"]
-                },
-                {
-                    "unit_number": 4,
-                    "title": f"{subject} Review and Assessment",
-                    "duration_weeks": 2,
-                    "topics": ["Review of all concepts", "Final preparation"],
-                    "objectives": ["Review all concepts", "Prepare for final assessment"],
-                    "assessments": ["Final exam", "Portfolio review"]
-                }
-            ],
-            "resources": [
-                "Textbook and supplementary materials",
-                "Online resources and videos",
-                "Practice worksheets and exercises",
-                "Assessment tools and rubrics"
-            ],
-            "teaching_strategies": [
-                "Direct instruction with examples",
-                "Guided practice and group work",
-                "Individual and collaborative projects",
-                "Technology-enhanced learning"
-            ],
-            "generated_at": datetime.now().isoformat(),
-            "model": "standalone-free-ai-generator"
-        }
-        
-        return {
-            "success": True,
-            "data": curriculum,
-            "message": "Curriculum plan generated successfully",
-            "cost": "FREE - No API charges"
-        }
+        return _response_cache.respond(
+            ("curriculum", request.subject, request.grade, request.duration_weeks),
+            lambda: dict(_build_curriculum(request.subject, request.grade, request.duration_weeks)),
+            "Curriculum plan generated successfully",
+            datetime.now().isoformat()
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Curriculum generation failed: {str(e)}")
 
 @app.post("/ml/free-ai/portfolio/generate")
-async def generate_portfolio(request: Dict[str, Any]):
+def generate_portfolio(request: PortfolioRequest):
     """Generate student portfolio using free AI"""
     try:
-        name = request.get('name', 'Student Name')
-        grade = request.get('grade', '5th Grade')
-        subjects = request.get('subjects', ['Mathematics', 'Science', 'English'])
+        subjects = request.subjects
         
         portfolio = {
-            "student_name": name,
-            "grade": grade,
+            "student_name": request.name,
+            "grade": request.grade,
             "academic_year": "2024-2025",
             "subjects": subjects,
-            "achievements": [
-                {
-                    "type": "Academic Excellence",
-                    "description": "Maintained A average throughout the year",
-                    "date": "2024-2025"
-                },
-                {
-                    "type": "Leadership",
-                    "description": "Class representative for student council",
-                    "date": "2024-2025"
-                },
-                {
-                    "type": "Creativity",
-                    "description": "Outstanding performance in art and creative writing",
-                    "date": "2024-2025"
-                }
-            ],
+            "achievements": _PORTFOLIO_ACHIEVEMENTS,
             "projects": [
                 {
                     "title": f"Science Fair Project - {subjects[1] if len(subjects) > 1 else 'Science'}",
@@ -449,179 +796,79 @@ async def generate_portfolio(request: Dict[str, Any]):
                     "date": "2024"
                 }
             ],
-            "skills_developed": [
-                "Critical thinking and problem solving",
-                "Effective communication",
-                "Collaborative teamwork",
-                "Time management and organization"
-            ],
-            "goals_for_next_year": [
-                "Continue academic excellence",
-                "Develop leadership skills further",
-                "Explore new subjects and interests",
-                "Participate in more extracurricular activities"
-            ],
-            "teacher_recommendations": [
-                "Continue to demonstrate strong academic performance",
-                "Consider advanced placement opportunities",
-                "Maintain positive attitude and work ethic"
-            ],
-            "generated_at": datetime.now().isoformat(),
+            "skills_developed": _PORTFOLIO_SKILLS,
+            "goals_for_next_year": _PORTFOLIO_GOALS,
+            "teacher_recommendations": _PORTFOLIO_RECOMMENDATIONS,
+            "generated_at": datetime.now(),
             "model": "standalone-free-ai-generator"
         }
         
-        return {
-            "success": True,
-            "data": portfolio,
-            "message": "Student portfolio generated successfully",
-            "cost": "FREE - No API charges"
-        }
+        return _generation_response(portfolio, "Student portfolio generated successfully")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Portfolio generation failed: {str(e)}")
 
 @app.post("/ml/free-ai/newsletter/generate")
-async def generate_newsletter(request: Dict[str, Any]):
+def generate_newsletter(request: NewsletterRequest):
     """Generate parent newsletter using free AI"""
     try:
-        school_name = request.get('school_name', 'Our School')
-        contact_info = request.get('contact_info', {})
-        
-        newsletter = {
-            "school_name": school_name,
-            "newsletter_title": f"{school_name} Monthly Newsletter",
-            "issue_date": datetime.now().strftime("%B %Y"),
-            "principal_message": f"Dear Parents and Guardians, Welcome to another exciting month at {school_name}! We are proud to share the achievements and activities of our students. Thank you for your continued support in your child's education.",
-            "upcoming_events": [
-                {
-                    "event": "Parent-Teacher Conferences",
-                    "date": "Next Month",
-                    "description": "Opportunity to discuss your child's progress"
-                },
-                {
-                    "event": "Science Fair",
-                    "date": "Next Month",
-                    "description": "Students showcase their scientific projects"
-                },
-                {
-                    "event": "Sports Day",
-                    "date": "Next Month",
-                    "description": "Annual sports competition and activities"
-                }
-            ],
-            "student_achievements": [
-                "Academic excellence awards presented to outstanding students",
-                "Art competition winners announced",
-                "Math Olympiad participants recognized",
-                "Reading challenge completion certificates distributed"
-            ],
-            "academic_updates": [
-                "New curriculum implementation progressing well",
-                "Technology integration enhancing learning experiences",
-                "Library resources expanded with new books and digital materials",
-                "After-school programs showing positive results"
-            ],
-            "parent_involvement": [
-                "Volunteer opportunities available in various departments",
-                "Parent workshops on supporting learning at home",
-                "Feedback sessions for school improvement",
-                "Community service projects for families"
-            ],
-            "important_dates": [
-                "Monthly assessment week",
-                "School holiday schedule",
-                "Exam preparation guidelines",
-                "Extracurricular activity registration"
-            ],
-            "contact_information": {
-                "school_phone": contact_info.get('phone', '555-1234'),
-                "school_email": contact_info.get('email', 'info@school.edu'),
-                "website": contact_info.get('website', 'www.school.edu'),
-                "office_hours": "8:00 AM - 4:00 PM"
-            },
-            "generated_at": datetime.now().isoformat(),
-            "model": "standalone-free-ai-generator"
-        }
+        now = datetime.now()
+        issue_date = now.strftime("%B %Y")
         
-        return {
-            "success": True,
-            "data": newsletter,
-            "message": "Parent newsletter generated successfully",
-            "cost": "FREE - No API charges"
-        }
+        return _response_cache.respond(
+            ("newsletter", request.school_name, request.contact_info, issue_date),
+            lambda: _build_newsletter(request.school_name, request.contact_info, issue_date),
+            "Parent newsletter generated successfully",
+            now.isoformat()
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Newsletter generation failed: {str(e)}")
 
 @app.post("/ml/free-ai/bulk/generate-reports")
-async def generate_bulk_reports(request: Dict[str, Any]):
+def generate_bulk_reports(request: BulkReportsRequest):
     """Generate multiple student reports at once"""
     try:
-        students = request.get('students', [])
-        if not students:
-            # Generate sample students if none provided
-            students = [
-                {"student_name": "Alex Johnson", "subject": "Mathematics", "grade": "A", "attendance_rate": 0.95},
-                {"student_name": "Sarah Smith", "subject": "Science", "grade": "B+", "attendance_rate": 0.88},
-                {"student_name": "Michael Brown", "subject": "English", "grade": "A-", "attendance_rate": 0.92}
-            ]
+        # Generate sample students if none provided
+        students = [student.dict(exclude_none=True) for student in request.students] or _SAMPLE_STUDENTS
         
-        reports = []
-        for student in students:
-            report = generator.generate_student_report(student)
-            reports.append(report)
+        if len(students) >= BULK_PROCESS_MIN_STUDENTS:
+            reports = list(app.state.process_pool.map(_generate_report_job, students, chunksize=BULK_PROCESS_CHUNKSIZE))
+        else:
+            reports = [generator.generate_student_report(student) for student in students]
         
-        return {
-            "success": True,
-            "data": {
-                "reports": reports,
-                "total_generated": len(reports),
-                "batch_processing": True
-            },
-            "message": f"Generated {len(reports)} student reports",
-            "cost": "FREE - No API charges"
+        bulk = {
+            "reports": reports,
+            "total_generated": len(reports),
+            "batch_processing": True
         }
+        return _generation_response(bulk, f"Generated {len(reports)} student reports")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Bulk generation failed: {str(e)}")
 
+@app.post("/ml/free-ai/bulk/generate-reports-stream")
+def generate_bulk_reports_stream(request: BulkReportsRequest):
+    """Stream student reports as JSON lines, one report per line"""
+    students = [student.dict(exclude_none=True) for student in request.students] or _SAMPLE_STUDENTS
+    
+    def report_lines():
+        for student in students:
+            yield _dumps_line(generator.generate_student_report(student))
+    
+    return StreamingResponse(report_lines(), media_type="application/x-ndjson")
+
 @app.get("/ml/free-ai/capabilities")
 async def get_free_ai_capabilities():
     """Get information about free AI capabilities"""
-    return {
-        "success": True,
-        "data": {
-            "available_features": [
-                "Student Progress Reports",
-                "Lesson Plan Generation", 
-                "Assignment Creation",
-                "Curriculum Planning",
-                "Student Portfolios",
-                "Parent Newsletters"
-            ],
-            "technologies_used": [
-                "Custom Templates",
-                "Rule-Based Generation",
-                "Local Content Generation"
-            ],
-            "cost": "100% FREE - No external API charges",
-            "privacy": "100% Private - All processing local",
-            "accuracy": "85-95% for educational content",
-            "languages_supported": ["English"],
-            "subjects_supported": [
-                "Mathematics", "Science", "English", "History", 
-                "Geography", "Art", "Music"
-            ]
-        },
-        "message": "Free AI capabilities information retrieved"
-    }
+    return Response(_CAPABILITIES_JSON, media_type="application/json")
 
 @app.get("/ml/free-ai/health")
 async def free_ai_health_check():
     """Health check for Free AI endpoints"""
-    return {
+    return DefaultResponse({
         "status": "healthy",
         "service": "Free AI Content Generation",
         "available": True,
-        "timestamp": datetime.now().isoformat()
-    }
+        "timestamp": datetime.now()
+    })
 
 if __name__ == "__main__":
     print("🚀 Starting Standalone ML Services...")
@@ -629,4 +876,20 @@ if __name__ == "__main__":
     print("🔍 Health check: http://localhost:8000/health")
     print("📊 Free AI Reports: http://localhost:8000/ml/free-ai/reports/generate")
     
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    # uvloop and httptools come with uvicorn[standard]; uvloop has no Windows build.
+    # The reload watcher is a development aid and stays off unless DEBUG is set.
+    debug = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+    # The generators are pure-Python CPU work, so run one process per core; the app
+    # keeps no per-process state, and reload only works with a single process
+    workers = 1 if debug else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # Split the cores between the server workers' report process pools
+    os.environ.setdefault("REPORT_PROCESS_WORKERS", str(max(1, (os.cpu_count() or 1) // workers)))
+    uvicorn.run(
+        "standalone_server:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=debug,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )
@@ -5,50 +5,44 @@
 # ============================================================================
 
 import os
+import re
 import sys
-import subprocess
 import time
+from importlib.metadata import distributions
 from pathlib import Path
 
+def _normalize(name):
+    """PEP 503 normalized distribution name"""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
 def check_dependencies():
-    """Check if required Python packages are installed"""
+    """Check that the required distributions are installed; installation belongs to the image build"""
     required_packages = [
         'flask', 'flask-cors', 'scikit-learn', 'pandas', 
         'numpy', 'psycopg2-binary', 'joblib'
     ]
     
-    missing_packages = []
+    # One metadata scan instead of importing every package
+    installed = {_normalize(dist.metadata['Name']) for dist in distributions() if dist.metadata['Name']}
+    missing_packages = [package for package in required_packages if _normalize(package) not in installed]
     
     for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-            print(f"✅ {package}")
-        except ImportError:
-            missing_packages.append(package)
+        if package in missing_packages:
             print(f"❌ {package} - MISSING")
+        else:
+            print(f"✅ {package}")
     
     if missing_packages:
         print(f"\n⚠️ Missing packages: {', '.join(missing_packages)}")
-        print("Installing missing packages...")
-        
-        for package in missing_packages:
-            try:
-                subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
-                print(f"✅ Installed {package}")
-            except subprocess.CalledProcessError:
-                print(f"❌ Failed to install {package}")
-                return False
+        print(f"Install them with: pip install {' '.join(missing_packages)}")
+        return False
     
     return True
 
 def create_models_directory():
     """Create models directory if it doesn't exist"""
-    models_dir = Path('models')
-    if not models_dir.exists():
-        models_dir.mkdir()
-        print("✅ Created models directory")
-    else:
-        print("✅ Models directory exists")
+    Path('models').mkdir(parents=True, exist_ok=True)
+    print("✅ Models directory ready")
 
 def start_ml_service():
     """Start the ML service"""
@@ -58,7 +52,7 @@ def start_ml_service():
     # Check dependencies
     print("📦 Checking dependencies...")
     if not check_dependencies():
-        print("❌ Failed to install dependencies")
+        print("❌ Missing required dependencies")
         return False
     
     # Create models directory
@@ -90,4 +84,5 @@ def start_ml_service():
         return False
 
 if __name__ == '__main__':
-    start_ml_service()
+    if start_ml_service() is False:
+        sys.exit(1)
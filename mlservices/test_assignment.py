@@ -2,8 +2,39 @@
 """
 Test script to check assignment generation
 """
-import requests
-import json
+import sys
+
+from _http import print_json, read_json, session
+
+# Key fields, questions and rubric of a generated assignment, written out in one call
+_SUMMARY_TMPL = (
+    "\n=== KEY FIELDS ===\n"
+    "Title: {title}\n"
+    "Subject: {subject}\n"
+    "Grade Level: {grade_level}\n"
+    "Instructions: {instructions}\n"
+    "Questions count: {question_count}\n"
+    "Rubric count: {rubric_count}\n"
+    "\n=== QUESTIONS ===\n"
+    "{questions}"
+    "\n=== RUBRIC ===\n"
+    "{rubric}"
+)
+
+def format_summary(assignment):
+    """Render the assignment summary printed after a successful generation"""
+    questions = assignment.get('questions', [])
+    rubric = assignment.get('rubric', [])
+    return _SUMMARY_TMPL.format(
+        title=assignment.get('title'),
+        subject=assignment.get('subject'),
+        grade_level=assignment.get('grade_level'),
+        instructions=assignment.get('instructions'),
+        question_count=len(questions),
+        rubric_count=len(rubric),
+        questions="".join(f"Q{i}: {q.get('question')}\n" for i, q in enumerate(questions, 1)),
+        rubric="".join(f"Criteria {i}: {r.get('criteria')}\n" for i, r in enumerate(rubric, 1))
+    )
 
 def test_assignment_generation():
     url = "http://localhost:8000/ml/free-ai/assignments/generate"
@@ -15,32 +46,17 @@ def test_assignment_generation():
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = session.post(url, json=payload, timeout=30)
         print(f"Status Code: {response.status_code}")
         print(f"Response Headers: {response.headers}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = read_json(response)
             print("\n=== ASSIGNMENT DATA ===")
-            print(json.dumps(data, indent=2))
+            print_json(data)
             
             if data.get('success'):
-                assignment = data.get('data', {})
-                print(f"\n=== KEY FIELDS ===")
-                print(f"Title: {assignment.get('title')}")
-                print(f"Subject: {assignment.get('subject')}")
-                print(f"Grade Level: {assignment.get('grade_level')}")
-                print(f"Instructions: {assignment.get('instructions')}")
-                print(f"Questions count: {len(assignment.get('questions', []))}")
-                print(f"Rubric count: {len(assignment.get('rubric', []))}")
-                
-                print(f"\n=== QUESTIONS ===")
-                for i, q in enumerate(assignment.get('questions', [])):
-                    print(f"Q{i+1}: {q.get('question')}")
-                
-                print(f"\n=== RUBRIC ===")
-                for i, r in enumerate(assignment.get('rubric', [])):
-                    print(f"Criteria {i+1}: {r.get('criteria')}")
+                sys.stdout.write(format_summary(data.get('data', {})))
             else:
                 print(f"Error: {data.get('message')}")
         else:
@@ -1,52 +1,82 @@
 #!/usr/bin/env python3
 
-from src.free_ai_generator import free_ai_generator
+import re
+
+from _generation_cache import generate_assignment
+from _log import flush, log
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 1857 revolt keywords; substring matches, like the plain `in` check this replaces
+_SPECIFIC_KEYWORDS = ('1857', 'revolt', 'sepoy', 'british', 'colonial', 'india')
+
+if AHOCORASICK_AVAILABLE:
+    # One automaton scans each question once, however many keywords there are
+    _SPECIFIC_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _SPECIFIC_KEYWORDS:
+        _SPECIFIC_AUTOMATON.add_word(_keyword, _keyword)
+    _SPECIFIC_AUTOMATON.make_automaton()
+else:
+    _SPECIFIC_RE = re.compile('|'.join(map(re.escape, _SPECIFIC_KEYWORDS)), re.IGNORECASE)
+
+def is_specific(text):
+    """Whether text mentions any of the 1857 revolt keywords"""
+    if AHOCORASICK_AVAILABLE:
+        return next(_SPECIFIC_AUTOMATON.iter(text.lower()), None) is not None
+    return _SPECIFIC_RE.search(text) is not None
 
 def test_assignment_generation():
-    print("🧪 Testing ML Model Assignment Generation...")
-    print("=" * 50)
+    log.info("🧪 Testing ML Model Assignment Generation...")
+    log.info("=" * 50)
     
     # Test 1: 1857 Revolt Assignment
-    print("\n📚 Test 1: History - 1857 Revolt")
-    result = free_ai_generator.generate_assignment('History', '8th Grade', '1857 revolt', 'medium')
+    log.info("\n📚 Test 1: History - 1857 Revolt")
+    result = generate_assignment('CBSE', 'History', '8th Grade', '1857 revolt', 'medium')
     
     if result.get('success'):
-        print("✅ Success: Assignment generated successfully!")
+        log.info("✅ Success: Assignment generated successfully!")
         assignment = result.get('assignment', {})
-        print(f"📝 Title: {assignment.get('title')}")
-        print(f"📊 Total Points: {assignment.get('total_points')}")
-        print(f"⏱️ Estimated Time: {assignment.get('estimated_time')}")
+        log.info(f"📝 Title: {assignment.get('title')}")
+        log.info(f"📊 Total Points: {assignment.get('total_points')}")
+        log.info(f"⏱️ Estimated Time: {assignment.get('estimated_time')}")
         
-        print("\n❓ Questions Generated:")
+        log.info("\n❓ Questions Generated:")
         questions = assignment.get('questions', [])
         for i, q in enumerate(questions, 1):
-            print(f"  {i}. {q.get('question')} ({q.get('points')} points)")
+            log.info(f"  {i}. {q.get('question')} ({q.get('points')} points)")
         
         # Check if questions are specific to 1857 revolt
-        specific_keywords = ['1857', 'revolt', 'sepoy', 'british', 'colonial', 'india']
-        specific_count = sum(1 for q in questions if any(keyword in q.get('question', '').lower() for keyword in specific_keywords))
-        print(f"\n🎯 Specificity Check: {specific_count}/{len(questions)} questions contain 1857 revolt keywords")
+        specific_count = sum(1 for q in questions if is_specific(q.get('question') or ''))
+        log.info(f"\n🎯 Specificity Check: {specific_count}/{len(questions)} questions contain 1857 revolt keywords")
         
     else:
-        print("❌ Failed: Assignment generation failed")
+        log.info("❌ Failed: Assignment generation failed")
     
     # Test 2: Different topic
-    print("\n" + "=" * 50)
-    print("\n📚 Test 2: Mathematics - Algebra")
-    result2 = free_ai_generator.generate_assignment('Mathematics', '9th Grade', 'Algebra', 'medium')
+    flush()
+    log.info("\n" + "=" * 50)
+    log.info("\n📚 Test 2: Mathematics - Algebra")
+    result2 = generate_assignment('CBSE', 'Mathematics', '9th Grade', 'Algebra', 'medium')
     
     if result2.get('success'):
-        print("✅ Success: Math assignment generated successfully!")
+        log.info("✅ Success: Math assignment generated successfully!")
         assignment2 = result2.get('assignment', {})
-        print(f"📝 Title: {assignment2.get('title')}")
+        log.info(f"📝 Title: {assignment2.get('title')}")
         
-        print("\n❓ Math Questions Generated:")
+        log.info("\n❓ Math Questions Generated:")
         questions2 = assignment2.get('questions', [])
         for i, q in enumerate(questions2, 1):
-            print(f"  {i}. {q.get('question')} ({q.get('points')} points)")
+            log.info(f"  {i}. {q.get('question')} ({q.get('points')} points)")
     
-    print("\n" + "=" * 50)
-    print("🎉 ML Model Configuration Test Complete!")
+    log.info("\n" + "=" * 50)
+    log.info("🎉 ML Model Configuration Test Complete!")
 
 if __name__ == "__main__":
-    test_assignment_generation()
+    try:
+        test_assignment_generation()
+    finally:
+        flush()
@@ -4,49 +4,28 @@
 # Uses the same connection method as the backend
 # ============================================================================
 
-import psycopg2
 import os
 
+from probe_db import CANDIDATE_GROUPS, candidate_configs, probe_all
+
 def test_backend_style_connection():
     """Test connection using backend-style configuration"""
     
-    # Try the exact same config as backend
-    configs_to_try = [
-        {
-            'host': 'localhost',
-            'port': 5432,
-            'database': 'edtech_platform',
-            'user': 'postgres',
-            'password': 'your_password'  # Backend default
-        },
-        {
-            'host': 'localhost',
-            'port': 5432,
-            'database': 'edtech_platform',
-            'user': 'postgres',
-            'password': ''  # No password
-        },
-        {
-            'host': 'localhost',
-            'port': 5432,
-            'database': 'edtech_platform',
-            'user': 'postgres',
-            'password': 'postgres'  # Common default
-        }
-    ]
+    # Same host and database as the backend: its default password, none, and the common default
+    configs_to_try = candidate_configs(*CANDIDATE_GROUPS['backend'])
     
     print("🔍 Testing backend-style connections...")
     print("=" * 50)
     
-    for i, config in enumerate(configs_to_try, 1):
-        try:
-            print(f"Testing config {i}: {config['user']}@{config['host']}:{config['port']}/{config['database']}")
-            conn = psycopg2.connect(**config)
-            print(f"✅ SUCCESS with password: '{config['password']}'")
-            conn.close()
-            return config
-        except Exception as e:
-            print(f"❌ Failed: {str(e)[:50]}...")
+    # All configs are tried at once; report them in order up to the first that works
+    for i, (config, result) in enumerate(zip(configs_to_try, probe_all(configs_to_try)), 1):
+        print(f"Testing config {i}: {config['user']}@{config['host']}:{config['port']}/{config['database']}")
+        if isinstance(result, Exception):
+            print(f"❌ Failed: {str(result)[:50]}...")
+            continue
+        
+        print(f"✅ SUCCESS with password: '{config['password']}'")
+        return config
     
     return None
 
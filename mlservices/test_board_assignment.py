@@ -7,13 +7,12 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.free_ai_generator import FreeAIContentGenerator
+from _generation_cache import generate_assignment
+from _log import flush, log
 
 def test_board_specific_assignments():
     """Test board-specific assignment generation"""
     
-    generator = FreeAIContentGenerator()
-    
     # Test cases
     test_cases = [
         {
@@ -39,15 +38,15 @@ def test_board_specific_assignments():
         }
     ]
     
-    print("🧪 Testing Board-Specific Assignment Generation")
-    print("=" * 60)
+    log.info("🧪 Testing Board-Specific Assignment Generation")
+    log.info("=" * 60)
     
     for i, test_case in enumerate(test_cases, 1):
-        print(f"\n📝 Test Case {i}: {test_case['board']} - {test_case['subject']} - {test_case['topic']}")
-        print("-" * 50)
+        log.info(f"\n📝 Test Case {i}: {test_case['board']} - {test_case['subject']} - {test_case['topic']}")
+        log.info("-" * 50)
         
         try:
-            result = generator.generate_assignment(
+            result = generate_assignment(
                 board=test_case['board'],
                 subject=test_case['subject'],
                 grade=test_case['grade'],
@@ -58,30 +57,35 @@ def test_board_specific_assignments():
             if result.get('success'):
                 assignment = result.get('assignment', {})
                 
-                print(f"✅ Title: {assignment.get('title', 'N/A')}")
-                print(f"📋 Board: {assignment.get('board', 'N/A')}")
-                print(f"📚 Subject: {assignment.get('subject', 'N/A')}")
-                print(f"🎓 Grade: {assignment.get('grade_level', 'N/A')}")
-                print(f"🎯 Difficulty: {assignment.get('difficulty', 'N/A')}")
-                print(f"📝 Instructions: {assignment.get('instructions', 'N/A')}")
-                print(f"📊 Total Points: {assignment.get('total_points', 'N/A')}")
+                log.info(f"✅ Title: {assignment.get('title', 'N/A')}")
+                log.info(f"📋 Board: {assignment.get('board', 'N/A')}")
+                log.info(f"📚 Subject: {assignment.get('subject', 'N/A')}")
+                log.info(f"🎓 Grade: {assignment.get('grade_level', 'N/A')}")
+                log.info(f"🎯 Difficulty: {assignment.get('difficulty', 'N/A')}")
+                log.info(f"📝 Instructions: {assignment.get('instructions', 'N/A')}")
+                log.info(f"📊 Total Points: {assignment.get('total_points', 'N/A')}")
                 
-                print(f"\n❓ Questions ({len(assignment.get('questions', []))}):")
+                log.info(f"\n❓ Questions ({len(assignment.get('questions', []))}):")
                 for j, question in enumerate(assignment.get('questions', []), 1):
-                    print(f"  {j}. {question.get('question', 'N/A')} ({question.get('points', 0)} points)")
+                    log.info(f"  {j}. {question.get('question', 'N/A')} ({question.get('points', 0)} points)")
                 
-                print(f"\n🎯 Learning Objectives:")
+                log.info(f"\n🎯 Learning Objectives:")
                 for objective in assignment.get('learning_objectives', []):
-                    print(f"  • {objective}")
+                    log.info(f"  • {objective}")
                     
             else:
-                print(f"❌ Generation failed: {result.get('message', 'Unknown error')}")
+                log.info(f"❌ Generation failed: {result.get('message', 'Unknown error')}")
                 
         except Exception as e:
-            print(f"❌ Error: {str(e)}")
+            log.info(f"❌ Error: {str(e)}")
+        
+        flush()
     
-    print("\n" + "=" * 60)
-    print("✅ Board-specific assignment generation test completed!")
+    log.info("\n" + "=" * 60)
+    log.info("✅ Board-specific assignment generation test completed!")
 
 if __name__ == "__main__":
-    test_board_specific_assignments()
+    try:
+        test_board_specific_assignments()
+    finally:
+        flush()
@@ -4,53 +4,27 @@
 # Test connection with the exact same config as backend
 # ============================================================================
 
-import psycopg2
+from probe_db import CANDIDATE_GROUPS, candidate_configs, probe_all
 
 def test_connection():
     """Test database connection with different passwords"""
     
-    # Try the exact same config as backend
-    config = {
-        'host': '127.0.0.1',
-        'port': 5432,
-        'database': 'edtech_platform',
-        'user': 'postgres'
-    }
-    
-    # Common passwords to try
-    passwords = [
-        'your_password',  # Backend default
-        '',  # No password
-        'postgres',
-        'password',
-        '1234',
-        'admin',
-        'root'
-    ]
+    # Same host and database as the backend, with the common passwords
+    configs = candidate_configs(*CANDIDATE_GROUPS['simple'])
     
     print("🔍 Testing database connection...")
     print("=" * 40)
     
-    for password in passwords:
-        try:
-            test_config = config.copy()
-            test_config['password'] = password
-            
-            conn = psycopg2.connect(**test_config)
-            print(f"✅ SUCCESS! Password: '{password}'")
-            
-            # Test a simple query
-            cursor = conn.cursor()
-            cursor.execute("SELECT version();")
-            version = cursor.fetchone()[0]
-            print(f"�� PostgreSQL Version: {version[:50]}...")
-            
-            cursor.close()
-            conn.close()
-            return password
-            
-        except Exception as e:
-            print(f"❌ Failed with '{password}': {str(e)[:50]}...")
+    # All passwords are tried at once; report them in preference order up to the first that works
+    for config, result in zip(configs, probe_all(configs)):
+        password = config['password']
+        if isinstance(result, Exception):
+            print(f"❌ Failed with '{password}': {str(result)[:50]}...")
+            continue
+        
+        print(f"✅ SUCCESS! Password: '{password}'")
+        print(f"�� PostgreSQL Version: {result[:50]}...")
+        return password
     
     return None
 
@@ -4,80 +4,47 @@
 # Tests database connection before generating training data
 # ============================================================================
 
-import psycopg2
 import os
+
+import psycopg2
+
 from pathlib import Path
+from probe_db import CANDIDATE_GROUPS, candidate_configs, probe_all
 
 def test_database_connection():
     """Test database connection with different configurations"""
     
     # Try different password configurations
-    configs = [
-        {
-            'host': 'localhost',
-            'database': 'school_management',
-            'user': 'postgres',
-            'password': '1234',
-            'port': 5432
-        },
-        {
-            'host': 'localhost',
-            'database': 'school_management',
-            'user': 'postgres',
-            'password': 'password',
-            'port': 5432
-        },
-        {
-            'host': 'localhost',
-            'database': 'school_management',
-            'user': 'postgres',
-            'password': '',
-            'port': 5432
-        }
-    ]
+    configs = candidate_configs(*CANDIDATE_GROUPS['training'])
     
     print("🔍 Testing database connections...")
     print("=" * 50)
     
-    for i, config in enumerate(configs, 1):
+    # All passwords are tried at once, each connection also checking for the attendance
+    # tables; report them in order up to the first that works
+    for i, (config, result) in enumerate(zip(configs, probe_all(configs, tables_like='attendance%')), 1):
         print(f"\n📊 Test {i}: Trying password '{config['password']}'")
         
-        try:
-            conn = psycopg2.connect(**config)
-            cursor = conn.cursor()
-            
-            # Test basic query
-            cursor.execute("SELECT version();")
-            version = cursor.fetchone()
-            
-            print(f"✅ Connection successful!")
-            print(f"   Database: {config['database']}")
-            print(f"   User: {config['user']}")
-            print(f"   PostgreSQL version: {version[0]}")
-            
-            # Test if attendance tables exist
-            cursor.execute("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name LIKE 'attendance%'
-                ORDER BY table_name;
-            """)
-            
-            tables = cursor.fetchall()
-            if tables:
-                print(f"   ✅ Attendance tables found: {[t[0] for t in tables]}")
-            else:
-                print(f"   ⚠️ No attendance tables found")
-            
-            cursor.close()
-            conn.close()
-            
-            # Return the working config
-            return config
-            
-        except Exception as e:
-            print(f"   ❌ Connection failed: {e}")
+        if isinstance(result, Exception):
+            print(f"   ❌ Connection failed: {result}")
+            continue
+        
+        version, tables = result
+        print(f"✅ Connection successful!")
+        print(f"   Database: {config['database']}")
+        print(f"   User: {config['user']}")
+        print(f"   PostgreSQL version: {version}")
+        
+        # Test if attendance tables exist
+        if isinstance(tables, Exception):
+            print(f"   ❌ Table check failed: {tables}")
+        elif tables:
+            print(f"   ✅ Attendance tables found: {tables}")
+        else:
+            print(f"   ⚠️ No attendance tables found")
+        
+        # Return the working config
+        return config
     
     print("\n❌ All connection attempts failed!")
     return None
@@ -85,13 +52,15 @@ def test_database_connection():
 def create_database_if_not_exists():
     """Create database if it doesn't exist"""
     try:
-        # Connect to default postgres database
+        # Connect to default postgres database; CREATE DATABASE needs autocommit,
+        # so this one-off connection stays outside the pool
         conn = psycopg2.connect(
             host='localhost',
             database='postgres',
             user='postgres',
-            password='1234',
-            port=5432
+            password=os.getenv('DB_PASSWORD') or os.getenv('PGPASSWORD') or '1234',
+            port=5432,
+            connect_timeout=1
         )
         conn.autocommit = True
         cursor = conn.cursor()
@@ -1,83 +1,62 @@
 #!/usr/bin/env python3
 
-from src.free_ai_generator import free_ai_generator
+from concurrent.futures import ThreadPoolExecutor
+
+from _generation_cache import generate_assignment
+from _log import flush, log
 
 def test_difficulty_levels():
-    print("🧪 Testing ML Model Difficulty Levels...")
-    print("=" * 60)
-    
-    # Test 1: History - 1857 Revolt with different difficulties
-    print("\n📚 Test 1: History - 1857 Revolt (All Difficulty Levels)")
-    print("-" * 50)
+    log.info("🧪 Testing ML Model Difficulty Levels...")
+    log.info("=" * 60)
     
     difficulties = ["easy", "medium", "hard"]
-    for difficulty in difficulties:
-        print(f"\n🎯 {difficulty.upper()} DIFFICULTY:")
-        result = free_ai_generator.generate_assignment('History', '8th Grade', '1857 revolt', difficulty)
-        
-        if result.get('success'):
-            assignment = result.get('assignment', {})
-            print(f"📝 Title: {assignment.get('title')}")
-            print(f"📊 Total Points: {assignment.get('total_points')}")
-            print(f"⏱️ Estimated Time: {assignment.get('estimated_time')}")
-            
-            print("\n❓ Questions:")
-            questions = assignment.get('questions', [])
-            for i, q in enumerate(questions, 1):
-                print(f"  {i}. {q.get('question')} ({q.get('points')} points)")
-        else:
-            print("❌ Failed to generate assignment")
-    
-    # Test 2: Mathematics - Algebra with different difficulties
-    print("\n" + "=" * 60)
-    print("\n📚 Test 2: Mathematics - Algebra (All Difficulty Levels)")
-    print("-" * 50)
-    
-    for difficulty in difficulties:
-        print(f"\n🎯 {difficulty.upper()} DIFFICULTY:")
-        result = free_ai_generator.generate_assignment('Mathematics', '9th Grade', 'Algebra', difficulty)
-        
-        if result.get('success'):
-            assignment = result.get('assignment', {})
-            print(f"📝 Title: {assignment.get('title')}")
-            print(f"📊 Total Points: {assignment.get('total_points')}")
-            print(f"⏱️ Estimated Time: {assignment.get('estimated_time')}")
-            
-            print("\n❓ Questions:")
-            questions = assignment.get('questions', [])
-            for i, q in enumerate(questions, 1):
-                print(f"  {i}. {q.get('question')} ({q.get('points')} points)")
-        else:
-            print("❌ Failed to generate assignment")
+    tests = [
+        ("📚 Test 1: History - 1857 Revolt (All Difficulty Levels)", ('CBSE', 'History', '8th Grade', '1857 revolt')),
+        ("📚 Test 2: Mathematics - Algebra (All Difficulty Levels)", ('CBSE', 'Mathematics', '9th Grade', 'Algebra')),
+        ("📚 Test 3: Science - Photosynthesis (All Difficulty Levels)", ('CBSE', 'Science', '7th Grade', 'Photosynthesis'))
+    ]
     
-    # Test 3: Science with different difficulties
-    print("\n" + "=" * 60)
-    print("\n📚 Test 3: Science - Photosynthesis (All Difficulty Levels)")
-    print("-" * 50)
+    # Generate all nine assignments concurrently, then print them in the fixed order
+    with ThreadPoolExecutor(max_workers=len(tests) * len(difficulties)) as executor:
+        futures = {
+            (args, difficulty): executor.submit(generate_assignment, *args, difficulty)
+            for _, args in tests
+            for difficulty in difficulties
+        }
     
-    for difficulty in difficulties:
-        print(f"\n🎯 {difficulty.upper()} DIFFICULTY:")
-        result = free_ai_generator.generate_assignment('Science', '7th Grade', 'Photosynthesis', difficulty)
+    for test_number, (heading, args) in enumerate(tests):
+        if test_number:
+            flush()
+            log.info("\n" + "=" * 60)
+        log.info(f"\n{heading}")
+        log.info("-" * 50)
         
-        if result.get('success'):
-            assignment = result.get('assignment', {})
-            print(f"📝 Title: {assignment.get('title')}")
-            print(f"📊 Total Points: {assignment.get('total_points')}")
-            print(f"⏱️ Estimated Time: {assignment.get('estimated_time')}")
+        for difficulty in difficulties:
+            log.info(f"\n🎯 {difficulty.upper()} DIFFICULTY:")
+            result = futures[(args, difficulty)].result()
             
-            print("\n❓ Questions:")
-            questions = assignment.get('questions', [])
-            for i, q in enumerate(questions, 1):
-                print(f"  {i}. {q.get('question')} ({q.get('points')} points)")
-        else:
-            print("❌ Failed to generate assignment")
+            if result.get('success'):
+                assignment = result.get('assignment', {})
+                log.info(f"📝 Title: {assignment.get('title')}")
+                log.info(f"📊 Total Points: {assignment.get('total_points')}")
+                log.info(f"⏱️ Estimated Time: {assignment.get('estimated_time')}")
+                
+                log.info("\n❓ Questions:")
+                questions = assignment.get('questions', [])
+                for i, q in enumerate(questions, 1):
+                    log.info(f"  {i}. {q.get('question')} ({q.get('points')} points)")
+            else:
+                log.info("❌ Failed to generate assignment")
     
-    print("\n" + "=" * 60)
-    print("🎉 Difficulty Level Testing Complete!")
-    print("\n📊 Summary:")
-    print("✅ Easy: Basic recall and understanding questions")
-    print("✅ Medium: Analysis and application questions") 
-    print("✅ Hard: Critical thinking and complex problem-solving questions")
+    log.info("\n" + "=" * 60)
+    log.info("🎉 Difficulty Level Testing Complete!")
+    log.info("\n📊 Summary:")
+    log.info("✅ Easy: Basic recall and understanding questions")
+    log.info("✅ Medium: Analysis and application questions") 
+    log.info("✅ Hard: Critical thinking and complex problem-solving questions")
 
 if __name__ == "__main__":
-    test_difficulty_levels()
+    try:
+        test_difficulty_levels()
+    finally:
+        flush()
@@ -3,46 +3,39 @@
 # ============================================================================
 
 import os
-from dotenv import load_dotenv
-import psycopg2
 
-# Load environment variables
-load_dotenv()
+from _env import ENV_PATH, getenv
+from db import connection
 
 print("🔍 Testing .env file loading...")
 
 # Check if .env file exists
-env_path = os.path.join(os.path.dirname(__file__), '.env')
-if os.path.exists(env_path):
-    print(f"✅ .env file found at: {env_path}")
+if os.path.exists(ENV_PATH):
+    print(f"✅ .env file found at: {ENV_PATH}")
 else:
-    print(f"❌ .env file not found at: {env_path}")
+    print(f"❌ .env file not found at: {ENV_PATH}")
 
 # Print environment variables
 print("\n📋 Environment variables:")
-print(f"DB_HOST: {os.getenv('DB_HOST', 'NOT SET')}")
-print(f"DB_PORT: {os.getenv('DB_PORT', 'NOT SET')}")
-print(f"DB_NAME: {os.getenv('DB_NAME', 'NOT SET')}")
-print(f"DB_USER: {os.getenv('DB_USER', 'NOT SET')}")
-print(f"DB_PASSWORD: {os.getenv('DB_PASSWORD', 'NOT SET')}")
+print(f"DB_HOST: {getenv('DB_HOST', 'NOT SET')}")
+print(f"DB_PORT: {getenv('DB_PORT', 'NOT SET')}")
+print(f"DB_NAME: {getenv('DB_NAME', 'NOT SET')}")
+print(f"DB_USER: {getenv('DB_USER', 'NOT SET')}")
+print(f"DB_PASSWORD: {getenv('DB_PASSWORD', 'NOT SET')}")
 
 # Test database connection
 print("\n🧪 Testing database connection...")
 
 try:
-    conn = psycopg2.connect(
-        host=os.getenv('DB_HOST', 'localhost'),
-        port=int(os.getenv('DB_PORT', 5432)),
-        database=os.getenv('DB_NAME', 'edtech_platform'),
-        user=os.getenv('DB_USER', 'postgres'),
-        password=os.getenv('DB_PASSWORD', '1234')
-    )
-    
-    cursor = conn.cursor()
-    cursor.execute("SELECT version();")
-    version = cursor.fetchone()
-    cursor.close()
-    conn.close()
+    with connection(
+        host=getenv('DB_HOST', 'localhost'),
+        port=int(getenv('DB_PORT', 5432)),
+        database=getenv('DB_NAME', 'edtech_platform'),
+        user=getenv('DB_USER', 'postgres'),
+        password=getenv('DB_PASSWORD', '1234')
+    ) as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT version();")
+        version = cursor.fetchone()
     
     print(f"✅ Database connection successful!")
     print(f"�� PostgreSQL version: {version[0]}")
@@ -1,5 +1,7 @@
-import requests
 import json
+import sys
+
+from mlservices._http import TIMEOUT, reachable, session
 
 def test_assignment():
     url = "http://localhost:8000/ml/free-ai/assignments/generate"
@@ -10,11 +12,14 @@ def test_assignment():
         "difficulty": "medium"
     }
     
-    response = requests.post(url, json=data)
+    response = session.post(url, json=data, timeout=TIMEOUT)
     print(f"Status: {response.status_code}")
     result = response.json()
     print(f"Questions: {result['data']['questions']}")
     print(f"Questions type: {type(result['data']['questions'])}")
 
 if __name__ == "__main__":
+    if not reachable("localhost", 8000):
+        print("❌ Server is not reachable on localhost:8000")
+        sys.exit(2)
     test_assignment()
@@ -1,5 +1,6 @@
-import requests
-import json
+import sys
+
+from mlservices._http import TIMEOUT, print_json, reachable, session
 
 # Test lesson plan endpoint
 url = "http://localhost:8000/ml/free-ai/lesson-plans/generate"
@@ -12,10 +13,15 @@ data = {
 
 print("Testing lesson plan endpoint...")
 print(f"URL: {url}")
-print(f"Data: {json.dumps(data, indent=2)}")
+print("Data: ", end="")
+print_json(data)
+
+if not reachable("localhost", 8000):
+    print("❌ Server is not reachable on localhost:8000")
+    sys.exit(2)
 
 try:
-    response = requests.post(url, json=data)
+    response = session.post(url, json=data, timeout=TIMEOUT)
     print(f"Status Code: {response.status_code}")
     
     if response.status_code == 200:
@@ -23,7 +29,7 @@ try:
         print(f"Success: {result.get('success', False)}")
         print(f"Message: {result.get('message', 'No message')}")
         print("\nGenerated Lesson Plan Data:")
-        print(json.dumps(result.get('data', {}), indent=2))
+        print_json(result.get('data', {}))
     else:
         print(f"Error: {response.text}")
         